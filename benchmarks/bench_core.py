@@ -0,0 +1,205 @@
+"""
+Core benchmarks: persistence, checkpoint history, dashboard scanning and
+search, bulk schema migration and calculation throughput. Runs without a display.
+
+Run:  python -m benchmarks.bench_core [--quick] [--compare previous.json]
+"""
+
+import os
+import argparse
+import tempfile
+
+from benchmarks.common import (
+    measure, human_size, synthetic_project, write_projects,
+    add_common_arguments, finish,
+)
+from core.persistence import PersistenceService, scan_projects
+from core.calculation import run_calculation
+from core.traffic import projected_traffic, growth_projection
+from core import boq_emissions
+from core import scheduler
+from core import reference_data as ref
+from core.migrate import migrate_tree
+from core.search import SearchIndex
+
+PROJECT_SIZES = [10 * 1024, 1024 ** 2, 10 * 1024 ** 2, 50 * 1024 ** 2]
+PROJECT_COUNTS = [10, 100, 1000, 10000]
+CHECKPOINT_COUNT = 200
+
+
+def bench_persistence(results, size, repeat):
+    data = synthetic_project(size)
+    label = human_size(size)
+    ps = PersistenceService(f"bench_{label}")
+    os.makedirs(ps.base_path, exist_ok=True)
+
+    results[f"persistence.save[{label}]"] = measure(lambda: ps.save(data), repeat)
+    results[f"persistence.is_file_healthy[{label}]"] = measure(
+        lambda: ps.is_file_healthy(ps.json_path), repeat
+    )
+    results[f"persistence.create_checkpoint[{label}]"] = measure(
+        lambda: ps.create_checkpoint(data, "Bench"), repeat
+    )
+
+    # Restore as done by ProjectWindow.recover: list, load newest, save back
+    def restore():
+        newest = ps.list_checkpoints()[0][1]
+        ps.save(ps.load_checkpoint(newest))
+
+    results[f"persistence.restore_checkpoint[{label}]"] = measure(restore, repeat)
+
+
+def bench_checkpoint_listing(results, repeat):
+    ps = PersistenceService("bench_history")
+    os.makedirs(ps.checkpoint_dir, exist_ok=True)
+    for i in range(CHECKPOINT_COUNT):
+        with open(os.path.join(ps.checkpoint_dir, f"Auto__2024{i:010d}.json"), "w") as f:
+            f.write("{}")
+    results[f"persistence.list_checkpoints[{CHECKPOINT_COUNT}]"] = measure(
+        ps.list_checkpoints, repeat
+    )
+
+
+def bench_dashboard_scan(results, count, repeat):
+    projects_dir = os.path.join(os.getcwd(), f"scan_{count}")
+    write_projects(projects_dir, count)
+    results[f"dashboard.scan_projects[{count}]"] = measure(
+        lambda: scan_projects(projects_dir), repeat
+    )
+
+
+def bench_search(results, count, repeat):
+    projects_dir = os.path.join(os.getcwd(), f"scan_{count}")  # from bench_dashboard_scan
+    p_ids = [p_id for p_id in sorted(os.listdir(projects_dir)) if not p_id.startswith(".")]
+    index = SearchIndex(projects_dir)
+    results[f"search.build[{count}]"] = measure(lambda: index.sync(p_ids), 1)
+    index.save()
+    results[f"search.load[{count}]"] = measure(lambda: SearchIndex(projects_dir).load(), repeat)
+    results[f"search.sync_unchanged[{count}]"] = measure(lambda: index.sync(p_ids), repeat)
+    results[f"search.query[{count}]"] = measure(
+        lambda: index.search("name:project material:rcc type:beam"), repeat
+    )
+
+
+def bench_migrate(results, count, repeat):
+    # write_projects writes unversioned (v0) projects
+    projects_dir = os.path.join(os.getcwd(), f"migrate_{count}")
+    write_projects(projects_dir, count)
+    results[f"migrate.dry_run[{count}]"] = measure(
+        lambda: migrate_tree(projects_dir, dry_run=True), repeat
+    )
+    results[f"migrate.migrate_tree[{count}]"] = measure(lambda: migrate_tree(projects_dir), 1)
+    results[f"migrate.up_to_date[{count}]"] = measure(
+        lambda: migrate_tree(projects_dir, dry_run=True), repeat
+    )
+
+
+def bench_calculation(results, repeat, runs=200):
+    data = synthetic_project(10 * 1024)
+    timings = measure(lambda: [run_calculation(data) for _ in range(runs)], repeat)
+    timings["runs_per_second"] = round(runs / timings["median"], 1)
+    results[f"calculation.run_calculation[x{runs}]"] = timings
+
+
+def bench_traffic(results, repeat, years=100):
+    data = {"traffic_data": {
+        "traffic_fields": {
+            "traffic_growth_model": "Logistic",
+            "alternate_road_carriageway": "Two Lane Roads",
+        },
+        "daily_traffic": {"two_wheeler": 2000, "small_cars": 3000, "hcv": 1000},
+    }}
+
+    def uncached():
+        growth_projection.cache_clear()
+        projected_traffic(data, years)
+
+    results[f"traffic.projected_traffic[{years}y]"] = measure(uncached, repeat)
+    results[f"traffic.projected_traffic[{years}y, cached]"] = measure(
+        lambda: projected_traffic(data, years), repeat
+    )
+
+
+def bench_boq_emissions(results, repeat, items=200_000):
+    materials = list(ref.BOQ_MATERIALS)
+    tabs = list(ref.STRUCTURE_TABS)
+    boq = [
+        {
+            "id": i,
+            "unit": "cum" if i % 3 else "t",
+            "quantity": float(i % 97 + 1),
+            "tab": tabs[i % len(tabs)],
+            "material": materials[i % len(materials)],
+            "haul_distance": None if i % 2 else 40.0,
+        }
+        for i in range(items)
+    ]
+
+    def uncached():
+        boq_emissions._cache.clear()
+        boq_emissions.boq_emissions(boq)
+
+    results[f"boq_emissions[{items} items]"] = measure(uncached, repeat)
+    results[f"boq_emissions[{items} items, cached]"] = measure(
+        lambda: boq_emissions.boq_emissions(boq), repeat
+    )
+
+
+def bench_scheduler(results, repeat, items=200_000, scenarios=7):
+    data = synthetic_project(items * 175)  # ~175 bytes per BOQ item
+    jobs = [data] + [
+        dict(data, financial_data={**data["financial_data"], "discount_rate": str(5 + i)})
+        for i in range(scenarios)
+    ]
+
+    def serial():
+        boq_emissions._cache.clear()
+        [run_calculation(inputs) for inputs in jobs]
+
+    def parallel():
+        boq_emissions._cache.clear()
+        scheduler.run_jobs(jobs)
+
+    scheduler.run_jobs(jobs)  # start the pool outside the timings
+    label = f"{len(jobs)} jobs, {items} BOQ items"
+    results[f"scheduler.serial[{label}]"] = measure(serial, repeat)
+    results[f"scheduler.run_jobs[{label}]"] = measure(parallel, repeat)
+    scheduler.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_common_arguments(parser, "bench_core.json")
+    args = parser.parse_args()
+    args.output = os.path.abspath(args.output)
+    if args.compare:
+        args.compare = os.path.abspath(args.compare)
+
+    sizes = PROJECT_SIZES[:2] if args.quick else PROJECT_SIZES
+    counts = PROJECT_COUNTS[:2] if args.quick else PROJECT_COUNTS
+
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="lcca_bench_") as tmp:
+        # PersistenceService resolves projects/ relative to the working directory
+        os.chdir(tmp)
+        try:
+            for size in sizes:
+                bench_persistence(results, size, args.repeat)
+            bench_checkpoint_listing(results, args.repeat)
+            for count in counts:
+                bench_dashboard_scan(results, count, args.repeat)
+                bench_search(results, count, args.repeat)
+                bench_migrate(results, count, args.repeat)
+            bench_calculation(results, args.repeat)
+            bench_traffic(results, args.repeat)
+            bench_boq_emissions(results, args.repeat)
+            bench_scheduler(results, args.repeat)
+        finally:
+            os.chdir(cwd)
+
+    finish(args, "core", results)
+
+
+if __name__ == "__main__":
+    main()
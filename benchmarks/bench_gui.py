@@ -0,0 +1,170 @@
+"""
+GUI benchmarks: window spawn, project load, sidebar navigation and form
+round trips. Runs headless under QT_QPA_PLATFORM=offscreen (set by default).
+
+Each benchmark also records how much the process RSS grew while it ran (KB,
+current RSS after minus before, so earlier benchmarks do not add up) and the
+number of live widgets once it has run.
+
+Run:  python -m benchmarks.bench_gui [--quick] [--compare previous.json]
+"""
+
+import os
+import json
+import argparse
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QTreeWidgetItemIterator
+
+from benchmarks.common import (
+    measure, human_size, synthetic_project, add_common_arguments, finish,
+)
+from core.memory import rss_bytes
+
+PROJECT_SIZES = [10 * 1024, 1024 ** 2, 10 * 1024 ** 2]
+
+# Field values for form round trips: (label, text length of free-text fields)
+FORM_SIZES = [("realistic", 40), ("stress", 200 * 1024)]
+
+
+def rss_kb():
+    rss = rss_bytes()
+    return rss // 1024 if rss is not None else None
+
+
+def record(results, name, timings, before):
+    """Stores ``timings`` with the RSS growth since ``before`` (rss_kb() at the start)."""
+    QApplication.processEvents()
+    after = rss_kb()
+    if before is not None and after is not None:
+        timings["rss_delta_kb"] = after - before
+    timings["widgets"] = len(QApplication.allWidgets())
+    results[name] = timings
+
+
+def bench_spawn(results, manager, repeat):
+    before = rss_kb()
+    costs = []
+
+    def spawn_and_close():
+        w = manager.spawn()
+        QApplication.processEvents()
+        costs.append(w.spawn_cost or 0)
+        w.close()
+
+    timings = measure(spawn_and_close, repeat)
+    # Process growth per window, as reported in Logs > Memory
+    timings["rss_per_window_kb"] = sorted(costs)[len(costs) // 2] // 1024
+    record(results, "manager.spawn", timings, before)
+
+
+def bench_load_project(results, manager, size, repeat):
+    label = human_size(size)
+    p_id = f"bench_{label}"
+    p_dir = os.path.join(os.getcwd(), "projects", p_id)
+    os.makedirs(p_dir, exist_ok=True)
+    with open(os.path.join(p_dir, "project.json"), "w") as f:
+        json.dump(synthetic_project(size), f, indent=4)
+
+    w = manager.spawn()
+    before = rss_kb()
+    record(results, f"window.load_project[{label}]", measure(
+        lambda: (w.load_project(p_id), w.wait_for_open(), QApplication.processEvents()),
+        repeat,
+    ), before)
+    w.close()
+
+
+def bench_navigation(results, manager, repeat):
+    w = manager.spawn()
+    before = rss_kb()
+    items = []
+    it = QTreeWidgetItemIterator(w.sidebar)
+    while it.value():
+        items.append(it.value())
+        it += 1
+
+    def visit_all():
+        for item in items:
+            w._on_sidebar_item(item)
+            QApplication.processEvents()
+
+    timings = measure(visit_all, repeat)
+    timings["pages"] = len(items)
+    record(results, "window.sidebar_navigation[all]", timings, before)
+    w.close()
+
+
+def bench_forms(results, manager, repeat):
+    from gui.components.traffic_data.main import VEHICLE_TYPES, ACCIDENT_TYPES
+    from gui.components.global_info.main import GENERAL_INFO_DEFAULTS
+
+    w = manager.spawn()
+    traffic = w.page("Traffic Data")
+    general = w.page("General Information")
+
+    for label, text_len in FORM_SIZES:
+        text = ("x" * text_len)
+        traffic_data = {
+            "traffic_fields": {
+                "additional_reroute_distance": "12.5",
+                "additional_travel_time": "18",
+                "crash_rate": text,
+            },
+            "daily_traffic": {k: 1000 + i for i, (k, _) in enumerate(VEHICLE_TYPES)},
+            "vehicle_distribution": {k: 12.5 for k, _ in VEHICLE_TYPES},
+            "accident_distribution": {k: 33.3 for k, _ in ACCIDENT_TYPES},
+        }
+        general_data = {key: text for key in GENERAL_INFO_DEFAULTS}
+        general_data["country"] = "India"
+
+        before = rss_kb()
+        record(results, f"traffic_data.round_trip[{label}]", measure(
+            lambda: (traffic.set_data(traffic_data), traffic.get_data()), repeat
+        ), before)
+        before = rss_kb()
+        record(results, f"general_info.round_trip[{label}]", measure(
+            lambda: (general.set_data(general_data), general.get_data()), repeat
+        ), before)
+    w.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_common_arguments(parser, "bench_gui.json")
+    args = parser.parse_args()
+    args.output = os.path.abspath(args.output)
+    if args.compare:
+        args.compare = os.path.abspath(args.compare)
+
+    sizes = PROJECT_SIZES[:2] if args.quick else PROJECT_SIZES
+
+    app = QApplication.instance() or QApplication([])
+    app.setStyle("Fusion")
+    from gui.main import Manager
+
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="lcca_bench_gui_") as tmp:
+        # ProjectWindow and PersistenceService resolve projects/ relative to the cwd
+        os.chdir(tmp)
+        try:
+            manager = Manager()
+            # Keep one window open so closing the others never quits the app
+            anchor = manager.spawn()
+            bench_spawn(results, manager, args.repeat)
+            for size in sizes:
+                bench_load_project(results, manager, size, args.repeat)
+            bench_navigation(results, manager, args.repeat)
+            bench_forms(results, manager, args.repeat)
+            anchor.close()
+        finally:
+            os.chdir(cwd)
+
+    finish(args, "gui", results)
+
+
+if __name__ == "__main__":
+    main()
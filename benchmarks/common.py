@@ -0,0 +1,153 @@
+"""
+Shared helpers for the benchmark suites: timing, synthetic projects,
+JSON result files and regression checks against a previous run.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import datetime
+import platform
+import statistics
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def measure(fn, repeat=5, setup=None):
+    """
+    Calls ``fn`` ``repeat`` times (after ``setup`` if given) and returns
+    {"min", "median", "max"} wall times in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times), "max": max(times)}
+
+
+def human_size(n_bytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n_bytes < 1024 or unit == "GB":
+            return f"{n_bytes:.0f}{unit}"
+        n_bytes /= 1024
+
+
+# ---------------------------------------------------------------------------
+# Synthetic projects
+# ---------------------------------------------------------------------------
+
+def synthetic_project(target_bytes, seed=0):
+    """
+    Builds a project dict whose JSON dump (indent=4) is roughly ``target_bytes``.
+    Size is made up of BOQ-like line items, the part of a project that grows.
+    """
+    rng = random.Random(seed)
+    data = {
+        "metadata": {
+            "project_name": f"Synthetic {human_size(target_bytes)}",
+            "created_at": str(datetime.datetime(2024, 1, 1)),
+        },
+        "bridge_data": {
+            "bridge_type": "Beam",
+            "primary_material": "RCC",
+            "bridge_length": "120",
+            "deck_width": "12",
+        },
+        "financial_data": {"duration_of_construction": "2", "analysis_period": "50"},
+        "boq": [],
+    }
+    item_bytes = 175  # approximate size of one item below once indented
+    for i in range(max(target_bytes // item_bytes, 1)):
+        data["boq"].append({
+            "id": i,
+            "description": f"Item {i}",
+            "unit": "cum",
+            "quantity": round(rng.uniform(1, 500), 3),
+            "rate": round(rng.uniform(100, 9000), 2),
+        })
+    return data
+
+
+def write_projects(projects_dir, count, size_bytes=2048):
+    """Writes ``count`` small project folders, as created by Manager.request_new."""
+    os.makedirs(projects_dir, exist_ok=True)
+    payload = synthetic_project(size_bytes)
+    for i in range(count):
+        p_dir = os.path.join(projects_dir, f"p{i:06d}")
+        os.makedirs(p_dir, exist_ok=True)
+        payload["metadata"]["project_name"] = f"Project {i}"
+        with open(os.path.join(p_dir, "project.json"), "w") as f:
+            json.dump(payload, f, indent=4)
+
+
+# ---------------------------------------------------------------------------
+# Result files and regression checks
+# ---------------------------------------------------------------------------
+
+def write_results(path, suite, results):
+    """Stores a run as JSON: environment info plus {benchmark_name: timings}."""
+    doc = {
+        "suite": suite,
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(doc, f, indent=4)
+
+
+def compare_results(baseline_path, results, threshold, key="median"):
+    """
+    Compares ``results`` against a previous JSON run.
+    Returns a list of (name, old, new, ratio) for benchmarks slower than ``threshold``x.
+    """
+    with open(baseline_path, "r") as f:
+        baseline = json.load(f)["results"]
+    regressions = []
+    for name, timings in results.items():
+        old = baseline.get(name, {}).get(key)
+        new = timings.get(key)
+        if not old or new is None:
+            continue
+        ratio = new / old
+        if ratio > threshold:
+            regressions.append((name, old, new, ratio))
+    return regressions
+
+
+def add_common_arguments(parser, default_output):
+    parser.add_argument("--output", default=default_output, help="JSON file for this run")
+    parser.add_argument("--compare", help="Previous JSON run to check for regressions")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25,
+        help="Fail when a benchmark is this many times slower than --compare (default 1.25)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per benchmark")
+    parser.add_argument("--quick", action="store_true", help="Only run the small sizes")
+
+
+def finish(args, suite, results):
+    """Prints a summary, writes the JSON run and exits non-zero on regressions."""
+    for name, timings in results.items():
+        extra = "".join(
+            f"  {k}={v}" for k, v in timings.items() if k not in ("min", "median", "max")
+        )
+        print(f"{name:<55} median {timings['median'] * 1000:10.2f} ms{extra}")
+    write_results(args.output, suite, results)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare_results(args.compare, results, args.threshold)
+        for name, old, new, ratio in regressions:
+            print(f"REGRESSION {name}: {old * 1000:.2f} ms -> {new * 1000:.2f} ms ({ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare} (threshold {args.threshold}x)")
@@ -0,0 +1,194 @@
+"""
+Transport and machinery emissions of the bill of quantities.
+
+The project's "boq" section is a list of line items:
+    {"id", "description", "unit", "quantity", "rate",
+     "tab":             structure tab (ref.STRUCTURE_TABS),
+     "material":        ref.BOQ_MATERIALS,
+     "haul_distance":   km from source to site      (default per material)
+     "transport_mode":  key of ref.TRANSPORT_FACTORS (default "Road")
+     "equipment":       key of ref.EQUIPMENT_FUEL_RATES, and
+     "equipment_hours": hours on site               (default per material)}
+
+The list is converted once into columns (the raw values of every item, then
+categorical codes and float arrays) and every per-item factor is gathered
+from small lookup tables, so
+    transport = mass x haul distance x mode factor
+    machinery = equipment hours x fuel rate x diesel CO2
+are computed for all items at once and aggregated by tab and by material
+with bincount. ProjectModel only ever replaces the BOQ list (never edits it
+in place), so the columns and factors are cached per list object; scenarios
+share the base project's list and reuse them.
+"""
+
+import threading
+from itertools import repeat
+
+import numpy as np
+
+from core import reference_data as ref
+
+_MATERIALS = {m: i for i, m in enumerate(ref.BOQ_MATERIALS)}
+_TABS = {t: i for i, t in enumerate(ref.STRUCTURE_TABS)}
+_MODES = {m: i for i, m in enumerate(ref.TRANSPORT_FACTORS)}
+_EQUIPMENT = {e: i for i, e in enumerate(ref.EQUIPMENT_FUEL_RATES)}
+_OTHER_MATERIAL = _MATERIALS["Other"]
+_OTHER_TAB = _TABS["Miscellaneous"]
+
+# Per-code lookup tables
+_DENSITY = np.array([ref.MATERIAL_DENSITY[m] for m in ref.BOQ_MATERIALS])
+_HAUL = np.array([ref.DEFAULT_HAUL_DISTANCE[m] for m in ref.BOQ_MATERIALS])
+_DEFAULT_EQUIPMENT = np.array([_EQUIPMENT[ref.DEFAULT_EQUIPMENT[m][0]] for m in ref.BOQ_MATERIALS])
+_HOURS_PER_UNIT = np.array([ref.DEFAULT_EQUIPMENT[m][1] for m in ref.BOQ_MATERIALS])
+_MODE_FACTORS = np.array(list(ref.TRANSPORT_FACTORS.values()))
+_FUEL_RATES = np.array(list(ref.EQUIPMENT_FUEL_RATES.values()))
+
+# Cached per BOQ list: id -> (list, factors); a few entries cover base + scenarios
+_CACHE_SIZE = 8
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _column(items, key):
+    """Values of ``key`` for every item (None where missing)."""
+    return list(map(dict.get, items, repeat(key)))
+
+
+def _floats(values):
+    """Float column; blank or malformed entries become NaN."""
+    try:
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        out = np.empty(len(values))
+        for i, v in enumerate(values):
+            try:
+                out[i] = float(v)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def _lookup(values, fn):
+    """
+    ``fn(value)`` for every entry of ``values``, evaluated once per distinct
+    value (columns hold a handful of distinct strings).
+    """
+    try:
+        table = {v: fn(v) for v in set(values)}
+    except TypeError:  # unhashable entries in a malformed item
+        values = [v if isinstance(v, (str, int, float)) else None for v in values]
+        table = {v: fn(v) for v in set(values)}
+    return np.array(list(map(table.__getitem__, values)))
+
+
+def _codes(values, index, default):
+    return _lookup(values, lambda v: index.get(v, default)).astype(np.intp)
+
+
+# Item keys read by boq_factors
+COLUMN_KEYS = (
+    "tab", "material", "unit", "quantity", "haul_distance",
+    "equipment_hours", "transport_mode", "equipment",
+)
+
+
+def raw_columns(boq):
+    """{key: values of every item} for COLUMN_KEYS, non-dict entries counting as empty items."""
+    try:
+        return {key: _column(boq, key) for key in COLUMN_KEYS}
+    except TypeError:
+        items = [item if isinstance(item, dict) else {} for item in boq]
+        return {key: _column(items, key) for key in COLUMN_KEYS}
+
+
+def convert_columns(columns):
+    """
+    Factor arrays of boq_factors from ``columns`` (raw_columns of a BOQ, or
+    of any slice of it: items convert independently).
+    """
+    material = _codes(columns["material"], _MATERIALS, _OTHER_MATERIAL)
+    if not len(columns["material"]):
+        material = np.zeros(0, dtype=np.intp)
+
+    def unit_factor(unit):
+        unit = str(unit or "").strip().lower()
+        return -1.0 if unit in ref.VOLUME_UNITS else ref.UNIT_MASS.get(unit, 0.0)
+
+    unit_mass = _lookup(columns["unit"], unit_factor).astype(float)  # -1: volume
+    quantity = np.nan_to_num(_floats(columns["quantity"]))
+    haul = _floats(columns["haul_distance"])
+    hours = _floats(columns["equipment_hours"])
+    mode = _codes(columns["transport_mode"], _MODES, _MODES[ref.DEFAULT_TRANSPORT_MODE])
+    equipment = _codes(columns["equipment"], _EQUIPMENT, -1)
+    equipment = np.where(equipment < 0, _DEFAULT_EQUIPMENT[material], equipment)
+
+    return {
+        "tab": _codes(columns["tab"], _TABS, _OTHER_TAB),
+        "material": material,
+        "quantity": quantity,
+        "mass": quantity * np.where(unit_mass < 0, _DENSITY[material], unit_mass),
+        "haul": np.where(np.isnan(haul), _HAUL[material], haul),
+        "mode_factor": _MODE_FACTORS[mode],
+        "hours": np.where(np.isnan(hours), quantity * _HOURS_PER_UNIT[material], hours),
+        "fuel_rate": _FUEL_RATES[equipment],
+    }
+
+
+def boq_factors(boq, convert=convert_columns):
+    """
+    Per-item columns of ``boq``: {"tab", "material"} codes and the float
+    arrays "quantity", "mass" (t), "haul" (km), "mode_factor" (kg/t-km),
+    "hours" and "fuel_rate" (l/h). Cached per list object.
+
+    ``convert`` turns the raw_columns into those arrays; core.scheduler
+    passes one that converts slices of a large BOQ across its workers.
+    """
+    key = id(boq)
+    with _cache_lock:
+        hit = _cache.get(key)
+    if hit is not None and hit[0] is boq:
+        return hit[1]
+
+    factors = convert(raw_columns(boq))
+    with _cache_lock:
+        if len(_cache) >= _CACHE_SIZE:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = (boq, factors)
+    return factors
+
+
+def _aggregate(factors, kg):
+    """Tonnes in total, per structure tab and per material."""
+    tonnes = kg / 1000.0
+    by_tab = np.bincount(factors["tab"], weights=tonnes, minlength=len(ref.STRUCTURE_TABS))
+    by_material = np.bincount(
+        factors["material"], weights=tonnes, minlength=len(ref.BOQ_MATERIALS)
+    )
+    return {
+        "total": float(tonnes.sum()),
+        "by_tab": dict(zip(ref.STRUCTURE_TABS, by_tab.tolist())),
+        "by_material": dict(zip(ref.BOQ_MATERIALS, by_material.tolist())),
+    }
+
+
+def factor_emissions(factors):
+    """
+    {"transport": ..., "machinery": ...}, each {"total", "by_tab", "by_material"}
+    in tCO2e, from the columns of boq_factors.
+    """
+    f = factors
+    transport = f["mass"] * f["haul"] * f["mode_factor"]
+    machinery = f["hours"] * f["fuel_rate"] * ref.FUEL_CO2["diesel"]
+    return {"transport": _aggregate(f, transport), "machinery": _aggregate(f, machinery)}
+
+
+def boq_emissions(boq):
+    """factor_emissions of every item of ``boq`` at once."""
+    return factor_emissions(boq_factors(boq))
+
+
+def material_masses(factors):
+    """Tonnes of each material (ref.BOQ_MATERIALS order): array (materials,)."""
+    return np.bincount(
+        factors["material"], weights=factors["mass"], minlength=len(ref.BOQ_MATERIALS)
+    )
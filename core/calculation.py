@@ -0,0 +1,313 @@
+"""
+LCCA calculation engine.
+
+Each component is a plain function ``fn(inputs, ctx) -> dict`` registered in
+COMPONENTS. ``inputs`` is the project dict (sections keyed by name, as stored
+by ProjectModel); ``ctx`` holds values shared by all components (timeline,
+discount factors, design life, construction cost, projected traffic, closure
+days). Every component result carries:
+  - "total":  a scalar (present value for costs, tonnes for emissions)
+  - "unit":   display unit of "total"
+  - "yearly": numpy array of undiscounted values per analysis year
+"""
+
+import numpy as np
+
+from core import reference_data as ref
+from core.tracing import tracer
+from core.traffic import projected_traffic
+from core.work_zone import closure_schedule, work_zone_inputs, work_zone_costs
+from core.diversion_emissions import diversion_inputs, diversion_emissions
+from core.boq_emissions import boq_factors, convert_columns, factor_emissions
+from core.end_of_life import event_year, material_inventory, end_of_life_inputs, end_of_life
+
+
+# ---------------------------------------------------------------------------
+# Input helpers
+# ---------------------------------------------------------------------------
+
+def get_input(inputs, section, key):
+    """Returns a raw input value, falling back to the engine defaults."""
+    value = inputs.get(section, {}).get(key, "")
+    if value in ("", None):
+        value = ref.DEFAULT_INPUTS.get(section, {}).get(key, "")
+    return value
+
+
+def get_number(inputs, section, key, default=0.0):
+    """Returns an input as float. Blank or malformed values give ``default``."""
+    try:
+        return float(get_input(inputs, section, key))
+    except (TypeError, ValueError):
+        return default
+
+
+def discount_factors(rate_pct, years):
+    """Discount factor for each year index 0..years-1 at ``rate_pct`` percent."""
+    return (1.0 + rate_pct / 100.0) ** -np.arange(years, dtype=float)
+
+
+def build_context(inputs):
+    """Computes the values shared by all components."""
+    years = max(int(get_number(inputs, "financial_data", "analysis_period", 50)), 1)
+    construction_years = int(get_number(inputs, "financial_data", "duration_of_construction", 1))
+    construction_years = min(max(construction_years, 1), years)
+
+    length = get_number(inputs, "bridge_data", "bridge_length")
+    width = get_number(inputs, "bridge_data", "deck_width")
+    bridge_type = get_input(inputs, "bridge_data", "bridge_type")
+    material = get_input(inputs, "bridge_data", "primary_material")
+
+    rate = ref.CONSTRUCTION_RATES.get(bridge_type, ref.CONSTRUCTION_RATES["Other"])
+    factor = ref.MATERIAL_COST_FACTORS.get(material, 1.0)
+
+    discount_rate = get_number(inputs, "financial_data", "discount_rate", 6.7)
+
+    return {
+        "years": years,
+        "construction_years": construction_years,
+        "discount_rate": discount_rate,
+        "discount": discount_factors(discount_rate, years),
+        "design_life": get_number(inputs, "financial_data", "design_life", 50),
+        "deck_area": length * width,
+        "material": material,
+        "construction_cost": length * width * rate * factor,
+        # Daily traffic per vehicle class and year, shared by traffic components
+        "traffic": projected_traffic(inputs, years),
+        # Days per year the bridge is closed and traffic diverted
+        "closure_days": closure_schedule(years, construction_years),
+    }
+
+
+def boq_columns(inputs, ctx, convert=convert_columns):
+    """
+    Per-item BOQ columns (core.boq_emissions.boq_factors, with its
+    ``convert``), built once per run.
+    """
+    if "boq_factors" not in ctx:
+        ctx["boq_factors"] = boq_factors(inputs.get("boq") or [], convert)
+    return ctx["boq_factors"]
+
+
+# ---------------------------------------------------------------------------
+# Components
+# ---------------------------------------------------------------------------
+
+def construction_cost(inputs, ctx):
+    """Initial construction cost, spread evenly over the construction period."""
+    yearly = np.zeros(ctx["years"])
+    yearly[: ctx["construction_years"]] = ctx["construction_cost"] / ctx["construction_years"]
+    return {"total": float(yearly @ ctx["discount"]), "unit": "INR", "yearly": yearly}
+
+
+def maintenance_cost(inputs, ctx):
+    """Routine maintenance from the end of construction to the end of the analysis period."""
+    annual = ctx["construction_cost"] * ref.MAINTENANCE_RATES.get(ctx["material"], 0.007)
+    yearly = np.zeros(ctx["years"])
+    yearly[ctx["construction_years"]:] = annual
+    return {"total": float(yearly @ ctx["discount"]), "unit": "INR", "yearly": yearly}
+
+
+def road_user_cost(inputs, ctx):
+    """Delay and diversion costs of traffic diverted during closures."""
+    delay, diversion = work_zone_costs(
+        ctx["traffic"], ctx["closure_days"], **work_zone_inputs(inputs)
+    )
+    yearly = delay + diversion
+    return {
+        "total": float(yearly @ ctx["discount"]), "unit": "INR", "yearly": yearly,
+        "delay": delay, "diversion": diversion,
+    }
+
+
+def _end_of_life(inputs, ctx):
+    """Demolition and material recovery at the end of the design life, shared by both components."""
+    if "end_of_life" not in ctx:
+        mass = material_inventory(boq_columns(inputs, ctx), ctx["deck_area"], ctx["material"])
+        ctx["end_of_life"] = end_of_life(
+            mass, deck_area=ctx["deck_area"],
+            event=event_year(ctx["design_life"], ctx["years"]), discount=ctx["discount"],
+            **end_of_life_inputs(inputs),
+        )
+    return ctx["end_of_life"]
+
+
+def end_of_life_cost(inputs, ctx):
+    """Demolition, recycling and landfill costs less the salvage value of recovered material."""
+    eol = _end_of_life(inputs, ctx)
+    return {
+        "total": float(eol["present_value"]), "unit": "INR", "yearly": eol["cost"],
+        "salvage": eol["salvage"],
+    }
+
+
+def material_emissions(inputs, ctx):
+    """Embodied carbon of the superstructure, emitted during construction."""
+    tonnes = ctx["deck_area"] * ref.EMBODIED_CARBON.get(ctx["material"], 1200.0) / 1000.0
+    yearly = np.zeros(ctx["years"])
+    yearly[: ctx["construction_years"]] = tonnes / ctx["construction_years"]
+    return {"total": float(yearly.sum()), "unit": "tCO2e", "yearly": yearly}
+
+
+def _construction_emissions(inputs, ctx, kind):
+    """BOQ emissions of ``kind``, emitted evenly over the construction period."""
+    if "boq_emissions" not in ctx:
+        ctx["boq_emissions"] = factor_emissions(boq_columns(inputs, ctx))
+    result = ctx["boq_emissions"][kind]
+    yearly = np.zeros(ctx["years"])
+    yearly[: ctx["construction_years"]] = result["total"] / ctx["construction_years"]
+    return {
+        "total": result["total"], "unit": "tCO2e", "yearly": yearly,
+        "by_tab": result["by_tab"], "by_material": result["by_material"],
+    }
+
+
+def transport_emissions(inputs, ctx):
+    """Haulage of BOQ materials to site: mass x distance x transport mode factor."""
+    return _construction_emissions(inputs, ctx, "transport")
+
+
+def machinery_emissions(inputs, ctx):
+    """Construction equipment fuel burnt for BOQ items: hours x fuel rate x diesel CO2."""
+    return _construction_emissions(inputs, ctx, "machinery")
+
+
+def traffic_emissions(inputs, ctx):
+    """Extra tailpipe emissions of traffic diverted during closures."""
+    yearly = diversion_emissions(ctx["traffic"], ctx["closure_days"], **diversion_inputs(inputs))
+    return {"total": float(yearly.sum()), "unit": "tCO2e", "yearly": yearly}
+
+
+def end_of_life_emissions(inputs, ctx):
+    """Demolition and landfill emissions less the credits of recovered material."""
+    eol = _end_of_life(inputs, ctx)
+    return {
+        "total": float(eol["emissions"].sum()), "unit": "tCO2e", "yearly": eol["emissions"],
+        "credits": eol["credits"],
+    }
+
+
+def social_cost_of_carbon(inputs, ctx):
+    """Monetised carbon emissions of all emission components."""
+    country = get_input(inputs, "general_info", "country")
+    scc = ref.SOCIAL_COST_OF_CARBON.get(country, ref.DEFAULT_SOCIAL_COST_OF_CARBON)
+    emissions = np.zeros(ctx["years"])
+    for name in EMISSION_COMPONENTS:
+        emissions = emissions + ctx["results"][name]["yearly"]
+    yearly = emissions * scc
+    return {"total": float(yearly @ ctx["discount"]), "unit": "INR", "yearly": yearly}
+
+
+# Evaluation order matters: social_cost_of_carbon reads the emission results.
+COMPONENTS = [
+    ("construction_cost", construction_cost),
+    ("maintenance_cost", maintenance_cost),
+    ("road_user_cost", road_user_cost),
+    ("end_of_life_cost", end_of_life_cost),
+    ("material_emissions", material_emissions),
+    ("transport_emissions", transport_emissions),
+    ("machinery_emissions", machinery_emissions),
+    ("traffic_emissions", traffic_emissions),
+    ("end_of_life_emissions", end_of_life_emissions),
+    ("social_cost_of_carbon", social_cost_of_carbon),
+]
+
+# Components whose "total" is a tonnage rather than a cost
+EMISSION_COMPONENTS = [
+    "material_emissions", "transport_emissions", "machinery_emissions", "traffic_emissions",
+    "end_of_life_emissions",
+]
+
+# Display labels for component results (and the total cost)
+COMPONENT_LABELS = {
+    "construction_cost":     "Construction Cost (INR)",
+    "maintenance_cost":      "Maintenance Cost (INR)",
+    "road_user_cost":        "Road User Cost (INR)",
+    "end_of_life_cost":      "End-of-Life Cost (INR)",
+    "material_emissions":    "Material Emissions (tCO2e)",
+    "transport_emissions":   "Transportation Emissions (tCO2e)",
+    "machinery_emissions":   "Machinery Emissions (tCO2e)",
+    "traffic_emissions":     "Traffic Diversion Emissions (tCO2e)",
+    "end_of_life_emissions": "End-of-Life Emissions (tCO2e)",
+    "social_cost_of_carbon": "Social Cost of Carbon (INR)",
+    "total_cost":            "Total Life Cycle Cost (INR)",
+}
+
+# Input sections each component reads, directly or through the shared context
+COMPONENT_INPUTS = {
+    "construction_cost":     {"bridge_data", "financial_data"},
+    "maintenance_cost":      {"bridge_data", "financial_data"},
+    "road_user_cost":        {"traffic_data", "financial_data"},
+    "end_of_life_cost":      {"boq", "bridge_data", "financial_data", "recycling", "demolition"},
+    "material_emissions":    {"bridge_data", "financial_data"},
+    "transport_emissions":   {"boq", "financial_data"},
+    "machinery_emissions":   {"boq", "financial_data"},
+    "traffic_emissions":     {"traffic_data", "financial_data"},
+    "end_of_life_emissions": {"boq", "bridge_data", "financial_data", "recycling", "demolition"},
+    "social_cost_of_carbon": {"general_info", "financial_data"},
+}
+
+# Components that read the results of other components
+COMPONENT_DEPENDENCIES = {
+    "social_cost_of_carbon": EMISSION_COMPONENTS,
+}
+
+# Components sharing context intermediates (BOQ emissions, end-of-life flows)
+# form one branch of a parallel run (core.scheduler); the others are branches
+# of their own
+COMPONENT_BRANCHES = {
+    "transport_emissions":   "boq_emissions",
+    "machinery_emissions":   "boq_emissions",
+    "end_of_life_cost":      "end_of_life",
+    "end_of_life_emissions": "end_of_life",
+}
+
+
+def stale_components(changed_sections):
+    """Names of the components affected by a change to ``changed_sections``."""
+    stale = set()
+    for name, _ in COMPONENTS:
+        if COMPONENT_INPUTS.get(name, set()) & changed_sections or any(
+            dep in stale for dep in COMPONENT_DEPENDENCIES.get(name, [])
+        ):
+            stale.add(name)
+    return stale
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def run_calculation(inputs, previous=None, changed_sections=None, on_result=None):
+    """
+    Runs every registered component against ``inputs``.
+    Returns {component_name: result_dict} in COMPONENTS order.
+
+    With ``previous`` results and the set of ``changed_sections``, only the
+    components affected by those sections are recomputed; the rest are reused.
+    ``on_result(name, result)`` is called as each component finishes; an
+    exception it raises aborts the run.
+    """
+    with tracer.span("calc.context"):
+        ctx = build_context(inputs)
+    results = {}
+    ctx["results"] = results
+    stale = None
+    if previous is not None and changed_sections is not None:
+        stale = stale_components(changed_sections)
+    for name, fn in COMPONENTS:
+        if stale is not None and name not in stale and name in previous:
+            results[name] = previous[name]
+            continue
+        with tracer.span(f"calc.{name}"):
+            results[name] = fn(inputs, ctx)
+        if on_result is not None:
+            on_result(name, results[name])
+    return results
+
+
+def total_cost(results):
+    """Sum of the present values of all cost components."""
+    return sum(
+        r["total"] for name, r in results.items() if name not in EMISSION_COMPONENTS
+    )
@@ -0,0 +1,145 @@
+"""
+Series for the Outputs charts.
+
+evaluate_charts(project) does the expensive part once per input change (all
+scenarios plus the Monte Carlo band; core.pipeline streams the same two
+stages), stored_charts(stored) rebuilds the same series from results saved in
+core.results_store; downsample_charts(raw, width) reduces every series to the
+chart's pixel width. All run off the GUI thread.
+
+Downsampling keeps the minimum and maximum of each pixel column, so peaks
+(e.g. a construction year) never disappear from a plot.
+"""
+
+import numpy as np
+
+from core.calculation import build_context, EMISSION_COMPONENTS
+from core.scenarios import evaluate_yearly
+from core.uncertainty import percentile_bands
+
+# (chart key, title, unit)
+CHARTS = [
+    ("cash_flow",   "Yearly Cash Flow",                    "INR"),
+    ("cumulative",  "Cumulative Life Cycle Cost",          "INR"),
+    ("emissions",   "Yearly Emissions",                    "tCO2e"),
+    ("uncertainty", "Cumulative LCC Uncertainty (5–95%)", "INR"),
+]
+# Charts with one series per scenario (the uncertainty chart has a band instead)
+SERIES_CHARTS = ("cash_flow", "cumulative", "emissions")
+
+
+def _buckets(y, buckets):
+    """``y`` padded with its last value and reshaped to (buckets, k)."""
+    k = -(-len(y) // buckets)
+    padded = np.concatenate([y, np.full(buckets * k - len(y), y[-1])])
+    return padded.reshape(buckets, k), k
+
+
+def minmax_downsample(x, y, buckets):
+    """
+    Reduces (x, y) to at most 2 * ``buckets`` points, keeping the minimum and
+    maximum of each bucket in x order. Short series are returned unchanged.
+    """
+    n = len(y)
+    if buckets <= 0 or n <= 2 * buckets:
+        return x, y
+    grid, k = _buckets(y, buckets)
+    offsets = np.arange(buckets) * k
+    idx = np.concatenate([offsets + grid.argmin(axis=1), offsets + grid.argmax(axis=1)])
+    idx = np.unique(np.minimum(idx, n - 1))  # sorted, duplicates dropped
+    return x[idx], y[idx]
+
+
+def envelope_downsample(x, lo, hi, buckets):
+    """Band outline per bucket: (bucket x, min of ``lo``, max of ``hi``)."""
+    if buckets <= 0 or len(x) <= 2 * buckets:
+        return x, lo, hi
+    lo_grid, _ = _buckets(lo, buckets)
+    hi_grid, _ = _buckets(hi, buckets)
+    x_grid, _ = _buckets(x, buckets)
+    return x_grid.mean(axis=1), lo_grid.min(axis=1), hi_grid.max(axis=1)
+
+
+def scenario_charts(evaluated):
+    """
+    Full-resolution series of the evaluated scenarios (see
+    core.scenarios.evaluate_yearly), the uncertainty chart still empty:
+    {chart key: {"series": [(label, x, y)], "band": None | (x, lo, hi)}}.
+    """
+    raw = {key: {"series": [], "band": None} for key, _, _ in CHARTS}
+    for name, results, discount in evaluated:
+        x = np.arange(1, len(discount) + 1, dtype=float)
+        cost = np.zeros(len(x))
+        emissions = np.zeros(len(x))
+        for component, r in results.items():
+            if component in EMISSION_COMPONENTS:
+                emissions += r["yearly"]
+            else:
+                cost += r["yearly"]
+        raw["cash_flow"]["series"].append((name, x, cost))
+        raw["cumulative"]["series"].append((name, x, np.cumsum(cost * discount)))
+        raw["emissions"]["series"].append((name, x, emissions))
+    return raw
+
+
+def _uncertainty(name, lo, mid, hi):
+    x = np.arange(1, len(mid) + 1, dtype=float)
+    return {"series": [(f"{name} (median)", x, mid)], "band": (x, lo, hi)}
+
+
+def uncertainty_chart(evaluated, discount_rate, draws=None, progress=None):
+    """Monte Carlo band and median of the base scenario (first of ``evaluated``)."""
+    name, results, _ = evaluated[0]
+    kwargs = {"draws": draws} if draws else {}
+    lo, mid, hi = percentile_bands(results, discount_rate, progress=progress, **kwargs)
+    return _uncertainty(name, lo, mid, hi)
+
+
+def evaluate_outputs(project, draws=None):
+    """(evaluated scenarios as in core.scenarios.evaluate_yearly, full-resolution charts)."""
+    evaluated = evaluate_yearly(project)
+    raw = scenario_charts(evaluated)
+    rate = build_context(project)["discount_rate"]
+    raw["uncertainty"] = uncertainty_chart(evaluated, rate, draws)
+    return evaluated, raw
+
+
+def evaluate_charts(project, draws=None):
+    """Full-resolution series of every chart (see scenario_charts)."""
+    return evaluate_outputs(project, draws)[1]
+
+
+def stored_charts(stored):
+    """
+    Charts of a result set of core.results_store, built from the mapped
+    chart rows and band only (no per-component arrays are read).
+    """
+    raw = {}
+    for chart in SERIES_CHARTS:
+        series = []
+        for s, (name, years) in enumerate(zip(stored.scenarios, stored.years)):
+            x = np.arange(1, years + 1, dtype=float)
+            series.append((name, x, stored.chart_series(chart, s)))
+        raw[chart] = {"series": series, "band": None}
+    lo, mid, hi = stored.band[:, :stored.years[0]]
+    raw["uncertainty"] = _uncertainty(stored.scenarios[0], lo, mid, hi)
+    return raw
+
+
+def chart_band(raw):
+    """(lo, mid, hi) of the uncertainty chart of ``raw``, as stored by core.results_store."""
+    (_, _, mid), = raw["uncertainty"]["series"]
+    _, lo, hi = raw["uncertainty"]["band"]
+    return lo, mid, hi
+
+
+def downsample_charts(raw, width):
+    """Reduces every series and band of ``raw`` to ``width`` pixel columns."""
+    charts = {}
+    for key, chart in raw.items():
+        series = [(label, *minmax_downsample(x, y, width)) for label, x, y in chart["series"]]
+        band = chart["band"]
+        if band is not None:
+            band = envelope_downsample(*band, width)
+        charts[key] = {"series": series, "band": band}
+    return charts
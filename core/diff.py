@@ -0,0 +1,106 @@
+"""
+Field-level structural diff between two project states (checkpoints or the
+live model).
+
+Top-level sections are compared first by digest when both sides have one
+(an O(1) skip for unchanged sections), then by identity and C-level equality;
+only sections that really differ are walked recursively.
+"""
+
+import json
+import hashlib
+
+from core.calculation import run_calculation, total_cost
+
+# Sections that never hold user inputs
+IGNORED_SECTIONS = {"metadata"}
+
+
+def section_digest(value):
+    """Stable digest of a section's content."""
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def project_digests(data):
+    """{section: digest} for every top-level section of a project dict."""
+    return {section: section_digest(value) for section, value in data.items()}
+
+
+class Change:
+    """One differing leaf: ``kind`` is "changed", "added" or "removed"."""
+
+    __slots__ = ("section", "path", "old", "new", "kind")
+
+    def __init__(self, section, path, old, new, kind):
+        self.section = section
+        self.path = path
+        self.old = old
+        self.new = new
+        self.kind = kind
+
+    def label(self):
+        return " › ".join([self.section] + [str(p) for p in self.path])
+
+
+_ABSENT = object()
+
+
+def _walk(section, path, old, new, out):
+    if old is new or old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            _walk(section, path + (key,), old.get(key, _ABSENT), new.get(key, _ABSENT), out)
+    elif isinstance(old, list) and isinstance(new, list):
+        for i in range(max(len(old), len(new))):
+            _walk(
+                section, path + (i,),
+                old[i] if i < len(old) else _ABSENT,
+                new[i] if i < len(new) else _ABSENT,
+                out,
+            )
+    elif old is _ABSENT:
+        out.append(Change(section, path, None, new, "added"))
+    elif new is _ABSENT:
+        out.append(Change(section, path, old, None, "removed"))
+    else:
+        out.append(Change(section, path, old, new, "changed"))
+
+
+def diff_projects(old, new, old_digests=None, new_digests=None, include_metadata=False):
+    """
+    Returns (changes, changed_sections) between two project dicts.
+    Digest dicts, when given, let unchanged sections be skipped without walking them.
+    """
+    changes = []
+    changed_sections = set()
+    for section in sorted(old.keys() | new.keys()):
+        if section in IGNORED_SECTIONS and not include_metadata:
+            continue
+        if old_digests and new_digests:
+            a, b = old_digests.get(section), new_digests.get(section)
+            if a is not None and a == b:
+                continue
+        before = len(changes)
+        _walk(section, (), old.get(section, _ABSENT), new.get(section, _ABSENT), changes)
+        if len(changes) > before:
+            changed_sections.add(section)
+    changes.sort(key=lambda c: (c.section, [str(p) for p in c.path]))
+    return changes, changed_sections
+
+
+def compare_outputs(old, new, changed_sections):
+    """
+    Effect of the input changes on outputs.
+    Returns rows of (component, old_total, new_total), ending with the total cost.
+    Components unaffected by ``changed_sections`` reuse the old results.
+    """
+    old_results = run_calculation(old)
+    new_results = run_calculation(new, old_results, changed_sections)
+    rows = [
+        (name, old_results[name]["total"], new_results[name]["total"])
+        for name in old_results
+    ]
+    rows.append(("total_cost", total_cost(old_results), total_cost(new_results)))
+    return rows
@@ -0,0 +1,67 @@
+"""
+Extra emissions of traffic diverted while the bridge is closed.
+
+Fuel use per vehicle-km is looked up for each vehicle class under the road
+conditions of the alternate route (roughness, rise plus fall), linearly
+interpolated between the grid points of the reference tables, and converted
+to CO2 by fuel type. Every diverted vehicle (ctx["traffic"] x
+ctx["closure_days"]) drives the additional re-route distance.
+
+Like core.work_zone, every function broadcasts over leading batch axes
+(scenarios, Monte Carlo draws):
+    roughness, rise_fall, extra_km  (...)
+    traffic       (..., vehicles, years)
+    closure_days  (..., years)
+"""
+
+import numpy as np
+
+from core import reference_data as ref
+from core.traffic import traffic_number
+
+_BASE_CO2_PER_KM = np.array([
+    ref.FUEL_CONSUMPTION[v] * ref.FUEL_CO2[ref.VEHICLE_FUEL[v]] for v in ref.VEHICLE_CLASSES
+])  # kg per vehicle-km on a smooth, flat road
+_ROUGHNESS_GRID = np.array(ref.FUEL_ROUGHNESS_GRID, dtype=float)
+_ROUGHNESS_TABLE = np.array([ref.FUEL_ROUGHNESS_FACTORS[v] for v in ref.VEHICLE_CLASSES])
+_RISE_FALL_GRID = np.array(ref.FUEL_RISE_FALL_GRID, dtype=float)
+_RISE_FALL_TABLE = np.array([ref.FUEL_RISE_FALL_FACTORS[v] for v in ref.VEHICLE_CLASSES])
+
+
+def _lookup(grid, table, x):
+    """
+    Linear interpolation of every row of ``table`` (vehicles, grid) at ``x``
+    (any shape, clamped to the grid). Returns (*x.shape, vehicles).
+    """
+    x = np.clip(np.asarray(x, dtype=float), grid[0], grid[-1])
+    i = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(grid) - 2)
+    w = ((x - grid[i]) / (grid[i + 1] - grid[i]))[..., None]
+    lo = np.moveaxis(table[:, i], 0, -1)
+    hi = np.moveaxis(table[:, i + 1], 0, -1)
+    return lo * (1.0 - w) + hi * w
+
+
+def co2_per_km(roughness, rise_fall):
+    """CO2 per vehicle-km (kg) of every vehicle class: array (..., vehicles)."""
+    factors = (
+        _lookup(_ROUGHNESS_GRID, _ROUGHNESS_TABLE, roughness)
+        * _lookup(_RISE_FALL_GRID, _RISE_FALL_TABLE, rise_fall)
+    )
+    return _BASE_CO2_PER_KM * factors
+
+
+def diversion_inputs(inputs):
+    """Route conditions from the Traffic Data page: {"roughness", "rise_fall", "extra_km"}."""
+    return {
+        "roughness": traffic_number(inputs, "road_roughness", ref.FUEL_ROUGHNESS_GRID[0]),
+        "rise_fall": traffic_number(inputs, "road_rise") + traffic_number(inputs, "road_fall"),
+        "extra_km": traffic_number(inputs, "additional_reroute_distance"),
+    }
+
+
+def diversion_emissions(traffic, closure_days, roughness, rise_fall, extra_km):
+    """Extra tailpipe emissions per year (tCO2e): array (..., years)."""
+    per_km = co2_per_km(roughness, rise_fall)  # (..., vehicles)
+    diverted = traffic * np.asarray(closure_days)[..., None, :]
+    extra_km = np.asarray(extra_km, dtype=float)[..., None]
+    return extra_km * np.einsum("...v,...vt->...t", per_km, diverted) / 1000.0
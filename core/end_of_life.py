@@ -0,0 +1,111 @@
+"""
+End-of-life cost and emissions: demolition of the bridge at the end of its
+design life and the fate of its material inventory.
+
+The inventory (tonnes per material, ref.BOQ_MATERIALS order) comes from the
+BOQ, or from the deck area and primary material when the BOQ carries no
+mass. Of each material the recovery rate (Recycling page, scaled by the
+demolition method) is salvaged for reuse or recycling and the rest goes to
+landfill:
+    cost      = demolition + recycling and landfill handling - salvage value
+    emissions = demolition + landfill - recycling credits
+
+Everything happens in the last year of the design life (year index
+design_life - 1); a design life longer than the analysis period puts the
+event beyond the horizon. The yearly values and their present value come
+out of one array pass that broadcasts over leading batch axes (scenarios,
+Monte Carlo draws):
+    mass, recovery                                (..., materials)
+    deck_area, demolition_cost, demolition_co2    (...)
+    discount                                      (..., years)
+"""
+
+import numpy as np
+
+from core import reference_data as ref
+from core.boq_emissions import material_masses
+
+_RECOVERY = np.array([ref.RECOVERY_RATES[m] for m in ref.BOQ_MATERIALS]) / 100.0
+_SALVAGE = np.array([ref.SALVAGE_VALUES[m] for m in ref.BOQ_MATERIALS])
+_CREDITS = np.array([ref.RECYCLING_CREDITS[m] for m in ref.BOQ_MATERIALS])
+_MATERIALS = {m: i for i, m in enumerate(ref.BOQ_MATERIALS)}
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def event_year(design_life, years):
+    """One-hot array (years,) marking the end of the design life (all zeros beyond the horizon)."""
+    event = np.zeros(years)
+    index = int(design_life) - 1
+    if 0 <= index < years:
+        event[index] = 1.0
+    return event
+
+
+def material_inventory(factors, deck_area, primary_material):
+    """Tonnes of each material at demolition (``factors``: core.boq_emissions.boq_factors)."""
+    mass = material_masses(factors)
+    if mass.any():
+        return mass
+    intensity = ref.DECK_MATERIAL_INTENSITY.get(
+        primary_material, ref.DECK_MATERIAL_INTENSITY["Other"]
+    )
+    mass = np.zeros(len(ref.BOQ_MATERIALS))
+    for material, tonnes in intensity.items():
+        mass[_MATERIALS[material]] = tonnes * deck_area
+    return mass
+
+
+def end_of_life_inputs(inputs):
+    """
+    Recovery rates and demolition method from the Recycling and Demolition
+    pages: {"recovery" (materials,), "demolition_cost", "demolition_co2"}.
+    """
+    rates = inputs.get("recycling", {}).get("recovery_rate", {})
+    overrides = np.array([_number(rates.get(m)) for m in ref.BOQ_MATERIALS], dtype=float)
+    recovery = np.where(np.isnan(overrides), _RECOVERY, overrides / 100.0)
+
+    method = inputs.get("demolition", {}).get("demolition_method")
+    cost, co2, recovery_factor = ref.DEMOLITION_METHODS.get(
+        method, ref.DEMOLITION_METHODS[ref.DEFAULT_DEMOLITION_METHOD]
+    )
+    return {
+        "recovery": np.clip(recovery * recovery_factor, 0.0, 1.0),
+        "demolition_cost": cost,
+        "demolition_co2": co2,
+    }
+
+
+def end_of_life(mass, recovery, deck_area, demolition_cost, demolition_co2, event, discount):
+    """
+    Yearly (..., years) arrays "cost" (INR, net of salvage), "salvage" (INR),
+    "emissions" (tCO2e, net of credits) and "credits" (tCO2e), plus
+    "present_value" (...) of the cost.
+    """
+    recovered = mass * recovery
+    landfilled = (mass - recovered).sum(axis=-1)
+    deck_area = np.asarray(deck_area, dtype=float)
+
+    salvage = recovered @ _SALVAGE
+    cost = (
+        deck_area * demolition_cost
+        + recovered.sum(axis=-1) * ref.RECYCLING_COST
+        + landfilled * ref.LANDFILL_COST
+        - salvage
+    )
+    credits = recovered @ _CREDITS / 1000.0
+    emissions = (deck_area * demolition_co2 + landfilled * ref.LANDFILL_EMISSIONS) / 1000.0 - credits
+
+    return {
+        "cost": cost[..., None] * event,
+        "salvage": salvage[..., None] * event,
+        "emissions": emissions[..., None] * event,
+        "credits": credits[..., None] * event,
+        # + 0.0: no -0.0 when the event is beyond the horizon
+        "present_value": cost * (discount @ event) + 0.0,
+    }
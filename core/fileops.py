@@ -0,0 +1,162 @@
+"""
+Project file operations: copy, delete (via the trash) and archive.
+
+Checkpoints are never modified once written (new checkpoints get new names,
+caches are replaced atomically), so a copy shares them with the original:
+a reflink (copy-on-write clone) where the filesystem supports it, else a
+hard link, else a plain copy. Only the live project.json is written, so
+copying a project with a long history is near-instant.
+
+Deletes move the project folder into projects/.trash (a rename), which is
+purged afterwards. Every operation runs on the maintenance worker
+(core.persistence.submit_maintenance), so it is ordered after pending saves
+of the same project, and reports progress(done, total, text).
+"""
+
+import os
+import sys
+import shutil
+import zipfile
+import datetime
+
+from core.results_store import RESULTS_DIR
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# Linux ioctl that clones a file's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409 if sys.platform.startswith("linux") else None
+
+TRASH_DIR = ".trash"
+
+# Files that belong to an open session and are never copied or archived
+SESSION_FILES = {"project.lock", "project.json.tmp", "history.json.tmp"}
+
+
+def _no_progress(done, total, text):
+    pass
+
+
+def clone_file(src, dst):
+    """
+    Creates ``dst`` sharing the data of the immutable file ``src``.
+    Returns the method used: "reflink", "hardlink" or "copy".
+    """
+    if fcntl is not None and FICLONE is not None:
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            shutil.copystat(src, dst)
+            return "reflink"
+        except OSError:
+            if os.path.exists(dst):
+                os.remove(dst)
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        shutil.copy2(src, dst)
+        return "copy"
+
+
+def copy_project(projects_dir, src_id, dst_id, text=None, progress=_no_progress):
+    """
+    Copies project ``src_id`` to the new project ``dst_id``. Checkpoints are
+    cloned (see clone_file); project.json is written from ``text`` (already
+    serialized JSON) or copied when ``text`` is None. Backups, undo history,
+    reports, profiles and stored results are not carried over.
+
+    The copy is assembled in a hidden staging folder and renamed into place,
+    so the dashboard never sees a partial project. Returns {method: count}.
+    """
+    src = os.path.join(projects_dir, src_id)
+    dst = os.path.join(projects_dir, dst_id)
+    if os.path.exists(dst):
+        raise FileExistsError(f"Project '{dst_id}' already exists.")
+    staging = os.path.join(projects_dir, f".{dst_id}.part")
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(os.path.join(staging, "checkpoints"))
+
+    cp_src = os.path.join(src, "checkpoints")
+    names = sorted(os.listdir(cp_src)) if os.path.isdir(cp_src) else []
+    counts = {"reflink": 0, "hardlink": 0, "copy": 0}
+    try:
+        for i, name in enumerate(names):
+            method = clone_file(
+                os.path.join(cp_src, name), os.path.join(staging, "checkpoints", name)
+            )
+            counts[method] += 1
+            progress(i + 1, len(names) + 1, f"Copying checkpoints ({i + 1}/{len(names)})")
+
+        json_path = os.path.join(staging, "project.json")
+        if text is None:
+            shutil.copy2(os.path.join(src, "project.json"), json_path)
+        else:
+            with open(json_path, "w") as f:
+                f.write(text)
+        progress(len(names) + 1, len(names) + 1, "Copying project file")
+        os.rename(staging, dst)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return counts
+
+
+def trash_project(projects_dir, p_id, progress=_no_progress):
+    """Moves a project into the trash folder. Returns its path there."""
+    trash = os.path.join(projects_dir, TRASH_DIR)
+    os.makedirs(trash, exist_ok=True)
+    ts = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
+    target = os.path.join(trash, f"{p_id}__{ts}")
+    os.rename(os.path.join(projects_dir, p_id), target)
+    progress(1, 1, "Moved to trash")
+    return target
+
+
+def purge_trash(projects_dir, progress=_no_progress):
+    """Permanently removes everything in the trash folder. Returns the entries removed."""
+    trash = os.path.join(projects_dir, TRASH_DIR)
+    if not os.path.isdir(trash):
+        return 0
+    entries = os.listdir(trash)
+    for i, name in enumerate(entries):
+        path = os.path.join(trash, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.remove(path)
+        progress(i + 1, len(entries), f"Emptying trash ({i + 1}/{len(entries)})")
+    return len(entries)
+
+
+def archive_project(projects_dir, p_id, dest_path, progress=_no_progress):
+    """
+    Writes project ``p_id`` (minus session files and stored results, which
+    are recomputed from the inputs) to the zip ``dest_path`` (via a
+    temporary file, replaced on success). Returns ``dest_path``.
+    """
+    src = os.path.join(projects_dir, p_id)
+    files = []
+    for root, dirs, names in os.walk(src):
+        if root == src and RESULTS_DIR in dirs:
+            dirs.remove(RESULTS_DIR)
+        for name in names:
+            if name not in SESSION_FILES:
+                files.append(os.path.join(root, name))
+    total = sum(os.path.getsize(f) for f in files) or 1
+
+    tmp_path = dest_path + ".part"
+    done = 0
+    try:
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for path in files:
+                zf.write(path, os.path.join(p_id, os.path.relpath(path, src)))
+                done += os.path.getsize(path)
+                progress(done, total, f"Archiving ({done * 100 // total}%)")
+        os.replace(tmp_path, dest_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return dest_path
@@ -0,0 +1,110 @@
+"""
+Undo / redo history for a ProjectModel.
+
+Each step is a compact patch (section, path, old, new) recorded by
+ProjectModel.set_value, so memory grows with the number and size of edits,
+never with the size of the project. Consecutive edits of the same field
+within MERGE_WINDOW seconds (typing) are merged into a single step.
+"""
+
+import time
+from collections import deque
+
+HISTORY_LIMIT = 10000
+MERGE_WINDOW = 1.0
+
+
+class Patch:
+    __slots__ = ("section", "path", "old", "new", "time")
+
+    def __init__(self, section, path, old, new, time_=0.0):
+        self.section = section
+        self.path = tuple(path)
+        self.old = old
+        self.new = new
+        self.time = time_
+
+    def to_list(self):
+        return [self.section, list(self.path), self.old, self.new]
+
+    @classmethod
+    def from_list(cls, data):
+        section, path, old, new = data
+        return cls(section, path, old, new)
+
+
+class History:
+    def __init__(self, limit=HISTORY_LIMIT, merge_window=MERGE_WINDOW):
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = []
+        self.merge_window = merge_window
+        self._applying = False
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def record(self, section, path, old, new):
+        """Called by ProjectModel for every tracked change."""
+        if self._applying or old == new:
+            return
+        now = time.monotonic()
+        top = self.undo_stack[-1] if self.undo_stack else None
+        if (
+            top is not None
+            and top.section == section
+            and top.path == tuple(path)
+            and now - top.time < self.merge_window
+        ):
+            top.new = new
+            top.time = now
+            if top.old == top.new:
+                self.undo_stack.pop()
+        else:
+            self.undo_stack.append(Patch(section, path, old, new, now))
+        self.redo_stack.clear()
+
+    def undo(self, model):
+        """Reverts the last step on ``model``. Returns the patch, or None."""
+        if not self.undo_stack:
+            return None
+        patch = self.undo_stack.pop()
+        self._apply(model, patch, patch.old)
+        self.redo_stack.append(patch)
+        return patch
+
+    def redo(self, model):
+        """Re-applies the last undone step on ``model``. Returns the patch, or None."""
+        if not self.redo_stack:
+            return None
+        patch = self.redo_stack.pop()
+        self._apply(model, patch, patch.new)
+        patch.time = 0.0  # never merge later edits into a redone step
+        self.undo_stack.append(patch)
+        return patch
+
+    def _apply(self, model, patch, value):
+        self._applying = True
+        try:
+            model.set_value(patch.section, patch.path, value)
+        finally:
+            self._applying = False
+
+    # --- Serialisation ---
+
+    def to_dict(self):
+        return {
+            "undo": [p.to_list() for p in self.undo_stack],
+            "redo": [p.to_list() for p in self.redo_stack],
+        }
+
+    def load_dict(self, data):
+        self.clear()
+        self.undo_stack.extend(Patch.from_list(p) for p in data.get("undo", []))
+        self.redo_stack.extend(Patch.from_list(p) for p in data.get("redo", []))
@@ -0,0 +1,34 @@
+"""
+Process memory measurement (resident set size).
+
+Uses psutil when installed, /proc on Linux, and otherwise the peak RSS from
+the resource module (which never decreases, so deltas are upper bounds).
+"""
+
+import os
+import sys
+
+try:
+    import psutil
+except ImportError:  # optional
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def rss_bytes():
+    """Current resident set size of this process in bytes (None if unknown)."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes
@@ -0,0 +1,142 @@
+"""
+Bulk schema migration of a projects folder (see core.schema).
+
+Run:  python -m core.migrate [PROJECTS_DIR] [--dry-run] [--workers N]
+
+Every project folder is handled by a worker process: project.json is parsed,
+upgraded and validated, then written back like a save (previous file kept as
+project.json.bak, new one written to a temporary file and renamed over it).
+Projects already at the current version are recognised from the first block
+of the file, without parsing the rest. Open projects (project.lock present)
+are skipped. --dry-run reports what would change and writes nothing.
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from core.schema import SchemaError, SCHEMA_VERSION, upgrade
+
+# metadata is the first key written, so its schema_version lies in the first block
+HEAD_BYTES = 64 * 1024
+_VERSION = re.compile(rb'"schema_version":\s*(\d+)')
+
+# Report order of the statuses returned by migrate_project
+STATUSES = ("migrated", "current", "locked", "invalid", "error")
+
+
+def _head_version(path):
+    """schema_version found near the start of ``path``, or None."""
+    with open(path, "rb") as f:
+        match = _VERSION.search(f.read(HEAD_BYTES))
+    return int(match.group(1)) if match else None
+
+
+def _write(path, text):
+    shutil.copy2(path, path + ".bak")
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def migrate_project(project_dir, dry_run=False):
+    """
+    Upgrades the project.json of ``project_dir``. Returns (status, detail),
+    status being one of STATUSES ("migrated" also for a dry run).
+    """
+    path = os.path.join(project_dir, "project.json")
+    if os.path.exists(os.path.join(project_dir, "project.lock")):
+        return "locked", "open in a window"
+    try:
+        if _head_version(path) == SCHEMA_VERSION:
+            return "current", ""
+        with open(path, "r") as f:
+            data = json.load(f)
+        data, version = upgrade(data)
+        if version == SCHEMA_VERSION:
+            return "current", ""
+        if not dry_run:
+            _write(path, json.dumps(data, indent=4))
+        return "migrated", f"v{version} -> v{SCHEMA_VERSION}"
+    except SchemaError as e:
+        return "invalid", str(e)
+    except (OSError, ValueError) as e:
+        return "error", str(e)
+
+
+def _migrate_one(args):
+    return migrate_project(*args)
+
+
+def project_dirs(projects_dir):
+    """{project ID: folder} of every project under ``projects_dir`` (no trash or staging folders)."""
+    dirs = {}
+    for p_id in sorted(os.listdir(projects_dir)):
+        path = os.path.join(projects_dir, p_id)
+        if not p_id.startswith(".") and os.path.isfile(os.path.join(path, "project.json")):
+            dirs[p_id] = path
+    return dirs
+
+
+def migrate_tree(projects_dir, dry_run=False, workers=None):
+    """
+    Migrates every project under ``projects_dir`` across ``workers``
+    processes (one process: in this one). Returns {project ID: (status, detail)}.
+    """
+    dirs = project_dirs(projects_dir)
+    jobs = [(path, dry_run) for path in dirs.values()]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        outcomes = map(_migrate_one, jobs)
+        return dict(zip(dirs, outcomes))
+    chunk = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(dirs, pool.map(_migrate_one, jobs, chunksize=chunk)))
+
+
+def report(outcomes, dry_run=False):
+    """Report lines: every project that is not current, then the counts."""
+    lines = []
+    for p_id, (status, detail) in outcomes.items():
+        if status != "current":
+            label = "would migrate" if dry_run and status == "migrated" else status
+            lines.append(f"{p_id}: {label}" + (f" ({detail})" if detail else ""))
+    counts = Counter(status for status, _ in outcomes.values())
+    summary = ", ".join(f"{counts[s]} {s}" for s in STATUSES if counts[s])
+    lines.append(
+        f"{len(outcomes)} project(s) at schema v{SCHEMA_VERSION}"
+        + (" (dry run)" if dry_run else "") + (f": {summary}" if summary else "")
+    )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "projects_dir", nargs="?", default=os.path.join(os.getcwd(), "projects"),
+        help="folder holding the project folders (default ./projects)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="report only, write nothing")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPUs)")
+    args = parser.parse_args(argv)
+
+    outcomes = migrate_tree(args.projects_dir, args.dry_run, args.workers)
+    print("\n".join(report(outcomes, args.dry_run)))
+    failed = any(status in ("invalid", "error") for status, _ in outcomes.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,41 @@
 import uuid
-from datetime import datetime
+
+from core.history import History
+from core.diff import section_digest
+from core.schema import new_project, upgrade, SCHEMA_VERSION
+
+
+# Consumers that track changes independently (see pop_changes)
+CHANGE_CHANNELS = ("save", "calc")
 
 
 class ProjectModel:
     """
     The Data Model for the LCCA application.
-    Stores project metadata and any future structured data.
+    Stores project metadata and the input sections filled by the forms
+    ("general_info", "bridge_data", "traffic_data", "financial_data", ...).
+
+    Every change is recorded as a (section, key) pair on each change channel,
+    so the save and calculation paths can each ask what changed since they
+    last ran. Recorded changes also feed the undo/redo ``history``.
+
+    ``initial_data`` (a parsed project file) is migrated in place to the
+    current schema and validated (core.schema); it raises SchemaError when
+    the data cannot be read. ``migrated_from`` is the version it had when
+    older than the current one, else None.
     """
 
     def __init__(self, initial_data=None):
-        if initial_data and "metadata" in initial_data:
-            self._storage = initial_data
+        self._changes = {channel: set() for channel in CHANGE_CHANNELS}
+        self.history = History()
+        self._digests = {}  # section -> cached content digest (see section_digests)
+        self.migrated_from = None
+        if initial_data:
+            self._storage, version = upgrade(initial_data)
+            if version < SCHEMA_VERSION:
+                self.migrated_from = version
         else:
-            self._storage = {
-                "metadata": {
-                    "project_name": "New Project",
-                    "author": "User",
-                    "created_at": str(datetime.now()),
-                },
-            }
+            self._storage = new_project("New Project")
 
     def get_metadata(self, key, default=""):
         """Retrieves a value from the metadata dictionary."""
@@ -26,7 +43,114 @@ class ProjectModel:
 
     def update_metadata(self, key, value):
         """Updates a metadata field."""
-        self._storage["metadata"][key] = value
+        self.set_value("metadata", (key,), value)
+
+    # --- Input sections ---
+
+    def get_section(self, section):
+        """Returns an input section dict (empty if the section was never filled)."""
+        return self._storage.get(section, {})
+
+    def get_value(self, section, path, default=None):
+        """
+        Reads a value by key path, e.g. ("daily_traffic", "hcv") in "traffic_data".
+        An empty path returns the whole section.
+        """
+        node = self._storage.get(section, {})
+        for key in path:
+            if not isinstance(node, dict) or key not in node:
+                return default
+            node = node[key]
+        return node
+
+    def set_value(self, section, path, value, record=True):
+        """
+        Writes a value by key path, creating intermediate dicts as needed.
+        An empty path replaces the whole section. ``record=False`` writes
+        silently (no change tracking, no undo step).
+        """
+        if record:
+            self.history.record(section, path, self.get_value(section, path), value)
+        self._digests.pop(section, None)
+        if not path:
+            self._storage[section] = value
+        else:
+            node = self._storage.setdefault(section, {})
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = value
+        if record:
+            self._record(section, tuple(path))
+
+    def section_digests(self):
+        """
+        {section: digest} of the current state. Digests are cached per section
+        and only recomputed for sections written since the last call.
+        """
+        for section, value in self._storage.items():
+            if section not in self._digests:
+                self._digests[section] = section_digest(value)
+        return dict(self._digests)
+
+    def inputs_key(self):
+        """Hashable identity of the calculation inputs: digests of every section but metadata."""
+        digests = self.section_digests()
+        digests.pop("metadata", None)
+        return tuple(sorted(digests.items()))
+
+    # --- Change tracking ---
+
+    def _record(self, section, path):
+        for changes in self._changes.values():
+            changes.add((section, path))
+
+    def mark_changed(self, section, path):
+        """Records a write made with ``record=False`` as a change (e.g. for the next save)."""
+        self._record(section, tuple(path))
+
+    def has_changes(self, channel):
+        return bool(self._changes[channel])
+
+    def pop_changes(self, channel):
+        """Returns and clears the (section, path) pairs changed since the last pop."""
+        changes = self._changes[channel]
+        self._changes[channel] = set()
+        return changes
+
+    def restore_changes(self, channel, changes):
+        """Records popped ``changes`` again (their consumer failed to handle them)."""
+        self._changes[channel] |= changes
+
+    def get_scenarios(self):
+        """Returns the stored design alternatives as a list of dicts."""
+        return self._storage.get("scenarios", [])
+
+    def set_scenarios(self, scenarios):
+        """Replaces the stored design alternatives."""
+        self.set_value("scenarios", (), scenarios)
+
+    def get_boq(self):
+        """Returns the bill of quantities as a list of item dicts."""
+        boq = self._storage.get("boq", [])
+        return boq if isinstance(boq, list) else []
+
+    def set_boq(self, boq):
+        """Replaces the bill of quantities (the list is never edited in place)."""
+        self.set_value("boq", (), boq)
 
     def to_dict(self):
         return self._storage
+
+    def snapshot(self):
+        """
+        Copy of the data that later edits do not reach, for work on other
+        threads. set_value only edits dicts in place (key paths never enter
+        lists), so dicts are copied and lists such as the BOQ are shared.
+        """
+        return _copy_dicts(self._storage)
+
+
+def _copy_dicts(value):
+    if isinstance(value, dict):
+        return {k: _copy_dicts(v) for k, v in value.items()}
+    return value
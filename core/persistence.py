@@ -2,6 +2,67 @@ import os
 import json
 import shutil
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from core.diff import project_digests
+
+# Saves have a disk worker of their own, so a save (and wait_for_save on the
+# GUI thread) never queues behind long maintenance work. A single thread keeps
+# writes to the same files in submission order.
+_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistence")
+
+# Everything else (pruning, usage scans, file operations, trash purges,
+# result sets, the search index) runs in order on the maintenance worker.
+_maintenance = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maintenance")
+
+# Project opens read on their own threads, so a large open never delays saves.
+_reader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="project-open")
+
+# Bytes read between cancellation checks while opening a project
+READ_CHUNK = 1024 * 1024
+
+
+def submit(fn, *args, **kwargs):
+    """Runs ``fn`` (a save) on the persistence worker thread. Returns a Future."""
+    return _worker.submit(fn, *args, **kwargs)
+
+
+def submit_maintenance(fn, *args, **kwargs):
+    """
+    Runs ``fn`` on the maintenance worker thread, once the saves submitted
+    before it have been written. Returns a Future.
+    """
+    saved = _worker.submit(lambda: None)  # behind every save queued so far
+
+    def run():
+        saved.result()
+        return fn(*args, **kwargs)
+    return _maintenance.submit(run)
+
+
+def submit_read(fn, *args, **kwargs):
+    """Runs read-only work (project opens) on the reader threads. Returns a Future."""
+    return _reader.submit(fn, *args, **kwargs)
+
+
+# One lock per digests.cache path, shared by every PersistenceService of a project
+_digest_locks = {}
+_digest_locks_guard = threading.Lock()
+
+
+def _digest_cache_lock(cache_path):
+    with _digest_locks_guard:
+        return _digest_locks.setdefault(cache_path, threading.Lock())
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+def _check_cancel(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise LoadCancelled()
 
 
 class PersistenceService:
@@ -19,6 +80,8 @@ class PersistenceService:
         self.bak_path = os.path.join(self.base_path, "project.json.bak")
         self.lock_path = os.path.join(self.base_path, "project.lock")
         self.checkpoint_dir = os.path.join(self.base_path, "checkpoints")
+        self.history_path = os.path.join(self.base_path, "history.json")
+        self._listing_cache = (None, [])  # (checkpoint dir mtime, list_checkpoints result)
 
     def is_file_healthy(self, path):
         """Checks if a file exists and contains valid JSON."""
@@ -31,6 +94,55 @@ class PersistenceService:
         except (json.JSONDecodeError, OSError):
             return False
 
+    def _read_json(self, path, cancel_event=None, progress=None):
+        """
+        Reads and parses ``path`` in READ_CHUNK blocks, checking ``cancel_event``
+        between blocks and reporting ``progress(bytes read, total bytes)``.
+        """
+        total = os.path.getsize(path)
+        if total == 0:
+            raise ValueError(f"{os.path.basename(path)} is empty")
+        chunks = []
+        done = 0
+        with open(path, "rb") as f:
+            while True:
+                _check_cancel(cancel_event)
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, total)
+        _check_cancel(cancel_event)
+        return json.loads(b"".join(chunks))
+
+    def open_project(self, cancel_event=None, progress=None):
+        """
+        Reads project.json for opening, restoring it from .bak when the main
+        file is missing or corrupt. Each file is parsed once (the parse is the
+        health check). Raises LoadCancelled once ``cancel_event`` is set.
+
+        Returns (data, stored undo history or None, restored from backup).
+        """
+        restored = False
+        try:
+            data = self._read_json(self.json_path, cancel_event, progress)
+        except (OSError, ValueError):
+            try:
+                data = self._read_json(self.bak_path, cancel_event, progress)
+            except (OSError, ValueError):
+                raise ValueError("Project files are corrupted and cannot be recovered.")
+            _check_cancel(cancel_event)
+            shutil.copy2(self.bak_path, self.json_path)
+            restored = True
+
+        history = None
+        if isinstance(data, dict) and data.get("metadata", {}).get("keep_undo_history"):
+            _check_cancel(cancel_event)
+            history = self.load_history()
+        return data, history, restored
+
     def acquire_lock(self):
         """Creates a lock file. Returns False if already locked."""
         if os.path.exists(self.lock_path):
@@ -51,13 +163,21 @@ class PersistenceService:
         2. Write to a .tmp file
         3. Atomically replace the main file
         """
+        self.save_text(json.dumps(data, indent=4))
+
+    def save_text(self, text, history_data=None):
+        """
+        Atomic save of already-serialized project JSON (see save), followed by
+        the undo history when ``history_data`` is given. Safe to run on the
+        persistence worker: it touches no shared in-memory state.
+        """
         if os.path.exists(self.json_path):
             shutil.copy2(self.json_path, self.bak_path)
 
         tmp_path = self.json_path + ".tmp"
         try:
             with open(tmp_path, "w") as f:
-                json.dump(data, f, indent=4)
+                f.write(text)
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(tmp_path, self.json_path)
@@ -65,6 +185,49 @@ class PersistenceService:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
             raise e
+        if history_data is not None:
+            self.save_history(history_data)
+
+    def _fingerprint(self):
+        """Identifies the current project.json on disk (mtime + size)."""
+        try:
+            st = os.stat(self.json_path)
+            return [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return None
+
+    def save_history(self, history_data):
+        """
+        Stores undo/redo history next to the checkpoints, tagged with the
+        fingerprint of the project.json it belongs to.
+        """
+        tmp_path = self.history_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"project": self._fingerprint(), "history": history_data}, f)
+            os.replace(tmp_path, self.history_path)
+        except OSError as e:
+            print(f"History save error: {e}")
+
+    def load_history(self):
+        """
+        Returns the stored history data, or None when there is none or it was
+        written for a different version of project.json.
+        """
+        if not os.path.exists(self.history_path):
+            return None
+        try:
+            with open(self.history_path, "r") as f:
+                doc = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+        if doc.get("project") != self._fingerprint():
+            return None
+        return doc.get("history")
+
+    def discard_history(self):
+        if os.path.exists(self.history_path):
+            os.remove(self.history_path)
 
     def create_checkpoint(self, data, custom_name):
         """
@@ -81,9 +244,159 @@ class PersistenceService:
                 clean_name = "Backup"
             filename = f"{clean_name}__{ts}.json"
             cp_path = os.path.join(self.checkpoint_dir, filename)
-            with open(cp_path, "w") as f:
+            # Write-then-replace: checkpoint files may be shared with project copies
+            with open(cp_path + ".tmp", "w") as f:
                 json.dump(data, f, indent=4)
+            os.replace(cp_path + ".tmp", cp_path)
             return filename
         except Exception as e:
             print(f"Checkpoint error: {e}")
             return None
+
+    def list_checkpoints(self):
+        """
+        Returns (display_label, filename) pairs for all checkpoints, newest first.
+        Labels are built from the Name__YYYYMMDDHHMMSS.json filename pattern.
+        The listing is cached until the checkpoint folder changes.
+        """
+        if not os.path.exists(self.checkpoint_dir):
+            return []
+        mtime = os.stat(self.checkpoint_dir).st_mtime_ns
+        if self._listing_cache[0] == mtime:
+            return list(self._listing_cache[1])
+
+        files = sorted(
+            [f for f in os.listdir(self.checkpoint_dir) if f.endswith(".json")],
+            reverse=True,
+        )
+        display_data = []
+        for f in files:
+            parts = f.replace(".json", "").split("__")
+            if len(parts) == 2:
+                name, ts = parts
+                try:
+                    pretty = (
+                        f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]}  "
+                        f"{ts[8:10]}:{ts[10:12]}:{ts[12:14]}"
+                    )
+                except Exception:
+                    pretty = ts
+                display_data.append((f"{name}  (saved: {pretty})", f))
+            else:
+                display_data.append((f, f))
+        self._listing_cache = (mtime, display_data)
+        return list(display_data)
+
+    def load_checkpoint(self, filename):
+        """Reads and returns the data stored in a checkpoint file."""
+        with open(os.path.join(self.checkpoint_dir, filename), "r") as f:
+            return json.load(f)
+
+    def _digest_cache_path(self):
+        return os.path.join(self.checkpoint_dir, "digests.cache")
+
+    def _read_digest_cache(self):
+        try:
+            with open(self._digest_cache_path(), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Digest cache error: {e}")
+            return {}
+
+    def _update_digest_cache(self, update):
+        """
+        Read-modify-write of digests.cache under the cache's lock (the Compare
+        dialog and retention pruning update it from different threads);
+        ``update(cache)`` edits the dict in place.
+        """
+        cache_path = self._digest_cache_path()
+        with _digest_cache_lock(cache_path):
+            if not os.path.isdir(self.checkpoint_dir):
+                return
+            cache = self._read_digest_cache()
+            update(cache)
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"Digest cache error: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def forget_checkpoints(self, filenames):
+        """Drops deleted checkpoints from the digest cache."""
+        if not os.path.exists(self._digest_cache_path()):
+            return
+
+        def forget(cache):
+            for name in filenames:
+                cache.pop(name, None)
+        self._update_digest_cache(forget)
+
+    def checkpoint_digests(self, filename, data):
+        """
+        Per-section digests of a checkpoint. Checkpoints never change, so
+        digests are computed once and cached in checkpoints/digests.cache.
+        """
+        with _digest_cache_lock(self._digest_cache_path()):
+            cached = self._read_digest_cache().get(filename)
+        if cached is not None:
+            return cached
+        digests = project_digests(data)  # outside the lock: may take a while
+
+        def remember(cache):
+            # Only while the checkpoint still exists (pruning may have removed it)
+            if os.path.exists(os.path.join(self.checkpoint_dir, filename)):
+                cache[filename] = digests
+        self._update_digest_cache(remember)
+        return digests
+
+
+def scan_projects(projects_dir):
+    """
+    Scans the projects directory without touching the GUI.
+    Returns a list of (project_id, display_name, is_recovering) tuples sorted by ID.
+    A project is "recovering" when its main file is missing/corrupt but a .bak exists.
+    """
+    projects = []
+    if not os.path.exists(projects_dir):
+        return projects
+
+    for p_id in sorted(os.listdir(projects_dir)):
+        p_path = os.path.join(projects_dir, p_id)
+        if p_id.startswith(".") or not os.path.isdir(p_path):
+            continue  # trash, staging folders and caches
+
+        json_path = os.path.join(p_path, "project.json")
+        bak_path = os.path.join(p_path, "project.json.bak")
+
+        main_ok = os.path.exists(json_path) and os.path.getsize(json_path) > 0
+        bak_ok = os.path.exists(bak_path) and os.path.getsize(bak_path) > 0
+
+        if not main_ok and not bak_ok:
+            continue  # Not a valid project folder
+
+        is_recovering = not main_ok and bak_ok
+        target_file = json_path if main_ok else bak_path
+
+        display_name = p_id
+        try:
+            with open(target_file, "r") as f:
+                data = json.load(f)
+                display_name = data.get("metadata", {}).get("project_name", p_id)
+        except Exception:
+            if bak_ok:
+                is_recovering = True
+                try:
+                    with open(bak_path, "r") as f:
+                        data = json.load(f)
+                        display_name = data.get("metadata", {}).get("project_name", p_id)
+                except Exception:
+                    pass
+
+        projects.append((p_id, display_name, is_recovering))
+    return projects
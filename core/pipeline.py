@@ -0,0 +1,78 @@
+"""
+The Calculate pipeline: the base project and every scenario as one task
+graph over the process pool (core.scheduler), then the Monte Carlo band,
+streaming partial results as it goes.
+
+run_pipeline runs on a worker thread and reports through ``emit``:
+  ("progress", done, total, text)
+  ("component", name, result)   as each base-project component arrives
+  ("charts", raw)               scenario charts (core.charts), first without
+                                and then with the uncertainty band
+Cancellation is cooperative: ``cancel_event`` is checked as every component
+arrives (tasks not yet started are then dropped) and after every block of
+Monte Carlo draws.
+"""
+
+from core.calculation import COMPONENTS, build_context
+from core.charts import scenario_charts, uncertainty_chart
+from core.scenarios import evaluate_yearly, scenario_jobs
+from core.uncertainty import DEFAULT_DRAWS, CHUNK
+
+
+class CalculationCancelled(Exception):
+    pass
+
+
+class _Progress:
+    """Step counting across the stages of a run; raises CalculationCancelled when cancelled."""
+
+    def __init__(self, emit, cancel_event, total):
+        self.emit = emit
+        self.cancel_event = cancel_event
+        self.total = max(total, 1)
+        self.done = 0
+
+    def check(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise CalculationCancelled()
+
+    def step(self, text, n=1):
+        self.check()
+        self.done += n
+        self.emit("progress", min(self.done, self.total), self.total, text)
+
+
+def run_pipeline(project, emit, cancel_event=None, draws=DEFAULT_DRAWS):
+    """
+    Runs the full calculation of ``project`` (a ProjectModel dict).
+    Returns (evaluated, raw charts), evaluated as in core.scenarios.evaluate_yearly;
+    raises CalculationCancelled if ``cancel_event`` is set.
+    """
+    names = [name for name, _ in scenario_jobs(project)]
+    blocks = -(-draws // CHUNK)
+    progress = _Progress(emit, cancel_event, len(COMPONENTS) + len(names) - 1 + blocks)
+    progress.check()
+    pending = [len(COMPONENTS)] * len(names)
+
+    def on_result(index, name, result):
+        pending[index] -= 1
+        if index == 0:
+            emit("component", name, result)
+            progress.step(name)
+        elif not pending[index]:
+            progress.step(names[index])
+        else:
+            progress.check()
+
+    evaluated = evaluate_yearly(project, on_result)
+
+    raw = scenario_charts(evaluated)
+    emit("charts", dict(raw))
+
+    def on_block(done, total):
+        progress.step(f"Monte Carlo {done:,}/{total:,}")
+
+    rate = build_context(project)["discount_rate"]
+    raw["uncertainty"] = uncertainty_chart(evaluated, rate, draws, on_block)
+    emit("charts", dict(raw))
+    return evaluated, raw
@@ -0,0 +1,132 @@
+"""
+On-demand deep profiling of individual UI actions.
+
+Once armed (``--profile [N]`` on the command line or the Logs menu), the next
+N actions routed through ``profiler.run`` / ``profiler.wrap`` execute under
+cProfile and tracemalloc. Each profiled action writes into the given folder
+(normally projects/<id>/profiles/):
+  - <stamp>__<action>.pstats      cProfile stats (open with pstats / snakeviz)
+  - <stamp>__<action>.alloc.txt   top allocation sites during the action
+and appends a summary line to index.jsonl, used by the Logs page viewer.
+"""
+
+import io
+import os
+import json
+import time
+import pstats
+import cProfile
+import datetime
+import functools
+import tracemalloc
+
+DEFAULT_ACTION_COUNT = 10
+TOP_ALLOCATIONS = 25
+INDEX_FILE = "index.jsonl"
+
+
+class ActionProfiler:
+    def __init__(self):
+        self.remaining = 0
+        self._running = False
+
+    @property
+    def active(self):
+        return self.remaining > 0
+
+    def arm(self, count=DEFAULT_ACTION_COUNT):
+        """Profiles the next ``count`` actions."""
+        self.remaining = count
+
+    def disarm(self):
+        self.remaining = 0
+
+    def wrap(self, name, fn, output_dir_fn):
+        """Returns ``fn`` wrapped so that calls are profiled while armed."""
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return self.run(name, output_dir_fn(), fn, *args, **kwargs)
+        return wrapper
+
+    def run(self, name, output_dir, fn, *args, **kwargs):
+        """Calls ``fn``; profiles it if armed and no other action is being profiled."""
+        if not self.active or self._running:
+            return fn(*args, **kwargs)
+
+        self.remaining -= 1
+        self._running = True
+        started_tracemalloc = not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            return profile.runcall(fn, *args, **kwargs)
+        finally:
+            wall = time.perf_counter() - start
+            after = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if started_tracemalloc:
+                tracemalloc.stop()
+            self._running = False
+            try:
+                self._write(output_dir, name, wall, peak, profile, before, after)
+            except OSError as e:
+                print(f"Profile write error: {e}")
+
+    def _write(self, output_dir, name, wall, peak, profile, before, after):
+        os.makedirs(output_dir, exist_ok=True)
+        now = datetime.datetime.now()
+        clean_name = "".join(c if c.isalnum() else "_" for c in name).strip("_")
+        stem = f"{now.strftime('%Y%m%d%H%M%S%f')}__{clean_name}"
+
+        pstats_file = stem + ".pstats"
+        profile.dump_stats(os.path.join(output_dir, pstats_file))
+
+        alloc_file = stem + ".alloc.txt"
+        diff = after.compare_to(before, "lineno")
+        with open(os.path.join(output_dir, alloc_file), "w") as f:
+            f.write(f"Action: {name}\nWall time: {wall * 1000:.1f} ms\n")
+            f.write(f"Peak traced memory: {peak / 1024:,.1f} KB\n\n")
+            f.write(f"Top {TOP_ALLOCATIONS} allocation sites (net change):\n")
+            for stat in diff[:TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+
+        entry = {
+            "action": name,
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "wall": wall,
+            "peak_bytes": peak,
+            "pstats": pstats_file,
+            "alloc": alloc_file,
+        }
+        with open(os.path.join(output_dir, INDEX_FILE), "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+def list_profiles(output_dir):
+    """Returns the recorded profile entries of a folder, slowest first."""
+    index_path = os.path.join(output_dir, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return []
+    entries = []
+    with open(index_path, "r") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return sorted(entries, key=lambda e: e.get("wall", 0), reverse=True)
+
+
+def format_stats(path, limit=30):
+    """Renders the top functions of a .pstats file by cumulative time."""
+    out = io.StringIO()
+    stats = pstats.Stats(path, stream=out)
+    stats.sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
+
+
+profiler = ActionProfiler()
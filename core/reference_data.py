@@ -0,0 +1,355 @@
+"""
+Reference data used by the calculation engine.
+
+Indicative regional rates and factors (India / Maharashtra PWD baseline).
+Values are per square metre of deck unless stated otherwise and are meant
+to be replaced by the selected database once regional DBs are wired in.
+"""
+
+# Construction cost per m² of deck (INR), keyed by bridge type
+CONSTRUCTION_RATES = {
+    "Beam":         45000.0,
+    "Box Girder":   60000.0,
+    "Truss":        65000.0,
+    "Arch":         70000.0,
+    "Cable-Stayed": 120000.0,
+    "Suspension":   150000.0,
+    "Other":        55000.0,
+}
+
+# Multiplier on the construction rate, keyed by primary structural material
+MATERIAL_COST_FACTORS = {
+    "RCC":                   1.00,
+    "Prestressed Concrete":  1.15,
+    "Steel":                 1.35,
+    "Composite":             1.25,
+    "Timber":                0.80,
+    "Other":                 1.00,
+}
+
+# Routine maintenance per year as a fraction of construction cost
+MAINTENANCE_RATES = {
+    "RCC":                   0.005,
+    "Prestressed Concrete":  0.006,
+    "Steel":                 0.010,
+    "Composite":             0.008,
+    "Timber":                0.015,
+    "Other":                 0.007,
+}
+
+# Embodied carbon per m² of deck (kgCO2e), keyed by primary structural material
+EMBODIED_CARBON = {
+    "RCC":                   1200.0,
+    "Prestressed Concrete":  1100.0,
+    "Steel":                 1500.0,
+    "Composite":             1350.0,
+    "Timber":                450.0,
+    "Other":                 1200.0,
+}
+
+# Social cost of carbon (INR per tCO2e), keyed by country
+SOCIAL_COST_OF_CARBON = {
+    "India": 7000.0,
+}
+DEFAULT_SOCIAL_COST_OF_CARBON = 7000.0
+
+# Vehicle classes, in the order of the Traffic Data vehicle table
+VEHICLE_CLASSES = [
+    "two_wheeler", "small_cars", "big_cars", "ordinary_bus",
+    "deluxe_bus", "lcv", "hcv", "mcv",
+]
+
+# Passenger car units per vehicle (IRC:64)
+PCU_FACTORS = {
+    "two_wheeler":  0.5,
+    "small_cars":   1.0,
+    "big_cars":     1.0,
+    "ordinary_bus": 3.0,
+    "deluxe_bus":   3.0,
+    "lcv":          1.5,
+    "hcv":          3.0,
+    "mcv":          4.5,
+}
+
+# Annual traffic growth (%) used when the Traffic Data form leaves it blank
+DEFAULT_GROWTH_RATES = {
+    "two_wheeler":  6.0,
+    "small_cars":   6.0,
+    "big_cars":     5.0,
+    "ordinary_bus": 3.0,
+    "deluxe_bus":   3.0,
+    "lcv":          5.0,
+    "hcv":          5.0,
+    "mcv":          5.0,
+}
+
+# Piecewise growth: (first analysis year, multiplier of the annual rates)
+GROWTH_SEGMENTS = [(0, 1.0), (10, 0.8), (20, 0.6), (30, 0.4)]
+
+# Capacity of the alternate road (PCU/day), caps logistic traffic growth
+CARRIAGEWAY_CAPACITY = {
+    "Single Lane Roads":                    2000.0,
+    "Intermediate Lane Roads":              6000.0,
+    "Two Lane Roads":                       15000.0,
+    "Four Lane Divided Roads":              40000.0,
+    "Six Lane Divided Roads":               60000.0,
+    "Four Lane Divided Expressways":        60000.0,
+    "Six Lane Divided Expressways":         90000.0,
+    "Eight Lane Divided Urban Expressways": 120000.0,
+}
+DEFAULT_CARRIAGEWAY_CAPACITY = 15000.0
+
+# Bridge closures (traffic diverted to the alternate road)
+# Days of closure per construction year
+CONSTRUCTION_CLOSURE_DAYS = 365.0
+# Maintenance closures after construction: (interval in years, days closed)
+MAINTENANCE_CLOSURES = [
+    (10, 30.0),   # wearing course renewal
+    (15, 14.0),   # expansion joint replacement
+    (25, 60.0),   # bearing replacement
+]
+
+# Value of travel time per vehicle (INR per vehicle-hour, occupants included)
+VALUE_OF_TIME = {
+    "two_wheeler":  100.0,
+    "small_cars":   250.0,
+    "big_cars":     350.0,
+    "ordinary_bus": 1500.0,
+    "deluxe_bus":   2500.0,
+    "lcv":          200.0,
+    "hcv":          300.0,
+    "mcv":          400.0,
+}
+
+# Vehicle operating cost on a smooth rural road (INR per vehicle-km)
+VEHICLE_OPERATING_COST = {
+    "two_wheeler":  2.5,
+    "small_cars":   8.0,
+    "big_cars":     12.0,
+    "ordinary_bus": 25.0,
+    "deluxe_bus":   28.0,
+    "lcv":          15.0,
+    "hcv":          30.0,
+    "mcv":          40.0,
+}
+# Operating cost multiplier by type of the alternate road
+ROAD_TYPE_VOC_FACTORS = {"Urban Road": 1.15, "Rural Road": 1.0}
+# Roughness (mm/km) of a smooth road, and operating cost increase per 1000 mm/km above it
+BASE_ROUGHNESS = 2000.0
+ROUGHNESS_VOC_SLOPE = 0.04
+
+# Fuel use on a smooth, flat road (litres per vehicle-km) and fuel burnt
+FUEL_CONSUMPTION = {
+    "two_wheeler":  0.020,
+    "small_cars":   0.060,
+    "big_cars":     0.085,
+    "ordinary_bus": 0.250,
+    "deluxe_bus":   0.280,
+    "lcv":          0.110,
+    "hcv":          0.300,
+    "mcv":          0.380,
+}
+VEHICLE_FUEL = {
+    "two_wheeler": "petrol", "small_cars": "petrol", "big_cars": "diesel",
+    "ordinary_bus": "diesel", "deluxe_bus": "diesel",
+    "lcv": "diesel", "hcv": "diesel", "mcv": "diesel",
+}
+# Tailpipe CO2 (kg per litre)
+FUEL_CO2 = {"petrol": 2.31, "diesel": 2.68}
+
+# Fuel use multipliers by road condition, linearly interpolated between grid points
+# Roughness (mm/km)
+FUEL_ROUGHNESS_GRID = [2000, 4000, 6000, 8000, 10000]
+FUEL_ROUGHNESS_FACTORS = {
+    "two_wheeler":  [1.00, 1.02, 1.05, 1.08, 1.12],
+    "small_cars":   [1.00, 1.03, 1.06, 1.10, 1.15],
+    "big_cars":     [1.00, 1.03, 1.06, 1.10, 1.15],
+    "ordinary_bus": [1.00, 1.04, 1.09, 1.15, 1.22],
+    "deluxe_bus":   [1.00, 1.04, 1.09, 1.15, 1.22],
+    "lcv":          [1.00, 1.04, 1.08, 1.13, 1.19],
+    "hcv":          [1.00, 1.05, 1.11, 1.18, 1.26],
+    "mcv":          [1.00, 1.05, 1.12, 1.20, 1.29],
+}
+# Rise plus fall (m/km)
+FUEL_RISE_FALL_GRID = [0, 50, 100, 150, 200]
+FUEL_RISE_FALL_FACTORS = {
+    "two_wheeler":  [1.00, 1.03, 1.07, 1.12, 1.18],
+    "small_cars":   [1.00, 1.04, 1.09, 1.15, 1.22],
+    "big_cars":     [1.00, 1.04, 1.09, 1.15, 1.22],
+    "ordinary_bus": [1.00, 1.08, 1.18, 1.30, 1.44],
+    "deluxe_bus":   [1.00, 1.08, 1.18, 1.30, 1.44],
+    "lcv":          [1.00, 1.06, 1.14, 1.24, 1.36],
+    "hcv":          [1.00, 1.10, 1.22, 1.36, 1.52],
+    "mcv":          [1.00, 1.12, 1.26, 1.42, 1.60],
+}
+
+# BOQ items: structure tabs and materials (items with other values count as "Other")
+STRUCTURE_TABS = ["Foundation", "Super-Structure", "Substructure", "Miscellaneous"]
+BOQ_MATERIALS = [
+    "Concrete", "Reinforcement Steel", "Structural Steel", "Aggregate", "Sand",
+    "Cement", "Bitumen", "Earthwork", "Timber", "Other",
+]
+
+# Density (tonnes per cum) used to convert BOQ volumes to mass
+MATERIAL_DENSITY = {
+    "Concrete":            2.40,
+    "Reinforcement Steel": 7.85,
+    "Structural Steel":    7.85,
+    "Aggregate":           1.60,
+    "Sand":                1.55,
+    "Cement":              1.44,
+    "Bitumen":             1.03,
+    "Earthwork":           1.80,
+    "Timber":              0.60,
+    "Other":               2.00,
+}
+# Tonnes per BOQ unit for mass units (volumes use MATERIAL_DENSITY; others carry no mass)
+UNIT_MASS = {"t": 1.0, "mt": 1.0, "tonne": 1.0, "kg": 0.001, "qtl": 0.1}
+VOLUME_UNITS = {"cum", "m3", "cu.m"}
+
+# Haul distance (km) used when a BOQ item does not give one
+DEFAULT_HAUL_DISTANCE = {
+    "Concrete":            20.0,
+    "Reinforcement Steel": 300.0,
+    "Structural Steel":    300.0,
+    "Aggregate":           50.0,
+    "Sand":                50.0,
+    "Cement":              200.0,
+    "Bitumen":             250.0,
+    "Earthwork":           5.0,
+    "Timber":              150.0,
+    "Other":               100.0,
+}
+
+# Transport emissions (kgCO2e per tonne-km), keyed by transport mode
+TRANSPORT_FACTORS = {
+    "Road":            0.105,
+    "Rail":            0.028,
+    "Inland Waterway": 0.030,
+    "Sea":             0.016,
+}
+DEFAULT_TRANSPORT_MODE = "Road"
+
+# Construction equipment fuel use (litres of diesel per hour)
+EQUIPMENT_FUEL_RATES = {
+    "Excavator":     18.0,
+    "Crane":         15.0,
+    "Concrete Pump": 12.0,
+    "Transit Mixer": 10.0,
+    "Piling Rig":    25.0,
+    "Roller":        10.0,
+    "Paver":         14.0,
+    "Generator":     8.0,
+    "Other":         10.0,
+}
+# Equipment and hours per BOQ unit used when an item does not give them
+DEFAULT_EQUIPMENT = {
+    "Concrete":            ("Concrete Pump", 0.25),
+    "Reinforcement Steel": ("Crane", 1.50),
+    "Structural Steel":    ("Crane", 2.00),
+    "Aggregate":           ("Excavator", 0.02),
+    "Sand":                ("Excavator", 0.02),
+    "Cement":              ("Other", 0.01),
+    "Bitumen":             ("Paver", 0.05),
+    "Earthwork":           ("Excavator", 0.05),
+    "Timber":              ("Crane", 0.30),
+    "Other":               ("Other", 0.10),
+}
+
+# Material inventory (tonnes per m² of deck) assumed when the BOQ carries no
+# mass, keyed by primary structural material
+DECK_MATERIAL_INTENSITY = {
+    "RCC":                  {"Concrete": 2.00, "Reinforcement Steel": 0.20},
+    "Prestressed Concrete": {"Concrete": 1.80, "Reinforcement Steel": 0.15, "Structural Steel": 0.03},
+    "Steel":                {"Concrete": 0.60, "Reinforcement Steel": 0.06, "Structural Steel": 0.45},
+    "Composite":            {"Concrete": 1.00, "Reinforcement Steel": 0.10, "Structural Steel": 0.30},
+    "Timber":               {"Timber": 0.35, "Structural Steel": 0.02},
+    "Other":                {"Concrete": 1.50, "Reinforcement Steel": 0.15},
+}
+
+# End of life: share of each material recovered for reuse or recycling (%);
+# the rest goes to landfill
+RECOVERY_RATES = {
+    "Concrete":            70.0,
+    "Reinforcement Steel": 90.0,
+    "Structural Steel":    95.0,
+    "Aggregate":           80.0,
+    "Sand":                50.0,
+    "Cement":              0.0,
+    "Bitumen":             60.0,
+    "Earthwork":           90.0,
+    "Timber":              40.0,
+    "Other":               20.0,
+}
+# Salvage value of recovered material (INR per tonne)
+SALVAGE_VALUES = {
+    "Concrete":            150.0,
+    "Reinforcement Steel": 25000.0,
+    "Structural Steel":    28000.0,
+    "Aggregate":           300.0,
+    "Sand":                200.0,
+    "Cement":              0.0,
+    "Bitumen":             1000.0,
+    "Earthwork":           0.0,
+    "Timber":              3000.0,
+    "Other":               0.0,
+}
+# Emissions avoided by recovered material, net of reprocessing (kgCO2e per tonne)
+RECYCLING_CREDITS = {
+    "Concrete":            5.0,
+    "Reinforcement Steel": 1200.0,
+    "Structural Steel":    1500.0,
+    "Aggregate":           3.0,
+    "Sand":                2.0,
+    "Cement":              0.0,
+    "Bitumen":             150.0,
+    "Earthwork":           0.0,
+    "Timber":              200.0,
+    "Other":               0.0,
+}
+# Handling of recovered and landfilled material (INR and kgCO2e per tonne)
+RECYCLING_COST = 400.0
+LANDFILL_COST = 800.0
+LANDFILL_EMISSIONS = 15.0
+
+# Demolition methods: (INR per m² of deck, kgCO2e per m² of deck,
+# multiplier on the recovery rates)
+DEMOLITION_METHODS = {
+    "Conventional":             (3500.0, 45.0, 1.00),
+    "Selective Deconstruction": (5500.0, 60.0, 1.15),
+    "Mechanical (High-Reach)":  (3000.0, 40.0, 0.95),
+    "Controlled Explosive":     (2500.0, 30.0, 0.80),
+}
+DEFAULT_DEMOLITION_METHOD = "Conventional"
+
+# Monte Carlo ranges (low, mode, high) as multipliers of each component's
+# yearly values; sampled from triangular distributions.
+UNCERTAINTY_RANGES = {
+    "construction_cost":     (0.90, 1.0, 1.30),
+    "maintenance_cost":      (0.70, 1.0, 1.50),
+    "road_user_cost":        (0.70, 1.0, 1.60),
+    "end_of_life_cost":      (0.70, 1.0, 1.50),
+    "social_cost_of_carbon": (0.50, 1.0, 2.00),
+}
+# Spread of the discount rate (percentage points either side of the input)
+DISCOUNT_RATE_SPREAD = 2.0
+
+# Engine-side defaults for inputs the user has not filled in yet.
+# Mirrors the defaults of the corresponding GUI forms.
+DEFAULT_INPUTS = {
+    "general_info": {
+        "country": "India",
+    },
+    "bridge_data": {
+        "bridge_type": "Beam",
+        "primary_material": "RCC",
+        "bridge_length": "",
+        "deck_width": "",
+    },
+    "financial_data": {
+        "discount_rate": "6.70",
+        "design_life": "50",
+        "duration_of_construction": "",
+        "analysis_period": "50",
+    },
+}
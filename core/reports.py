@@ -0,0 +1,402 @@
+"""
+LCCA report generation: Excel workbooks and PDF reports.
+
+Reports are built in a separate "spawn" worker process (see ReportJob) so
+that large projects never block the GUI. The worker reports through a queue:
+  ("progress", done, total, text)
+  ("done", path) | ("error", message) | ("cancelled",)
+A cancelled worker that does not stop within CANCEL_GRACE seconds (e.g.
+while still evaluating the project) is terminated.
+
+Excel workbooks are written with xlsxwriter in constant-memory mode (rows are
+streamed to disk as they are written). Charts are rendered once with
+matplotlib and cached as PNG files keyed by a digest of the plotted data, so
+re-exporting an unchanged project reuses them. Both packages are optional;
+matplotlib is only imported inside the worker process.
+"""
+
+import os
+import re
+import time
+import hashlib
+import datetime
+import tempfile
+import multiprocessing
+import queue as queue_module
+
+import numpy as np
+
+from core.calculation import total_cost, EMISSION_COMPONENTS, COMPONENT_LABELS
+from core.scenarios import evaluate_yearly
+
+try:
+    import xlsxwriter
+except ImportError:  # optional: Excel export
+    xlsxwriter = None
+
+
+REPORT_KINDS = {".xlsx": "excel", ".pdf": "pdf"}
+
+# Year rows per PDF table page
+ROWS_PER_PAGE = 40
+# Minimum seconds between progress messages
+PROGRESS_INTERVAL = 0.1
+CHART_DPI = 120
+# Chart cache used when the caller does not give one
+DEFAULT_CHART_CACHE = os.path.join(tempfile.gettempdir(), "lcca_charts")
+# Seconds a cancelled worker gets to stop on its own before it is terminated
+CANCEL_GRACE = 1.0
+
+
+class ReportCancelled(Exception):
+    pass
+
+
+def _matplotlib():
+    """Returns (pyplot, PdfPages), importing matplotlib on first use."""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        from matplotlib import pyplot
+        from matplotlib.backends.backend_pdf import PdfPages
+    except ImportError:
+        raise RuntimeError("PDF export and charts require the 'matplotlib' package.")
+    return pyplot, PdfPages
+
+
+# ---------------------------------------------------------------------------
+# Report data
+# ---------------------------------------------------------------------------
+
+def cash_flow_rows(results, discount):
+    """
+    Year-by-year rows for one scenario:
+    (year, [yearly value per component], undiscounted cost, discounted cost).
+    """
+    names = list(results)
+    yearly = np.column_stack([results[n]["yearly"] for n in names])
+    cost_cols = [i for i, n in enumerate(names) if n not in EMISSION_COMPONENTS]
+    cost = yearly[:, cost_cols].sum(axis=1)
+    discounted = cost * discount
+    for year in range(len(cost)):
+        yield year + 1, yearly[year].tolist(), float(cost[year]), float(discounted[year])
+
+
+def report_steps(evaluated):
+    """Number of progress steps a report on ``evaluated`` takes."""
+    return 1 + len(evaluated) + sum(len(discount) for _, _, discount in evaluated)
+
+
+# ---------------------------------------------------------------------------
+# Progress / cancellation
+# ---------------------------------------------------------------------------
+
+class Progress:
+    """Throttled progress reporting that also checks for cancellation."""
+
+    def __init__(self, queue, cancel_event, total):
+        self.queue = queue
+        self.cancel_event = cancel_event
+        self.total = max(total, 1)
+        self.done = 0
+        self._last = 0.0
+
+    def step(self, text, n=1):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ReportCancelled()
+        self.done += n
+        now = time.monotonic()
+        due = now - self._last >= PROGRESS_INTERVAL or self.done >= self.total
+        if self.queue is not None and due:
+            self._last = now
+            self.queue.put(("progress", min(self.done, self.total), self.total, text))
+
+
+# ---------------------------------------------------------------------------
+# Charts (cached)
+# ---------------------------------------------------------------------------
+
+def chart_path(cache_dir, name, results):
+    """
+    Renders the cash-flow chart of one scenario, or returns the cached PNG
+    when the same data was plotted before.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(name.encode("utf-8"))
+    for n, r in results.items():
+        digest.update(n.encode("utf-8"))
+        digest.update(np.ascontiguousarray(r["yearly"], dtype=float).tobytes())
+    path = os.path.join(cache_dir, f"{digest.hexdigest()}.png")
+    if os.path.exists(path):
+        return path
+
+    plt, _ = _matplotlib()
+    os.makedirs(cache_dir, exist_ok=True)
+    fig, (ax_cost, ax_em) = plt.subplots(2, 1, figsize=(9, 6), sharex=True)
+    years = np.arange(1, len(next(iter(results.values()))["yearly"]) + 1)
+    bottom = np.zeros(len(years))
+    for n, r in results.items():
+        if n in EMISSION_COMPONENTS:
+            ax_em.bar(years, r["yearly"], label=COMPONENT_LABELS.get(n, n))
+        else:
+            ax_cost.bar(years, r["yearly"], bottom=bottom, label=COMPONENT_LABELS.get(n, n))
+            bottom = bottom + r["yearly"]
+    ax_cost.set_title(f"{name}: yearly cash flows (undiscounted)")
+    ax_cost.legend(fontsize=8)
+    ax_em.set_title(f"{name}: yearly emissions")
+    ax_em.set_xlabel("Year")
+    ax_em.legend(fontsize=8)
+    fig.tight_layout()
+    tmp_path = path + ".tmp.png"
+    fig.savefig(tmp_path, dpi=CHART_DPI)
+    plt.close(fig)
+    os.replace(tmp_path, path)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Excel
+# ---------------------------------------------------------------------------
+
+def _sheet_name(name, used):
+    base = re.sub(r"[\[\]:*?/\\]", "_", name)[:31] or "Sheet"
+    candidate, i = base, 2
+    while candidate.lower() in used:
+        suffix = f" ({i})"
+        candidate = base[: 31 - len(suffix)] + suffix
+        i += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def write_excel(path, project, evaluated, cache_dir=None, progress=None):
+    """Summary sheet plus one year-by-year sheet per scenario."""
+    if xlsxwriter is None:
+        raise RuntimeError("Excel export requires the 'xlsxwriter' package.")
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    try:
+        bold = workbook.add_format({"bold": True})
+        money = workbook.add_format({"num_format": "#,##0"})
+        tonnes = workbook.add_format({"num_format": "#,##0.00"})
+        used = set()
+
+        summary = workbook.add_worksheet(_sheet_name("Summary", used))
+        names = [name for name, _, _ in evaluated]
+        components = list(evaluated[0][1])
+        summary.write_row(0, 0, ["Component"] + names, bold)
+        for row, component in enumerate(components, start=1):
+            summary.write(row, 0, COMPONENT_LABELS.get(component, component))
+            fmt = tonnes if component in EMISSION_COMPONENTS else money
+            for col, (_, results, _) in enumerate(evaluated, start=1):
+                summary.write_number(row, col, results[component]["total"], fmt)
+        row = len(components) + 1
+        summary.write(row, 0, COMPONENT_LABELS["total_cost"], bold)
+        for col, (_, results, _) in enumerate(evaluated, start=1):
+            summary.write_number(row, col, total_cost(results), money)
+        summary.set_column(0, 0, 32)
+        summary.set_column(1, len(names), 18)
+        if progress:
+            progress.step("Summary")
+
+        chart_row = row + 3
+        for name, results, _ in evaluated:
+            try:
+                png = chart_path(cache_dir or DEFAULT_CHART_CACHE, name, results)
+            except RuntimeError:
+                png = None  # no matplotlib: workbook without charts
+            if png:
+                summary.insert_image(chart_row, 0, png)
+                chart_row += 32
+            if progress:
+                progress.step(f"Chart: {name}")
+
+        for name, results, discount in evaluated:
+            sheet = workbook.add_worksheet(_sheet_name(name, used))
+            header = ["Year"] + [COMPONENT_LABELS.get(c, c) for c in results]
+            header += ["Total Cost (INR)", "Discounted Cost (INR)"]
+            sheet.write_row(0, 0, header, bold)
+            formats = [tonnes if c in EMISSION_COMPONENTS else money for c in results]
+            for year, values, cost, discounted in cash_flow_rows(results, discount):
+                sheet.write_number(year, 0, year)
+                for col, (value, fmt) in enumerate(zip(values, formats), start=1):
+                    sheet.write_number(year, col, value, fmt)
+                sheet.write_number(year, len(values) + 1, cost, money)
+                sheet.write_number(year, len(values) + 2, discounted, money)
+                if progress:
+                    progress.step(f"Cash flows: {name}")
+            sheet.set_column(1, len(header) - 1, 20)
+    finally:
+        workbook.close()
+
+
+# ---------------------------------------------------------------------------
+# PDF
+# ---------------------------------------------------------------------------
+
+def _text_page(plt, pdf, lines):
+    fig = plt.figure(figsize=(8.27, 11.69))  # A4 portrait
+    fig.text(0.08, 0.94, lines[0], fontsize=18, weight="bold", va="top")
+    fig.text(0.08, 0.88, "\n".join(lines[1:]), fontsize=10, va="top", family="monospace")
+    pdf.savefig(fig)
+    plt.close(fig)
+
+
+def _image_page(plt, pdf, png_path):
+    fig = plt.figure(figsize=(11.69, 8.27))  # A4 landscape
+    ax = fig.add_axes([0.03, 0.03, 0.94, 0.94])
+    ax.imshow(plt.imread(png_path))
+    ax.axis("off")
+    pdf.savefig(fig)
+    plt.close(fig)
+
+
+def _table_page(plt, pdf, title, header, rows):
+    fig = plt.figure(figsize=(11.69, 8.27))
+    fig.text(0.03, 0.97, title, fontsize=12, weight="bold", va="top")
+    ax = fig.add_axes([0.03, 0.03, 0.94, 0.9])
+    ax.axis("off")
+    table = ax.table(cellText=rows, colLabels=header, loc="upper center", cellLoc="right")
+    table.auto_set_font_size(False)
+    table.set_fontsize(7)
+    pdf.savefig(fig)
+    plt.close(fig)
+
+
+def write_pdf(path, project, evaluated, cache_dir=None, progress=None):
+    """Summary page, then per scenario a chart page and year-by-year table pages."""
+    plt, PdfPages = _matplotlib()
+    meta = project.get("metadata", {})
+    with PdfPages(path) as pdf:
+        lines = [
+            f"LCCA Report: {meta.get('project_name', '')}",
+            f"Generated: {datetime.datetime.now():%Y-%m-%d %H:%M}",
+            "",
+        ]
+        for name, results, discount in evaluated:
+            lines.append(name)
+            for component, r in results.items():
+                label = COMPONENT_LABELS.get(component, component)
+                lines.append(f"  {label:<36}{r['total']:>20,.0f}")
+            lines.append(f"  {COMPONENT_LABELS['total_cost']:<36}{total_cost(results):>20,.0f}")
+            lines.append("")
+        _text_page(plt, pdf, lines)
+        if progress:
+            progress.step("Summary")
+
+        for name, results, _ in evaluated:
+            _image_page(plt, pdf, chart_path(cache_dir or DEFAULT_CHART_CACHE, name, results))
+            if progress:
+                progress.step(f"Chart: {name}")
+
+        for name, results, discount in evaluated:
+            header = ["Year"] + [COMPONENT_LABELS.get(c, c) for c in results]
+            header += ["Total Cost", "Discounted Cost"]
+            page = []
+            for year, values, cost, discounted in cash_flow_rows(results, discount):
+                page.append([str(year)] + [f"{v:,.0f}" for v in values + [cost, discounted]])
+                if len(page) == ROWS_PER_PAGE:
+                    _table_page(plt, pdf, f"{name}: cash flows and emissions", header, page)
+                    page = []
+                if progress:
+                    progress.step(f"Cash flows: {name}")
+            if page:
+                _table_page(plt, pdf, f"{name}: cash flows and emissions", header, page)
+
+
+WRITERS = {"excel": write_excel, "pdf": write_pdf}
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+def part_path(path):
+    """Temporary file a report is written to before it replaces ``path``."""
+    return f"{path}.part{os.path.splitext(path)[1]}"
+
+
+def generate_report(kind, path, project, cache_dir=None, queue=None, cancel_event=None):
+    """
+    Writes a report to ``path`` (via a temporary file, replaced on success).
+    Returns ``path``; raises ReportCancelled if ``cancel_event`` is set.
+    """
+    # Report processes are daemonic and cannot start the scheduler's pool
+    evaluated = evaluate_yearly(project, parallel=False)
+    progress = Progress(queue, cancel_event, report_steps(evaluated))
+    tmp_path = part_path(path)
+    try:
+        WRITERS[kind](tmp_path, project, evaluated, cache_dir, progress)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+def _worker(kind, path, project, cache_dir, queue, cancel_event):
+    try:
+        queue.put(("done", generate_report(kind, path, project, cache_dir, queue, cancel_event)))
+    except ReportCancelled:
+        queue.put(("cancelled",))
+    except Exception as e:
+        queue.put(("error", str(e)))
+
+
+class ReportJob:
+    """
+    A report being generated in its own process. Starting the process
+    pickles ``project``, so create jobs off the GUI thread.
+    """
+
+    def __init__(self, kind, path, project, cache_dir=None):
+        # "spawn" keeps the worker from inheriting the Qt state of the GUI process
+        ctx = multiprocessing.get_context("spawn")
+        self.kind = kind
+        self.path = path
+        self.queue = ctx.Queue()
+        self.cancel_event = ctx.Event()
+        self._cancel_deadline = None
+        self.process = ctx.Process(
+            target=_worker,
+            args=(kind, path, project, cache_dir, self.queue, self.cancel_event),
+            daemon=True,
+        )
+        self.process.start()
+
+    def cancel(self):
+        """Asks the worker to stop; poll() terminates it if it is still running after CANCEL_GRACE."""
+        if self._cancel_deadline is None:
+            self.cancel_event.set()
+            self._cancel_deadline = time.monotonic() + CANCEL_GRACE
+
+    def poll(self):
+        """
+        Drains pending messages. If the worker died without a final message,
+        an ("error", ...) message is appended; a cancelled worker still
+        running after CANCEL_GRACE is terminated and ("cancelled",) appended.
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(self.queue.get_nowait())
+            except queue_module.Empty:
+                break
+        if any(m[0] != "progress" for m in messages):
+            return messages
+        overdue = self._cancel_deadline is not None and time.monotonic() >= self._cancel_deadline
+        if overdue and self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+            if os.path.exists(part_path(self.path)):
+                os.remove(part_path(self.path))
+            messages.append(("cancelled",))
+        elif not self.process.is_alive():
+            # Messages can still be in flight right after the process exits
+            try:
+                messages.append(self.queue.get(timeout=0.5))
+            except queue_module.Empty:
+                messages.append(("error", "Report worker exited unexpectedly."))
+        return messages
+
+    def join(self, timeout=None):
+        self.process.join(timeout)
@@ -0,0 +1,151 @@
+"""
+Calculated results stored next to project.json, outside the JSON autosave.
+
+projects/<id>/results/<inputs hash>/ holds one complete set of results:
+  manifest.json   scenarios, components, units, years per scenario
+  yearly.npy      (scenarios, components, years) float64, NaN past a
+                  scenario's own analysis period
+  totals.npy      (scenarios, components)
+  discount.npy    (scenarios, years)
+  charts.npy      (charts, scenarios, years) series of core.charts.SERIES_CHARTS
+  band.npy        (3, years) Monte Carlo 5/50/95 percentiles of the base design
+
+Arrays are memory-mapped on read, so a reader touches only the slices it
+uses: the Outputs charts read one charts.npy row per scenario and the band,
+never the per-component arrays. The directory name is a hash of the inputs (ProjectModel.inputs_key),
+which is what invalidates results: after any input change load() misses
+until the new results are saved. A set is written to a temporary directory
+and renamed into place, never modified afterwards; older sets are removed
+by the next save (a set still mapped elsewhere is left for a later save).
+"""
+
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+
+from core.charts import SERIES_CHARTS, chart_band
+
+RESULTS_DIR = "results"
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 2
+
+
+def inputs_hash(inputs_key):
+    """Directory name of the results for ``inputs_key`` (see ProjectModel.inputs_key)."""
+    return hashlib.sha1(repr(inputs_key).encode()).hexdigest()
+
+
+class StoredResults:
+    """One memory-mapped result set (see load)."""
+
+    def __init__(self, path, manifest):
+        self.path = path
+        self.scenarios = manifest["scenarios"]
+        self.components = manifest["components"]
+        self.units = manifest["units"]
+        self.years = manifest["years"]
+        self.charts = manifest["charts"]
+
+        def mapped(name):
+            return np.load(os.path.join(path, name), mmap_mode="r")
+
+        self.yearly = mapped("yearly.npy")
+        self.totals = mapped("totals.npy")
+        self.discount = mapped("discount.npy")
+        self.chart_rows = mapped("charts.npy")
+        self.band = mapped("band.npy")
+
+    def series(self, s, component, start=0, stop=None):
+        """Yearly values of one component of scenario number ``s``, years [start, stop)."""
+        stop = self.years[s] if stop is None else min(stop, self.years[s])
+        return self.yearly[s, self.components.index(component), start:stop]
+
+    def chart_series(self, chart, s):
+        """Full-resolution series of scenario number ``s`` in one chart (a view of charts.npy)."""
+        return self.chart_rows[self.charts.index(chart), s, :self.years[s]]
+
+
+class ResultsStore:
+    """The results/ directory of one project."""
+
+    def __init__(self, project_dir):
+        self.path = os.path.join(project_dir, RESULTS_DIR)
+
+    def load(self, inputs_key):
+        """The stored results of ``inputs_key``, or None if they were never saved."""
+        path = os.path.join(self.path, inputs_hash(inputs_key))
+        try:
+            with open(os.path.join(path, MANIFEST), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != FORMAT_VERSION:
+                return None
+            return StoredResults(path, manifest)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, inputs_key, evaluated, raw):
+        """
+        Stores ``evaluated`` ([(scenario, results, discount)]) and its
+        complete ``raw`` charts (core.charts, with the uncertainty band)
+        under ``inputs_key``. Returns the result directory.
+        """
+        name = inputs_hash(inputs_key)
+        final = os.path.join(self.path, name)
+        if os.path.exists(os.path.join(final, MANIFEST)):
+            return final  # identical inputs give identical results
+
+        components = list(evaluated[0][1])
+        years = [len(discount) for _, _, discount in evaluated]
+        shape = (len(evaluated), len(components), max(years))
+        yearly = np.full(shape, np.nan)
+        totals = np.zeros(shape[:2])
+        discount = np.full((len(evaluated), shape[2]), np.nan)
+        for s, (_, results, factors) in enumerate(evaluated):
+            for c, component in enumerate(components):
+                yearly[s, c, :years[s]] = results[component]["yearly"]
+                totals[s, c] = results[component]["total"]
+            discount[s, :years[s]] = factors
+        charts = np.full((len(SERIES_CHARTS),) + shape[::2], np.nan)
+        for c, chart in enumerate(SERIES_CHARTS):
+            for s, (_, _, y) in enumerate(raw[chart]["series"]):
+                charts[c, s, :len(y)] = y
+
+        tmp = os.path.join(self.path, f".{name}.part")
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            for filename, array in (
+                ("yearly.npy", yearly), ("totals.npy", totals),
+                ("discount.npy", discount), ("charts.npy", charts),
+                ("band.npy", np.vstack(chart_band(raw))),
+            ):
+                np.save(os.path.join(tmp, filename), array)
+            manifest = {
+                "version": FORMAT_VERSION,
+                "scenarios": [scenario for scenario, _, _ in evaluated],
+                "components": components,
+                "units": [evaluated[0][1][c]["unit"] for c in components],
+                "years": years,
+                "charts": list(SERIES_CHARTS),
+            }
+            with open(os.path.join(tmp, MANIFEST), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            shutil.rmtree(final, ignore_errors=True)  # incomplete leftover
+            os.replace(tmp, final)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.prune(keep=name)
+        return final
+
+    def prune(self, keep=None):
+        """Removes every result set but ``keep``; sets still in use are skipped."""
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name != keep and not name.startswith("."):
+                shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
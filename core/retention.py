@@ -0,0 +1,201 @@
+"""
+Checkpoint retention and disk-usage reporting.
+
+Policy (stored per project in metadata["retention"], DEFAULT_POLICY otherwise):
+  - keep_last: the N most recent checkpoints
+  - daily / weekly / monthly: the newest checkpoint of each of the last
+    N days / ISO weeks / months that have checkpoints
+Named checkpoints (any name other than the automatic ones) are pinned and
+never pruned.
+
+Pruning and usage scans run on the maintenance worker
+(core.persistence.submit_maintenance).
+"""
+
+import os
+import json
+import datetime
+
+DEFAULT_POLICY = {"keep_last": 10, "daily": 7, "weekly": 4, "monthly": 12}
+
+# Names given by the application rather than the user; these are prunable
+AUTO_CHECKPOINT_NAMES = {"Backup", "Manual_Backup", "Pre_Restore_State"}
+
+# Projects larger than this are flagged on the dashboard
+PROJECT_SIZE_BUDGET = 500 * 1024 ** 2
+
+# Per-project usage of the whole projects/ tree, refreshed in the background
+USAGE_CACHE = ".usage.json"
+
+# ---------------------------------------------------------------------------
+# Policy
+# ---------------------------------------------------------------------------
+
+def parse_checkpoint(filename):
+    """Returns (name, datetime) for a Name__YYYYMMDDHHMMSS.json file, or None."""
+    parts = filename[:-len(".json")].split("__") if filename.endswith(".json") else []
+    if len(parts) != 2:
+        return None
+    try:
+        return parts[0], datetime.datetime.strptime(parts[1], "%Y%m%d%H%M%S")
+    except ValueError:
+        return None
+
+
+def select_kept(filenames, policy):
+    """Returns the set of checkpoint filenames the policy keeps."""
+    policy = {**DEFAULT_POLICY, **(policy or {})}
+    parsed = []
+    kept = set()
+    for f in filenames:
+        info = parse_checkpoint(f)
+        if info is None:
+            kept.add(f)  # unknown naming: never touch
+        else:
+            parsed.append((info[1], info[0], f))
+    parsed.sort(reverse=True)  # newest first
+
+    for _, name, f in parsed:
+        if name not in AUTO_CHECKPOINT_NAMES:
+            kept.add(f)  # pinned
+    kept.update(f for _, _, f in parsed[: policy["keep_last"]])
+
+    buckets = [
+        ("daily", lambda ts: ts.date()),
+        ("weekly", lambda ts: ts.isocalendar()[:2]),
+        ("monthly", lambda ts: (ts.year, ts.month)),
+    ]
+    for key, bucket_of in buckets:
+        seen = set()
+        for ts, _, f in parsed:
+            bucket = bucket_of(ts)
+            if bucket in seen:
+                continue
+            if len(seen) >= policy[key]:
+                break
+            seen.add(bucket)
+            kept.add(f)  # newest checkpoint of this bucket
+    return kept
+
+
+def prune_checkpoints(persistence, policy=None, dry_run=False):
+    """
+    Deletes the checkpoints the policy does not keep.
+    Returns {"deleted": [filenames], "freed": bytes, "kept": count}.
+    """
+    cp_dir = persistence.checkpoint_dir
+    if not os.path.exists(cp_dir):
+        return {"deleted": [], "freed": 0, "kept": 0}
+
+    files = [f for f in os.listdir(cp_dir) if f.endswith(".json")]
+    kept = select_kept(files, policy)
+    deleted, freed = [], 0
+    for f in files:
+        if f in kept:
+            continue
+        path = os.path.join(cp_dir, f)
+        try:
+            size = os.path.getsize(path)
+            if not dry_run:
+                os.remove(path)
+        except OSError as e:
+            print(f"Prune error: {e}")
+            continue
+        deleted.append(f)
+        freed += size
+    if deleted and not dry_run:
+        persistence.forget_checkpoints(deleted)
+    return {"deleted": deleted, "freed": freed, "kept": len(kept)}
+
+
+def maintain(persistence, policy=None):
+    """Prunes one project, then refreshes its entry in the usage cache."""
+    result = prune_checkpoints(persistence, policy)
+    update_usage(os.path.dirname(persistence.base_path), persistence.project_id)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Disk usage
+# ---------------------------------------------------------------------------
+
+def _dir_size(path):
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    total += _dir_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return total
+
+
+def project_usage(project_dir):
+    """Bytes used by a project folder: {"total", "checkpoints", "profiles", "other"}."""
+    usage = {"checkpoints": 0, "profiles": 0, "other": 0}
+    try:
+        with os.scandir(project_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    key = entry.name if entry.name in usage else "other"
+                    usage[key] += _dir_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    usage["other"] += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    usage["total"] = sum(usage.values())
+    return usage
+
+
+def tree_usage(projects_dir):
+    """
+    Usage of every project under ``projects_dir`` ({p_id: usage}).
+    The result is also written to the usage cache read by the dashboard.
+    """
+    usage = {}
+    if not os.path.exists(projects_dir):
+        return usage
+    for p_id in os.listdir(projects_dir):
+        p_path = os.path.join(projects_dir, p_id)
+        if not p_id.startswith(".") and os.path.isdir(p_path):
+            usage[p_id] = project_usage(p_path)
+    _write_usage_cache(projects_dir, usage)
+    return usage
+
+
+def _write_usage_cache(projects_dir, usage):
+    try:
+        tmp_path = os.path.join(projects_dir, USAGE_CACHE + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(usage, f)
+        os.replace(tmp_path, os.path.join(projects_dir, USAGE_CACHE))
+    except OSError as e:
+        print(f"Usage cache error: {e}")
+
+
+def update_usage(projects_dir, p_id):
+    """Recomputes the usage of one project in the usage cache. Returns its usage."""
+    usage = load_usage_cache(projects_dir)
+    usage[p_id] = project_usage(os.path.join(projects_dir, p_id))
+    _write_usage_cache(projects_dir, usage)
+    return usage[p_id]
+
+
+def load_usage_cache(projects_dir):
+    """Last usage computed by tree_usage ({} if none yet)."""
+    try:
+        with open(os.path.join(projects_dir, USAGE_CACHE), "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def human_size(n_bytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n_bytes < 1024:
+            return f"{n_bytes:.0f} {unit}" if unit == "B" else f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
+    return f"{n_bytes:.1f} TB"
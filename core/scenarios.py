@@ -0,0 +1,140 @@
+"""
+Design alternatives ("scenarios") for a project.
+
+A scenario stores only the inputs it overrides, e.g.
+    {"bridge_data": {"bridge_type": "Arch", "primary_material": "Steel"}}
+Resolving it against the base project builds a new top-level dict in which
+only the overridden sections are new objects; every other section is the
+base project's own dict (structural sharing, no deep copies).
+
+Results are keyed by scenario name, so names are unique and never
+BASE_SCENARIO: the dialog rejects such names (name_error) and
+load_scenarios renames clashing ones in files that have them.
+"""
+
+from functools import partial
+
+from core.calculation import build_context, run_calculation, total_cost
+from core.scheduler import run_jobs
+
+BASE_SCENARIO = "Base"
+
+
+class Scenario:
+    def __init__(self, name, overrides=None):
+        self.name = name
+        self.overrides = overrides or {}
+
+    def resolve(self, base):
+        """Returns the scenario inputs, sharing untouched sections with ``base``."""
+        resolved = dict(base)
+        for section, values in self.overrides.items():
+            resolved[section] = {**base.get(section, {}), **values}
+        return resolved
+
+    def to_dict(self):
+        return {"name": self.name, "overrides": self.overrides}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("name", "Scenario"), data.get("overrides", {}))
+
+
+def name_error(name, taken):
+    """Why ``name`` cannot name a new alternative (None if it can); ``taken``: existing names."""
+    if not name:
+        return "Enter a name for the alternative."
+    if name == BASE_SCENARIO:
+        return f'"{BASE_SCENARIO}" is the name of the base design.'
+    if name in taken:
+        return f'An alternative named "{name}" already exists.'
+    return None
+
+
+def load_scenarios(stored):
+    """
+    Scenarios of the stored dicts, in order. Blank names, duplicates and
+    BASE_SCENARIO get a numbered name ("Steel (2)"), so every name is unique.
+    """
+    scenarios, taken = [], {BASE_SCENARIO}
+    for data in stored:
+        scenario = Scenario.from_dict(data)
+        name = str(scenario.name).strip() or "Alternative"
+        unique, n = name, 2
+        while unique in taken:
+            unique, n = f"{name} ({n})", n + 1
+        scenario.name = unique
+        taken.add(unique)
+        scenarios.append(scenario)
+    return scenarios
+
+
+def evaluate_scenarios(base, scenarios, max_workers=None):
+    """
+    Evaluates the base project and every scenario concurrently, as one task
+    graph over the process pool of core.scheduler (scenarios sharing the base
+    BOQ share its columns).
+    Returns {scenario_name: {"components": {name: total}, "total_cost": float}},
+    with the base project first under BASE_SCENARIO.
+    """
+    jobs = [(BASE_SCENARIO, base)] + [(s.name, s.resolve(base)) for s in scenarios]
+    outputs = run_jobs([inputs for _, inputs in jobs], max_workers)
+    return {
+        name: {
+            "components": {component: r["total"] for component, r in results.items()},
+            "total_cost": total_cost(results),
+        }
+        for (name, _), results in zip(jobs, outputs)
+    }
+
+
+def scenario_jobs(project):
+    """[(scenario_name, inputs)] of the base project and every stored scenario, base first."""
+    scenarios = load_scenarios(project.get("scenarios", []))
+    return [(BASE_SCENARIO, project)] + [(s.name, s.resolve(project)) for s in scenarios]
+
+
+def evaluate_yearly(project, on_result=None, parallel=True):
+    """
+    Full results (with yearly values) of the base project and every stored
+    scenario, as one task graph over the process pool of core.scheduler
+    (``parallel=False``: one after the other in this process).
+    Returns [(scenario_name, results, discount_factors)], base project first.
+    ``on_result(index, name, result)`` is called as each component of job
+    ``index`` (position in the result) finishes, as in core.scheduler.run_jobs.
+    """
+    jobs = scenario_jobs(project)
+    if parallel:
+        outputs = run_jobs([inputs for _, inputs in jobs], on_result=on_result)
+    else:
+        outputs = [
+            run_calculation(inputs, on_result=on_result and partial(on_result, index))
+            for index, (_, inputs) in enumerate(jobs)
+        ]
+    return [
+        (name, results, build_context(inputs)["discount"])
+        for (name, inputs), results in zip(jobs, outputs)
+    ]
+
+
+def compare(evaluated, baseline=BASE_SCENARIO):
+    """
+    Builds side-by-side comparison rows against ``baseline``.
+    Each row: (label, {scenario_name: (value, delta)}), the last row being the total cost.
+    """
+    base = evaluated[baseline]
+    rows = []
+    for component in base["components"]:
+        cells = {}
+        for name, result in evaluated.items():
+            value = result["components"][component]
+            cells[name] = (value, value - base["components"][component])
+        rows.append((component, cells))
+    rows.append((
+        "total_cost",
+        {
+            name: (result["total_cost"], result["total_cost"] - base["total_cost"])
+            for name, result in evaluated.items()
+        },
+    ))
+    return rows
@@ -0,0 +1,234 @@
+"""
+Parallel calculation runs as a task graph over a process pool.
+
+A run splits into branches: components grouped in COMPONENT_BRANCHES share
+context intermediates (BOQ emissions, end-of-life flows) and run together,
+every other independent component is a branch of its own. The branches of
+every job (a project, or each scenario of one) are independent tasks;
+components listed in COMPONENT_DEPENDENCIES (social cost of carbon) run in
+the parent once the results they read have been merged.
+
+Large inputs never go through pickle whole. The parent builds each job's
+context; the BOQ columns (once per distinct BOQ list, see core.boq_emissions)
+are converted in slices across the pool when the BOQ has PARALLEL_BOQ_ITEMS
+or more items: the parent only gathers the raw values of every item, each
+worker converts one slice. Every array of SHARED_MIN_BYTES or more is then
+placed in a multiprocessing.shared_memory block, once per array object. A task carries
+the block names, shapes and dtypes plus the input sections its components
+read (COMPONENT_INPUTS, minus the BOQ itself); workers map the blocks
+read-only. The blocks are unlinked as soon as the run is merged.
+"""
+
+import os
+import multiprocessing
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import suppress
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.boq_emissions import convert_columns
+from core.calculation import (
+    COMPONENTS, COMPONENT_INPUTS, COMPONENT_DEPENDENCIES, COMPONENT_BRANCHES,
+    build_context, boq_columns,
+)
+from core.tracing import tracer
+
+# Smaller arrays are cheaper to pickle than to map
+SHARED_MIN_BYTES = 64 * 1024
+# Smaller BOQs are converted in the parent: a slice task would cost more than it saves
+PARALLEL_BOQ_ITEMS = 20_000
+
+_Shared = namedtuple("_Shared", "name shape dtype")
+
+_pool = None
+_pool_workers = 1
+_pool_lock = threading.Lock()
+
+
+def get_pool(max_workers=None):
+    """
+    The scheduler's process pool, started on first use and kept for later
+    runs (``max_workers`` applies when it starts).
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None:
+            _pool_workers = max_workers or os.cpu_count() or 1
+            # "spawn" keeps workers from inheriting the Qt state of the GUI process
+            _pool = ProcessPoolExecutor(
+                max_workers=_pool_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def shutdown():
+    """Stops the worker processes (a later run starts a new pool)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def branches():
+    """[(branch, [component names])] of the components without dependencies, in COMPONENTS order."""
+    groups = {}
+    for name, _ in COMPONENTS:
+        if name not in COMPONENT_DEPENDENCIES:
+            groups.setdefault(COMPONENT_BRANCHES.get(name, name), []).append(name)
+    return list(groups.items())
+
+
+def _boq_converter(pool):
+    """
+    A boq_factors ``convert`` that converts a large BOQ in one slice per
+    worker of ``pool`` (see the module docstring).
+    """
+    def convert(columns):
+        n = len(columns["material"])
+        if _pool_workers < 2 or n < PARALLEL_BOQ_ITEMS:
+            return convert_columns(columns)
+        bounds = np.linspace(0, n, _pool_workers + 1).astype(int)
+        with tracer.span("calc.boq_slices", items=n, slices=_pool_workers):
+            futures = [
+                pool.submit(convert_columns, {key: values[a:b] for key, values in columns.items()})
+                for a, b in zip(bounds[:-1], bounds[1:])
+            ]
+            parts = [future.result() for future in futures]
+        return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+    return convert
+
+
+# ---------------------------------------------------------------------------
+# Shared memory
+# ---------------------------------------------------------------------------
+
+class _SharedArrays:
+    """Shared memory blocks of one run: pack() publishes arrays, release() unlinks them."""
+
+    def __init__(self):
+        self.blocks = []
+        self._published = {}  # id(array) -> _Shared (arrays are kept alive by the contexts)
+
+    def pack(self, value):
+        """``value`` with every large array (also inside dicts) replaced by a _Shared descriptor."""
+        if isinstance(value, dict):
+            return {k: self.pack(v) for k, v in value.items()}
+        if not isinstance(value, np.ndarray) or value.nbytes < SHARED_MIN_BYTES:
+            return value
+        shared = self._published.get(id(value))
+        if shared is None:
+            block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+            self.blocks.append(block)
+            np.ndarray(value.shape, value.dtype, buffer=block.buf)[...] = value
+            shared = _Shared(block.name, value.shape, value.dtype.str)
+            self._published[id(value)] = shared
+        return shared
+
+    def release(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks.clear()
+        self._published.clear()
+
+
+def _unpack(value, blocks):
+    """Inverse of _SharedArrays.pack in a worker; mapped blocks are appended to ``blocks``."""
+    if isinstance(value, dict):
+        return {k: _unpack(v, blocks) for k, v in value.items()}
+    if not isinstance(value, _Shared):
+        return value
+    block = shared_memory.SharedMemory(name=value.name)
+    blocks.append(block)
+    array = np.ndarray(value.shape, np.dtype(value.dtype), buffer=block.buf)
+    array.setflags(write=False)
+    return array
+
+
+def _run_branch(names, inputs, packed_ctx):
+    """Worker task: the components ``names`` of one job against its shared context."""
+    blocks = []
+    ctx = _unpack(packed_ctx, blocks)
+    ctx["results"] = {}
+    functions = dict(COMPONENTS)
+    try:
+        return {name: functions[name](inputs, ctx) for name in names}
+    finally:
+        del ctx
+        for block in blocks:
+            with suppress(BufferError):  # a result still viewing the block; closed on collection
+                block.close()
+
+
+# ---------------------------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------------------------
+
+def run_jobs(jobs, max_workers=None, reuse=None, on_result=None):
+    """
+    Runs every job (project inputs) through the task graph.
+    Returns one {component_name: result_dict} per job, like run_calculation.
+
+    ``reuse`` optionally gives, per job, results to keep instead of
+    recomputing (components absent from it are computed).
+    ``on_result(index, name, result)`` is called in the calling thread as
+    each computed component of job ``index`` arrives; an exception it raises
+    aborts the run and cancels the tasks not yet started.
+    """
+    reuse = reuse or [{} for _ in jobs]
+    shared = _SharedArrays()
+    pool = get_pool(max_workers)
+    convert = _boq_converter(pool)
+    with tracer.span("calc.parallel", jobs=len(jobs)):
+        tasks = {}
+        try:
+            contexts = []
+            for index, inputs in enumerate(jobs):
+                with tracer.span("calc.context"):
+                    ctx = build_context(inputs)
+                    boq_columns(inputs, ctx, convert)
+                contexts.append(ctx)
+                packed = None
+                for _, names in branches():
+                    names = [n for n in names if n not in reuse[index]]
+                    if not names:
+                        continue
+                    if packed is None:
+                        packed = shared.pack(ctx)
+                    sections = set().union(*(COMPONENT_INPUTS.get(n, set()) for n in names))
+                    sections.discard("boq")  # read through the shared BOQ columns
+                    branch_inputs = {s: inputs[s] for s in sections if s in inputs}
+                    tasks[pool.submit(_run_branch, names, branch_inputs, packed)] = index
+
+            merged = [{} for _ in jobs]
+            for future in as_completed(tasks):
+                index = tasks[future]
+                merged[index].update(future.result())
+                if on_result is not None:
+                    for name, result in future.result().items():
+                        on_result(index, name, result)
+        finally:
+            for future in tasks:
+                future.cancel()
+            shared.release()
+
+        outputs = []
+        for index, (inputs, ctx, done, kept) in enumerate(zip(jobs, contexts, merged, reuse)):
+            results = {}
+            ctx["results"] = results
+            for name, fn in COMPONENTS:
+                if name in kept:
+                    results[name] = kept[name]
+                elif name in done:
+                    results[name] = done[name]
+                else:  # depends on other components' results
+                    with tracer.span(f"calc.{name}"):
+                        results[name] = fn(inputs, ctx)
+                    if on_result is not None:
+                        on_result(index, name, results[name])
+            outputs.append(results)
+    return outputs
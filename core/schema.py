@@ -0,0 +1,173 @@
+"""
+Project file schema: version, migrations and validation.
+
+Every project carries metadata["schema_version"]. Files written before
+versioning have none and count as version 0. MIGRATIONS[v] upgrades a
+project dict from version v to v + 1 in place, so SCHEMA_VERSION is
+len(MIGRATIONS); a format change appends a migration and never edits an
+existing one.
+
+upgrade() runs the chain when a project is opened (ProjectModel does it on
+construction) and validates the result. The upgraded file is written by the
+next save; core.migrate upgrades whole project folders on disk.
+
+Validators are compiled once, at import, from SECTIONS:
+  - a type:          isinstance check (bool is not an int)
+  - a dict:          a dict; listed keys are checked when present, others pass
+  - a one-item list: a list whose items all match the item spec
+Field values inside the form sections are not checked: the forms store
+strings, numbers or None there and the calculation tolerates all of them.
+"""
+
+from datetime import datetime
+from itertools import repeat
+
+
+class SchemaError(ValueError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+
+SECTIONS = {
+    "metadata": {
+        "project_name": str,
+        "author": str,
+        "created_at": str,
+        "schema_version": int,
+        "keep_undo_history": bool,
+        "retention": dict,
+    },
+    "general_info": dict,
+    "bridge_data": dict,
+    "financial_data": dict,
+    "traffic_data": {
+        "traffic_fields": dict,
+        "daily_traffic": dict,
+        "vehicle_distribution": dict,
+        "growth_rate": dict,
+        "accident_distribution": dict,
+        "growth_segments": [list],
+    },
+    "recycling": {"recovery_rate": dict},
+    "demolition": dict,
+    "boq": [dict],
+    "scenarios": [{"name": str, "overrides": dict}],
+}
+
+
+def new_project(project_name, author="User"):
+    """The data of a new, empty project at the current schema version."""
+    return {
+        "metadata": {
+            "project_name": project_name,
+            "author": author,
+            "created_at": str(datetime.now()),
+            "schema_version": SCHEMA_VERSION,
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Migrations
+# ---------------------------------------------------------------------------
+
+def _v0_versioned(data):
+    """
+    Unversioned projects: files from Manager.request_new (no author) or with
+    no metadata at all get the metadata every project has.
+    """
+    metadata = data.setdefault("metadata", {})
+    if isinstance(metadata, dict):
+        metadata.setdefault("project_name", "Untitled Project")
+        metadata.setdefault("author", "User")
+        metadata.setdefault("created_at", "")
+
+
+MIGRATIONS = [
+    _v0_versioned,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(data):
+    """Schema version of a project dict (0 when unversioned)."""
+    metadata = data.get("metadata")
+    return metadata.get("schema_version", 0) if isinstance(metadata, dict) else 0
+
+
+def upgrade(data):
+    """
+    Migrates ``data`` (a parsed project.json) in place to SCHEMA_VERSION and
+    validates it. Returns (data, version it was saved with); raises
+    SchemaError if it cannot be read by this version.
+    """
+    if not isinstance(data, dict):
+        raise SchemaError("Project file does not contain a JSON object.")
+    version = schema_version(data)
+    if not isinstance(version, int) or isinstance(version, bool) or version < 0:
+        raise SchemaError(f"Invalid schema version {version!r}.")
+    if version > SCHEMA_VERSION:
+        raise SchemaError(
+            f"Project was saved by a newer version of the application "
+            f"(schema {version}; this version reads up to {SCHEMA_VERSION})."
+        )
+    for v in range(version, SCHEMA_VERSION):
+        MIGRATIONS[v](data)
+        if isinstance(data.get("metadata"), dict):
+            data["metadata"]["schema_version"] = v + 1
+    validate(data)
+    return data, version
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+def _compile(spec):
+    """A check(value, where) function for ``spec`` (see the module docstring)."""
+    if isinstance(spec, type):
+        name = spec.__name__
+        exclude = bool if spec is int else ()
+
+        def check(value, where):
+            if not isinstance(value, spec) or isinstance(value, exclude):
+                raise SchemaError(f"{where}: expected {name}, got {type(value).__name__}.")
+        return check
+
+    if isinstance(spec, list):
+        item_spec = spec[0]
+        check_item = _compile(item_spec)
+
+        def check(value, where):
+            if not isinstance(value, list):
+                raise SchemaError(f"{where}: expected list, got {type(value).__name__}.")
+            # Plain type items (e.g. BOQ lines) are checked in one C-level pass
+            if isinstance(item_spec, type) and all(map(isinstance, value, repeat(item_spec))):
+                return
+            for i, item in enumerate(value):
+                check_item(item, f"{where}[{i}]")
+        return check
+
+    fields = [(key, _compile(field)) for key, field in spec.items()]
+
+    def check(value, where):
+        if not isinstance(value, dict):
+            raise SchemaError(f"{where}: expected dict, got {type(value).__name__}.")
+        for key, check_field in fields:
+            if key in value:
+                check_field(value[key], f"{where}.{key}")
+    return check
+
+
+_validate_project = _compile(SECTIONS)
+
+
+def validate(data):
+    """Raises SchemaError if ``data`` does not match SECTIONS."""
+    if not isinstance(data, dict) or not isinstance(data.get("metadata"), dict):
+        raise SchemaError("Project has no metadata.")
+    _validate_project(data, "project")
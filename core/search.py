@@ -0,0 +1,359 @@
+"""
+Inverted index over the descriptive fields of every project, for the
+dashboard's search box.
+
+Indexed fields (SEARCH_FIELDS) are the project name, the General Information
+fields and the bridge type and material, plus the project ID. Every field
+value is split into lower-case word tokens; the index maps
+    token         -> project IDs   (free text)
+    field:token   -> project IDs   (field-scoped)
+A query is a list of terms, all of which must match:
+    nhai                  any field has a word starting with "nhai"
+    client:NHAI           the client field does
+    client:"NH Authority" the client field has both words
+Field names are the SEARCH_FIELDS keys or the stored keys
+("primary_material:steel" equals "material:steel"). Terms match word
+prefixes, through bisection of the sorted vocabulary.
+
+The index is kept in projects/.search_index.json: the posting lists plus,
+per project, its fields and the (mtime, size) stamp of the project.json
+they were read from. sync() re-reads only projects whose file
+changed since, and the window calls update() after each save, so a save
+never re-reads the file. A re-read parses the top-level sections at the start
+of the file until the indexed ones are found (read_fields), which spares
+the BOQ when it comes after them.
+
+All methods are thread-safe. File reads and JSON encoding happen outside
+the lock, so searches never wait for a sync or a save.
+"""
+
+import os
+import re
+import json
+import shlex
+import bisect
+import threading
+
+INDEX_FILE = ".search_index.json"
+INDEX_VERSION = 1
+# Bytes of a project.json searched for the indexed sections before parsing all of it
+HEAD_BYTES = 64 * 1024
+
+# search field -> (section, key) of the project data
+SEARCH_FIELDS = {
+    "name":        ("metadata", "project_name"),
+    "company":     ("general_info", "company_name"),
+    "title":       ("general_info", "project_title"),
+    "description": ("general_info", "description"),
+    "valuer":      ("general_info", "valuer_name"),
+    "job":         ("general_info", "job_number"),
+    "client":      ("general_info", "client"),
+    "country":     ("general_info", "country"),
+    "type":        ("bridge_data", "bridge_type"),
+    "material":    ("bridge_data", "primary_material"),
+}
+# Also accepted in queries: the stored key names and the project ID
+FIELD_ALIASES = {key: field for field, (_, key) in SEARCH_FIELDS.items()}
+FIELD_ALIASES.update({field: field for field in SEARCH_FIELDS}, id="id")
+
+_SECTIONS = {section for section, _ in SEARCH_FIELDS.values()}
+
+_TOKEN = re.compile(r"\w+")
+_SEPARATOR = re.compile(r"[\s,]*")
+_COLON = re.compile(r"\s*:\s*")
+_decoder = json.JSONDecoder()
+
+
+def tokenize(text):
+    return _TOKEN.findall(str(text).lower())
+
+
+def index_fields(data):
+    """{search field: text} of a project dict (empty fields left out)."""
+    fields = {}
+    for field, (section, key) in SEARCH_FIELDS.items():
+        value = data.get(section, {}).get(key) if isinstance(data.get(section), dict) else None
+        if value not in (None, ""):
+            fields[field] = str(value)
+    return fields
+
+
+def _head_sections(text):
+    """
+    {section: value} of the indexed sections in ``text``, the start of a
+    project.json. Raises ValueError if the text ends before all are found.
+    """
+    found = {}
+    pos = text.index("{") + 1
+    while len(found) < len(_SECTIONS):
+        pos = _SEPARATOR.match(text, pos).end()
+        if text.startswith("}", pos):
+            break  # end of the project: the other sections are absent
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = _COLON.match(text, pos).end()
+        value, pos = _decoder.raw_decode(text, pos)
+        if key in _SECTIONS:
+            found[key] = value
+    return found
+
+
+def read_fields(path):
+    """index_fields of the project.json at ``path``, parsed no further than needed."""
+    with open(path, "rb") as f:
+        head = f.read(HEAD_BYTES)
+        try:
+            return index_fields(_head_sections(head.decode("utf-8", errors="ignore")))
+        except ValueError:  # a large section first, or a malformed file
+            f.seek(0)
+            return index_fields(json.loads(f.read()))
+
+
+def parse_query(query):
+    """[(field or None, [tokens])] of every term of ``query``."""
+    try:
+        parts = shlex.split(query)
+    except ValueError:  # unbalanced quote
+        parts = query.split()
+    terms = []
+    for part in parts:
+        field, sep, value = part.partition(":")
+        field = FIELD_ALIASES.get(field.lower()) if sep else None
+        if field is None:
+            terms.extend((None, [token]) for token in tokenize(part))
+        elif tokenize(value):
+            terms.append((field, tokenize(value)))
+    return terms
+
+
+class _Postings:
+    """
+    key -> project IDs, with prefix lookup over the sorted keys. Lists read
+    from the saved index become sets when first used.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self._sorted = None  # sorted keys, rebuilt after keys are added or removed
+
+    def load(self, postings):
+        """Takes ``postings`` ({key: [IDs]} in key order, as written by saved())."""
+        self.ids = postings
+        self._sorted = list(postings)
+
+    def saved(self):
+        """Copy of the postings as {key: [IDs]} (keys unsorted)."""
+        return {key: list(ids) for key, ids in self.ids.items()}
+
+    def _set(self, key):
+        ids = self.ids[key]
+        if not isinstance(ids, set):
+            self.ids[key] = ids = set(ids)
+        return ids
+
+    def add(self, key, p_id):
+        if key in self.ids:
+            self._set(key).add(p_id)
+        else:
+            self.ids[key] = {p_id}
+            self._sorted = None
+
+    def discard(self, key, p_id):
+        if key in self.ids:
+            ids = self._set(key)
+            ids.discard(p_id)
+            if not ids:
+                del self.ids[key]
+                self._sorted = None
+
+    def prefix(self, prefix):
+        """
+        IDs of every key starting with ``prefix``. A single matching key
+        returns its own set: callers must not modify the result.
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self.ids)
+        keys = self._sorted
+        i = bisect.bisect_left(keys, prefix)
+        j = i
+        while j < len(keys) and keys[j].startswith(prefix):
+            j += 1
+        if j - i == 1:
+            return self._set(keys[i])
+        return set().union(*(self.ids[key] for key in keys[i:j]))
+
+
+class SearchIndex:
+    """The search index of one projects folder (see the module docstring)."""
+
+    def __init__(self, projects_dir):
+        self.projects_dir = projects_dir
+        self.path = os.path.join(projects_dir, INDEX_FILE)
+        self.docs = {}  # p_id -> {"stamp": [mtime_ns, size], "fields": {field: text}}
+        self._terms = _Postings()
+        self._fields = _Postings()
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+
+    # --- Persistence ---
+
+    def load(self):
+        """Reads the saved index (once; missing or outdated files start empty)."""
+        with self._lock:
+            if self._loaded:
+                return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+            if doc.get("version") != INDEX_VERSION:
+                doc = None
+            else:
+                docs, terms, scoped = doc["docs"], doc["terms"], doc["fields"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            doc = None
+        with self._lock:
+            if self._loaded:
+                return  # loaded by another thread meanwhile
+            self._loaded = True
+            if doc is not None:
+                self.docs = docs
+                self._terms.load(terms)
+                self._fields.load(scoped)
+
+    def save(self):
+        """Writes the index if it changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            docs = dict(self.docs)  # entries are replaced, never modified
+            terms, scoped = self._terms.saved(), self._fields.saved()
+            self._dirty = False
+        text = json.dumps({
+            "version": INDEX_VERSION,
+            "docs": docs,
+            "terms": {key: terms[key] for key in sorted(terms)},
+            "fields": {key: scoped[key] for key in sorted(scoped)},
+        })
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Search index error: {e}")
+
+    # --- Updates ---
+
+    def _stamp(self, p_id):
+        try:
+            st = os.stat(os.path.join(self.projects_dir, p_id, "project.json"))
+            return [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return None
+
+    def _keys(self, p_id, fields):
+        terms, scoped = set(), set()
+        for field, text in fields.items():
+            for token in tokenize(text):
+                terms.add(token)
+                scoped.add(f"{field}:{token}")
+        for token in tokenize(p_id):
+            terms.add(token)
+            scoped.add(f"id:{token}")
+        return terms, scoped
+
+    def _add(self, p_id, entry):
+        self.docs[p_id] = entry
+        terms, scoped = self._keys(p_id, entry["fields"])
+        for key in terms:
+            self._terms.add(key, p_id)
+        for key in scoped:
+            self._fields.add(key, p_id)
+
+    def _remove(self, p_id):
+        entry = self.docs.pop(p_id, None)
+        if entry is None:
+            return
+        terms, scoped = self._keys(p_id, entry["fields"])
+        for key in terms:
+            self._terms.discard(key, p_id)
+        for key in scoped:
+            self._fields.discard(key, p_id)
+
+    def update(self, p_id, fields):
+        """
+        Indexes ``fields`` (see index_fields) for ``p_id``, stamped with its
+        project.json as it is now: call it once the save has been written.
+        """
+        self.load()
+        stamp = self._stamp(p_id)
+        with self._lock:
+            self._remove(p_id)
+            self._add(p_id, {"stamp": stamp, "fields": fields})
+            self._dirty = True
+
+    def remove(self, p_id):
+        with self._lock:
+            self._remove(p_id)
+            self._dirty = True
+
+    def sync(self, p_ids):
+        """
+        Brings the index in line with the projects ``p_ids``: projects whose
+        project.json changed since they were indexed are re-read, projects no
+        longer listed are dropped. Returns the number of projects re-read or
+        dropped.
+        """
+        self.load()
+        with self._lock:
+            indexed = {p_id: entry["stamp"] for p_id, entry in self.docs.items()}
+        listed = set(p_ids)
+        read = []
+        for p_id in listed:
+            stamp = self._stamp(p_id)
+            if p_id in indexed and indexed[p_id] == stamp:
+                continue
+            try:
+                fields = read_fields(os.path.join(self.projects_dir, p_id, "project.json"))
+            except (OSError, ValueError, AttributeError):
+                fields = {}  # unreadable (recovering) projects match by ID only
+            read.append((p_id, stamp, fields))
+
+        with self._lock:
+            dropped = [p_id for p_id in self.docs if p_id not in listed]
+            for p_id in dropped:
+                self._remove(p_id)
+            for p_id, stamp, fields in read:
+                entry = self.docs.get(p_id)
+                if (entry["stamp"] if entry else None) != indexed.get(p_id):
+                    continue  # updated by a save while the file was read
+                self._remove(p_id)
+                self._add(p_id, {"stamp": stamp, "fields": fields})
+            if dropped or read:
+                self._dirty = True
+        return len(dropped) + len(read)
+
+    # --- Queries ---
+
+    def search(self, query):
+        """
+        IDs of the projects matching every term of ``query``, or None when
+        the query has no terms (no filtering).
+        """
+        terms = parse_query(query)
+        if not terms:
+            return None
+        self.load()
+        with self._lock:
+            found = [
+                self._terms.prefix(token) if field is None
+                else self._fields.prefix(f"{field}:{token}")
+                for field, tokens in terms for token in tokens
+            ]
+            found.sort(key=len)  # intersect from the rarest term
+            matches = set(found[0])
+            for ids in found[1:]:
+                if not matches:
+                    break
+                matches &= ids
+            return matches
@@ -0,0 +1,163 @@
+"""
+Lightweight span tracing for hot paths.
+
+Usage:
+    from core.tracing import tracer
+
+    with tracer.span("persistence.save"):
+        ...
+
+    @tracer.traced("calc.run")
+    def run(...): ...
+
+Spans record wall time, CPU time of the calling thread and, when allocation
+tracking is on, the net memory allocated (via tracemalloc). They are kept in
+a bounded ring buffer and can be exported as Chrome trace JSON
+(chrome://tracing, Perfetto).
+
+Tracing is off by default (enable with LCCA_TRACE=1 or from the Logs page).
+When off, ``span()`` returns a shared no-op object and ``traced`` wrappers
+call straight through, so instrumented code pays a single attribute check.
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+import tracemalloc
+from collections import deque
+
+
+class Span:
+    """A finished (or running) span. Times are in seconds, ``start`` is perf_counter based."""
+
+    __slots__ = ("name", "args", "start", "wall", "cpu", "alloc", "thread", "_tracer", "_cpu0", "_mem0")
+
+    def __init__(self, tracer, name, args):
+        self._tracer = tracer
+        self.name = name
+        self.args = args
+        self.thread = threading.get_ident()
+        self.wall = self.cpu = 0.0
+        self.alloc = None
+
+    def __enter__(self):
+        self._mem0 = tracemalloc.get_traced_memory()[0] if self._tracer.track_allocations else None
+        self._cpu0 = time.thread_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wall = time.perf_counter() - self.start
+        self.cpu = time.thread_time() - self._cpu0
+        if self._mem0 is not None and tracemalloc.is_tracing():
+            self.alloc = tracemalloc.get_traced_memory()[0] - self._mem0
+        self._tracer._record(self)
+        return False
+
+
+class _NullSpan:
+    """Returned by Tracer.span() while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    def __init__(self, capacity=10000):
+        self.enabled = False
+        self.track_allocations = False
+        self.spans = deque(maxlen=capacity)
+        self.recorded = 0  # total spans ever recorded; lets viewers detect new spans
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    # --- Control ---
+
+    def enable(self, track_allocations=False):
+        self.track_allocations = track_allocations
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        if self.track_allocations and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.track_allocations = False
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+    # --- Recording ---
+
+    def span(self, name, **args):
+        """Context manager timing the enclosed block."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    def traced(self, name=None):
+        """Decorator timing every call of the wrapped function."""
+        def decorator(fn):
+            label = name or fn.__qualname__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with Span(self, label, {}):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _record(self, span):
+        with self._lock:
+            self.spans.append(span)
+            self.recorded += 1
+
+    def snapshot(self):
+        """Returns a list copy of the buffered spans, oldest first."""
+        with self._lock:
+            return list(self.spans)
+
+    # --- Export ---
+
+    def export_chrome_trace(self, path):
+        """Writes the buffered spans as Chrome trace ("X" complete events) JSON."""
+        pid = os.getpid()
+        events = []
+        for s in self.snapshot():
+            args = dict(s.args)
+            args["cpu_ms"] = round(s.cpu * 1000, 3)
+            if s.alloc is not None:
+                args["alloc_bytes"] = s.alloc
+            events.append({
+                "name": s.name,
+                "cat": s.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (s.start - self._origin) * 1e6,
+                "dur": s.wall * 1e6,
+                "pid": pid,
+                "tid": s.thread,
+                "args": args,
+            })
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+
+tracer = Tracer()
+
+if os.environ.get("LCCA_TRACE"):
+    tracer.enable(track_allocations=os.environ.get("LCCA_TRACE") == "alloc")
@@ -0,0 +1,115 @@
+"""
+Projected traffic over the analysis period.
+
+projected_traffic(inputs, years) returns the average daily traffic of every
+vehicle class (ref.VEHICLE_CLASSES) in every analysis year as one array
+(vehicles, years), year 0 being the base year of the Traffic Data counts.
+It is computed in a single vectorized pass per distinct set of traffic
+inputs and cached; the array is read-only and shared by every
+traffic-dependent component through the calculation context (ctx["traffic"]).
+
+Growth models (traffic_fields.traffic_growth_model):
+  - Constant:  compound growth at each class's annual rate
+  - Piecewise: the annual rates scaled per period of the analysis
+               (traffic_data.growth_segments, default ref.GROWTH_SEGMENTS)
+  - Logistic:  compound growth whose total PCU saturates at the capacity of
+               the alternate road carriageway (ref.CARRIAGEWAY_CAPACITY)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from core import reference_data as ref
+
+GROWTH_MODELS = ("Constant", "Piecewise", "Logistic")
+
+
+def _number(value, default):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _segments(value):
+    """
+    Growth segments as ((start year, rate factor), ...); a missing or
+    malformed list gives ref.GROWTH_SEGMENTS.
+    """
+    try:
+        segments = tuple((int(start), float(factor)) for start, factor in value)
+    except (TypeError, ValueError):
+        segments = ()
+    return segments or tuple(ref.GROWTH_SEGMENTS)
+
+
+def traffic_number(inputs, key, default=0.0):
+    """A numeric field of the Traffic Data page; blank or malformed values give ``default``."""
+    fields = inputs.get("traffic_data", {}).get("traffic_fields", {})
+    return _number(fields.get(key), default)
+
+
+def traffic_inputs(inputs):
+    """
+    The traffic inputs of a project as hashable values:
+    (growth model, base ADT per class, growth rate % per class, segments, capacity).
+    """
+    section = inputs.get("traffic_data", {})
+    fields = section.get("traffic_fields", {})
+    model = fields.get("traffic_growth_model") or "Constant"
+    if model not in GROWTH_MODELS:
+        model = "Constant"
+    daily = section.get("daily_traffic", {})
+    growth = section.get("growth_rate", {})
+    adt = tuple(_number(daily.get(v), 0.0) for v in ref.VEHICLE_CLASSES)
+    rates = tuple(_number(growth.get(v), ref.DEFAULT_GROWTH_RATES[v]) for v in ref.VEHICLE_CLASSES)
+    segments = _segments(section.get("growth_segments"))
+    capacity = ref.CARRIAGEWAY_CAPACITY.get(
+        fields.get("alternate_road_carriageway"), ref.DEFAULT_CARRIAGEWAY_CAPACITY
+    )
+    return model, adt, rates, segments, capacity
+
+
+def projected_traffic(inputs, years):
+    """Daily traffic per vehicle class and analysis year: read-only array (vehicles, years)."""
+    return growth_projection(*traffic_inputs(inputs), years)
+
+
+@lru_cache(maxsize=64)
+def growth_projection(model, adt, rates, segments, capacity, years):
+    """Cached projection for one set of traffic inputs (see traffic_inputs)."""
+    base = np.array(adt)[:, None]
+    r = np.array(rates)[:, None] / 100.0
+    t = np.arange(years, dtype=float)
+
+    if model == "Piecewise":
+        factors = np.ones(years)
+        for start, factor in sorted(segments):
+            factors[min(max(start, 0), years):] = factor
+        steps = np.log1p(r * factors[None, :])
+        steps[:, 0] = 0.0  # the counts are for year 0
+        traffic = base * np.exp(np.cumsum(steps, axis=1))
+    else:
+        traffic = base * (1.0 + r) ** t[None, :]
+
+    if model == "Logistic":
+        pcu = np.array([ref.PCU_FACTORS[v] for v in ref.VEHICLE_CLASSES])[:, None]
+        free = (pcu * traffic).sum(axis=0)  # unconstrained PCU/day per year
+        p0 = free[0]
+        if p0 > 0:
+            cap = max(capacity, p0)
+            # Intrinsic rate: PCU-weighted mean of the class rates
+            g = np.log1p(float((pcu * base * r).sum()) / p0)
+            saturated = cap / (1.0 + (cap - p0) / p0 * np.exp(-g * t))
+            # Keep each year's vehicle mix; scale the total to the logistic curve
+            traffic = traffic * (saturated / free)[None, :]
+
+    traffic.setflags(write=False)
+    return traffic
+
+
+def total_pcu(traffic):
+    """Daily PCU per year of a projection from projected_traffic."""
+    pcu = np.array([ref.PCU_FACTORS[v] for v in ref.VEHICLE_CLASSES])
+    return pcu @ traffic
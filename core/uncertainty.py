@@ -0,0 +1,58 @@
+"""
+Monte Carlo uncertainty of the life cycle cost.
+
+Each draw scales the yearly values of the cost components by multipliers
+sampled from UNCERTAINTY_RANGES and discounts them at a sampled rate. All
+draws are evaluated at once as matrix operations; a draw is one row.
+"""
+
+import numpy as np
+
+from core import reference_data as ref
+from core.calculation import EMISSION_COMPONENTS
+
+DEFAULT_DRAWS = 100_000
+DEFAULT_PERCENTILES = (5, 50, 95)
+# Draws evaluated per block (bounds peak memory to CHUNK x years floats)
+CHUNK = 10_000
+
+
+def cumulative_lcc_draws(results, discount_rate, draws=DEFAULT_DRAWS, seed=0, progress=None):
+    """
+    Cumulative discounted cost per year for every draw: array (draws, years), float32.
+    ``discount_rate`` is in percent, as entered on the Financial Data page.
+    ``progress(done, draws)`` is called after each block of draws; an
+    exception it raises stops the sampling.
+    """
+    rng = np.random.default_rng(seed)
+    names = [n for n in results if n not in EMISSION_COMPONENTS]
+    yearly = np.vstack([results[n]["yearly"] for n in names])  # (components, years)
+    years = yearly.shape[1]
+    t = np.arange(years, dtype=float)
+    out = np.empty((draws, years), dtype=np.float32)
+
+    for start in range(0, draws, CHUNK):
+        n = min(CHUNK, draws - start)
+        factors = np.column_stack([
+            rng.triangular(*ref.UNCERTAINTY_RANGES[name], size=n)
+            if name in ref.UNCERTAINTY_RANGES else np.ones(n)
+            for name in names
+        ])  # (n, components)
+        spread = ref.DISCOUNT_RATE_SPREAD
+        rates = rng.triangular(
+            max(discount_rate - spread, 0.0), discount_rate, discount_rate + spread, size=n
+        ) if spread > 0 else np.full(n, discount_rate)
+        discount = (1.0 + rates[:, None] / 100.0) ** -t[None, :]
+        # Accumulate in float64; cumsum straight into the float32 block warns
+        # spuriously on large values
+        out[start:start + n] = np.cumsum((factors @ yearly) * discount, axis=1)
+        if progress is not None:
+            progress(start + n, draws)
+    return out
+
+
+def percentile_bands(results, discount_rate, draws=DEFAULT_DRAWS,
+                     percentiles=DEFAULT_PERCENTILES, seed=0, progress=None):
+    """Percentiles of the cumulative discounted cost per year: array (len(percentiles), years)."""
+    samples = cumulative_lcc_draws(results, discount_rate, draws, seed, progress)
+    return np.percentile(samples, percentiles, axis=0)
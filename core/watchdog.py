@@ -0,0 +1,141 @@
+"""
+GUI event-loop stall detector.
+
+The GUI thread calls ``watchdog.beat()`` from a repeating timer. A background
+thread checks how long ago the last beat was; once that exceeds the threshold
+it captures the GUI thread's Python stack (``sys._current_frames``) so the
+blocking call can be identified. When beats resume, the stall is recorded with
+its duration in memory (for the Logs page) and appended to a log file.
+
+Configure with LCCA_STALL_MS (threshold in milliseconds, at least
+MIN_STALL_MS; 0 disables).
+"""
+
+import os
+import math
+import sys
+import time
+import datetime
+import threading
+import traceback
+from collections import deque
+
+# Shortest heartbeat the GUI timer is asked for (seconds)
+MIN_INTERVAL = 0.01
+# Shortest accepted LCCA_STALL_MS; a lower threshold would flag ordinary event handling
+MIN_STALL_MS = 50
+
+
+class StallWatchdog:
+    def __init__(self, threshold=1.0, log_path=None, capacity=200):
+        self.threshold = threshold
+        self.log_path = log_path
+        self.stalls = deque(maxlen=capacity)
+        self.recorded = 0  # total stalls ever recorded; lets viewers detect new ones
+        self._last_beat = time.monotonic()
+        self._pending = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._target_ident = None
+
+    @property
+    def interval(self):
+        """Heartbeat interval the GUI timer should use (seconds)."""
+        return max(self.threshold / 4, MIN_INTERVAL)
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, target_thread=None):
+        """Starts watching ``target_thread`` (defaults to the main/GUI thread)."""
+        if self.is_running() or self.threshold <= 0:
+            return
+        self._target_ident = (target_thread or threading.main_thread()).ident
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def beat(self):
+        """Called from the GUI thread's event loop."""
+        self._last_beat = time.monotonic()
+
+    # --- Watchdog thread ---
+
+    def _run(self):
+        poll = min(self.interval, 0.1)
+        while not self._stop.wait(poll):
+            last_beat = self._last_beat
+            now = time.monotonic()
+
+            if self._pending is None:
+                if now - last_beat > self.threshold:
+                    self._pending = self._capture(last_beat)
+            elif last_beat != self._pending["last_beat"]:
+                # Event loop is back: the stall lasted until this beat
+                self._finish(self._pending, last_beat)
+                self._pending = None
+
+    def _capture(self, last_beat):
+        frame = sys._current_frames().get(self._target_ident)
+        stack = "".join(traceback.format_stack(frame)) if frame else "<no frame>"
+        stalled_for = time.monotonic() - last_beat
+        return {
+            "last_beat": last_beat,
+            "started_at": datetime.datetime.now() - datetime.timedelta(seconds=stalled_for),
+            "stack": stack,
+        }
+
+    def _finish(self, pending, resumed_beat):
+        stall = {
+            "started_at": pending["started_at"].strftime("%Y-%m-%d %H:%M:%S"),
+            "duration": resumed_beat - pending["last_beat"],
+            "stack": pending["stack"],
+        }
+        self.stalls.append(stall)
+        self.recorded += 1
+        if self.log_path:
+            try:
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, "a") as f:
+                    f.write(
+                        f"[{stall['started_at']}] GUI stalled for "
+                        f"{stall['duration'] * 1000:.0f} ms\n{stall['stack']}\n"
+                    )
+            except OSError as e:
+                print(f"Stall log error: {e}")
+
+
+def _stall_threshold_ms(default=1000):
+    """
+    LCCA_STALL_MS as a number of milliseconds (0 disables); bad values and
+    thresholds below MIN_STALL_MS give ``default``.
+    """
+    value = os.environ.get("LCCA_STALL_MS", "")
+    if not value.strip():
+        return default
+    try:
+        ms = float(value)
+    except ValueError:
+        ms = None
+    if ms is None or not math.isfinite(ms):
+        print(f"Ignoring LCCA_STALL_MS={value!r} (not a number); using {default} ms")
+        return default
+    if ms <= 0:
+        return 0.0
+    if ms < MIN_STALL_MS:
+        print(f"Ignoring LCCA_STALL_MS={value!r} (below {MIN_STALL_MS} ms); using {default} ms")
+        return default
+    return ms
+
+
+watchdog = StallWatchdog(
+    threshold=_stall_threshold_ms() / 1000.0,
+    log_path=os.path.join(os.getcwd(), "logs", "stalls.log"),
+)
@@ -0,0 +1,63 @@
+"""
+Work-zone road user cost: delay and diversion costs while the bridge is
+closed for construction or maintenance.
+
+Closure days per analysis year come from closure_schedule (construction
+period plus the recurring maintenance closures of ref.MAINTENANCE_CLOSURES).
+Every diverted vehicle pays the additional travel time at its value of time
+and the additional re-route distance at its operating cost.
+
+All functions broadcast over leading batch axes, so a batch of scenarios or
+Monte Carlo draws is priced in one array expression:
+    traffic       (..., vehicles, years)
+    closure_days  (..., years)
+    extra_hours, extra_km, voc_factor  (...)
+"""
+
+import numpy as np
+
+from core import reference_data as ref
+from core.traffic import traffic_number
+
+_VOT = np.array([ref.VALUE_OF_TIME[v] for v in ref.VEHICLE_CLASSES])
+_VOC = np.array([ref.VEHICLE_OPERATING_COST[v] for v in ref.VEHICLE_CLASSES])
+_MAINTENANCE_INTERVALS = np.array([i for i, _ in ref.MAINTENANCE_CLOSURES], dtype=float)
+_MAINTENANCE_DAYS = np.array([d for _, d in ref.MAINTENANCE_CLOSURES])
+
+
+def closure_schedule(years, construction_years):
+    """Days the bridge is closed in each analysis year: array (years,)."""
+    t = np.arange(years, dtype=float)
+    days = np.where(t < construction_years, ref.CONSTRUCTION_CLOSURE_DAYS, 0.0)
+    in_service = t - construction_years + 1  # 1 in the first year after construction
+    due = (in_service[None, :] > 0) & (in_service[None, :] % _MAINTENANCE_INTERVALS[:, None] == 0)
+    return days + _MAINTENANCE_DAYS @ due
+
+
+def work_zone_inputs(inputs):
+    """Diversion inputs from the Traffic Data page: {"extra_hours", "extra_km", "voc_factor"}."""
+    fields = inputs.get("traffic_data", {}).get("traffic_fields", {})
+    roughness = traffic_number(inputs, "road_roughness", ref.BASE_ROUGHNESS)
+    voc_factor = ref.ROAD_TYPE_VOC_FACTORS.get(fields.get("road_type"), 1.0) * (
+        1.0 + ref.ROUGHNESS_VOC_SLOPE * max(roughness - ref.BASE_ROUGHNESS, 0.0) / 1000.0
+    )
+    return {
+        "extra_hours": traffic_number(inputs, "additional_travel_time") / 60.0,
+        "extra_km": traffic_number(inputs, "additional_reroute_distance"),
+        "voc_factor": voc_factor,
+    }
+
+
+def work_zone_costs(traffic, closure_days, extra_hours, extra_km, voc_factor=1.0):
+    """
+    Undiscounted (delay, diversion) cost per year (INR), each shaped (..., years).
+    ``traffic`` is daily traffic per vehicle class and year (see core.traffic).
+    """
+    extra_hours = np.asarray(extra_hours, dtype=float)[..., None]
+    extra_km = np.asarray(extra_km, dtype=float)[..., None]
+    voc_factor = np.asarray(voc_factor, dtype=float)[..., None]
+    # Vehicles diverted per year, per class: (..., vehicles, years)
+    diverted = traffic * np.asarray(closure_days)[..., None, :]
+    delay = extra_hours * np.einsum("v,...vt->...t", _VOT, diverted)
+    diversion = extra_km * voc_factor * np.einsum("v,...vt->...t", _VOC, diverted)
+    return delay, diversion
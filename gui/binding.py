@@ -0,0 +1,222 @@
+"""
+Schema-driven binding between the input forms and ProjectModel sections.
+
+The schemas below are derived from each form's field table
+(GENERAL_INFO_FIELDS, BRIDGE_DATA_FIELDS, TRAFFIC_FIELDS, FINANCIAL_FIELDS,
+RECYCLING_MATERIALS, DEMOLITION_FIELDS).
+Each bound field is (path, widget, kind):
+  - path: key path inside the model section, e.g. ("daily_traffic", "hcv")
+  - kind: "str" | "int" | "float"; blank or malformed numbers are stored as None
+
+A FormBinding populates its form from the model with signals blocked, then
+pushes typed values into the model as soon as a widget changes, recording
+which fields are dirty.
+"""
+
+from contextlib import contextmanager
+
+from PySide6.QtWidgets import QComboBox, QTextEdit
+
+from gui.components.global_info.main import GENERAL_INFO_FIELDS
+from gui.components.bridge_data.main import BRIDGE_DATA_FIELDS
+from gui.components.traffic_data.main import TRAFFIC_FIELDS, VEHICLE_TYPES, ACCIDENT_TYPES
+from gui.components.financial_data.main import FINANCIAL_FIELDS
+from gui.components.recycling.main import RECYCLING_MATERIALS
+from gui.components.demolition.main import DEMOLITION_FIELDS
+
+_MISSING = object()
+
+
+# ---------------------------------------------------------------------------
+# Widget access
+# ---------------------------------------------------------------------------
+
+def read_widget(widget):
+    if isinstance(widget, QComboBox):
+        return widget.currentText()
+    if isinstance(widget, QTextEdit):
+        return widget.toPlainText()
+    return widget.text()
+
+
+def write_widget(widget, value):
+    if value is None:
+        text = ""
+    elif isinstance(value, float) and value.is_integer():
+        text = str(int(value))  # show 120 rather than 120.0
+    else:
+        text = str(value)
+    if isinstance(widget, QComboBox):
+        idx = widget.findText(text) if text else -1
+        if idx >= 0 or not text:
+            widget.setCurrentIndex(idx)
+        else:
+            # Stored "Custom" entry that is not one of the options
+            widget.setEditable(True)
+            widget.setEditText(text)
+    elif isinstance(widget, QTextEdit):
+        widget.setPlainText(text)
+    else:
+        widget.setText(text)
+
+
+def change_signal(widget):
+    if isinstance(widget, QComboBox):
+        return widget.currentTextChanged
+    return widget.textChanged
+
+
+def parse_value(text, kind):
+    """Converts widget text to the field's type."""
+    if kind == "str":
+        return text
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return int(text) if kind == "int" else float(text)
+    except ValueError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Schemas (one per form, built from its field table)
+# ---------------------------------------------------------------------------
+
+def _validator_kind(validator):
+    name = validator[0] if isinstance(validator, tuple) else validator
+    return {"int": "int", "double": "float"}.get(name, "str")
+
+
+def general_info_schema(form):
+    return [((key,), form.widgets[key], "str") for key, *_ in GENERAL_INFO_FIELDS]
+
+
+def bridge_data_schema(form):
+    return [
+        ((key,), form.widgets[key], _validator_kind(validator))
+        for key, label, widget_type, row, col, rs, cs, validator, options in BRIDGE_DATA_FIELDS
+    ]
+
+
+def financial_data_schema(form):
+    return [
+        ((key,), form.widgets[key], "int" if int_only else "float")
+        for key, label, default, unit, suggested, int_only in FINANCIAL_FIELDS
+    ]
+
+
+def traffic_data_schema(form):
+    fields = [
+        (("traffic_fields", key), form.widgets[key], "float" if widget_type == "line" else "str")
+        for key, label, widget_type, unit, has_custom, options in TRAFFIC_FIELDS
+    ]
+    for key, _ in VEHICLE_TYPES:
+        fields.append((("daily_traffic", key), form.daily_traffic[key], "int"))
+        fields.append((("vehicle_distribution", key), form.vehicle_distribution[key], "float"))
+        fields.append((("growth_rate", key), form.growth_rate[key], "float"))
+    for key, _ in ACCIDENT_TYPES:
+        fields.append((("accident_distribution", key), form.accident_distribution[key], "float"))
+    return fields
+
+
+def recycling_schema(form):
+    return [
+        (("recovery_rate", material), form.recovery_rate[material], "float")
+        for material in RECYCLING_MATERIALS
+    ]
+
+
+def demolition_schema(form):
+    return [((key,), form.widgets[key], "str") for key, *_ in DEMOLITION_FIELDS]
+
+
+# (model section, widget_map key, schema builder)
+BOUND_FORMS = [
+    ("general_info",   "General Information", general_info_schema),
+    ("bridge_data",    "Bridge Data",         bridge_data_schema),
+    ("traffic_data",   "Traffic Data",        traffic_data_schema),
+    ("financial_data", "Financial Data",      financial_data_schema),
+    ("recycling",      "Recycling",           recycling_schema),
+    ("demolition",     "Demolition",          demolition_schema),
+]
+
+
+# ---------------------------------------------------------------------------
+# Binding
+# ---------------------------------------------------------------------------
+
+class FormBinding:
+    def __init__(self, section, form, fields, on_change=None):
+        self.section = section
+        self.form = form
+        self.fields = fields
+        self.on_change = on_change
+        self.model = None
+        self.dirty = set()  # paths edited since attach()/clear_dirty()
+
+        for path, widget, kind in fields:
+            change_signal(widget).connect(
+                lambda *_, p=path, w=widget, k=kind: self._on_widget_changed(p, w, k)
+            )
+
+    @contextmanager
+    def blocked(self):
+        """Blocks the change signals of every bound widget."""
+        previous = [widget.blockSignals(True) for _, widget, _ in self.fields]
+        try:
+            yield
+        finally:
+            for (_, widget, _), was_blocked in zip(self.fields, previous):
+                widget.blockSignals(was_blocked)
+
+    def attach(self, model):
+        """
+        Populates the form from ``model`` and pushes later edits into it.
+        Fields the model does not store yet are seeded with the form defaults.
+        """
+        self.model = model
+        self.dirty.clear()
+        with self.blocked():
+            self.form.reset_defaults()
+            for path, widget, kind in self.fields:
+                value = model.get_value(self.section, path, _MISSING)
+                if value is _MISSING:
+                    model.set_value(
+                        self.section, path, parse_value(read_widget(widget), kind), record=False
+                    )
+                else:
+                    write_widget(widget, value)
+
+    def refresh(self, paths=None):
+        """Re-reads ``paths`` (all bound fields if None or empty) from the model."""
+        wanted = set(paths or ())
+        with self.blocked():
+            for path, widget, kind in self.fields:
+                if not wanted or path in wanted or () in wanted:
+                    write_widget(widget, self.model.get_value(self.section, path))
+
+    def clear_dirty(self):
+        self.dirty.clear()
+
+    def restore_dirty(self, paths):
+        self.dirty |= paths
+
+    def _on_widget_changed(self, path, widget, kind):
+        if self.model is None:
+            return
+        value = parse_value(read_widget(widget), kind)
+        if value == self.model.get_value(self.section, path, _MISSING):
+            return
+        self.model.set_value(self.section, path, value)
+        self.dirty.add(path)
+        if self.on_change:
+            self.on_change(self.section, path)
+
+
+def build_binding(page, form, on_change=None):
+    """Creates the FormBinding of page ``page`` (None if the page is not bound)."""
+    for section, bound_page, schema in BOUND_FORMS:
+        if bound_page == page:
+            return FormBinding(section, form, schema(form), on_change)
+    return None
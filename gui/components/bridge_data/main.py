@@ -5,6 +5,8 @@ from PySide6.QtWidgets import (
     QLabel, QVBoxLayout, QGridLayout, QLineEdit, QComboBox
 )
 
+from gui.shared import set_shared_options
+
 # ---------------------------------------------------------------------------
 # Field definitions
 # Each entry: (key, label, widget_type, row, col, row_span, col_span, validator, options)
@@ -97,7 +99,7 @@ class BridgeData(QWidget):
             elif widget_type == "combo":
                 w = QComboBox(self.general_widget)
                 if options:
-                    w.addItems(options)
+                    set_shared_options(w, options)
                 default = BRIDGE_DATA_DEFAULTS.get(key, "")
                 idx = w.findText(default)
                 if idx >= 0:
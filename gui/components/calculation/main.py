@@ -0,0 +1,105 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar, QPushButton
+
+from core.pipeline import run_pipeline, CalculationCancelled
+
+
+class CalculationProgress(QWidget):
+    """
+    Status-bar widget running the Calculate pipeline (core.pipeline) on a
+    worker thread, with progress and a Cancel button. Partial results are
+    re-emitted on the GUI thread as they stream in; everything a cancelled or
+    superseded run still sends is dropped. Hidden while idle.
+    """
+    component_ready = Signal(str, object)   # component name, result
+    charts_ready = Signal(object, object)    # raw charts, data key of the inputs
+    finished = Signal(object, object)        # (evaluated, raw charts), data key
+    failed = Signal(str)                     # error message
+    cancelled = Signal(str)                  # reason
+    streamed = Signal(int, object)           # run generation, message (from the worker)
+    done = Signal(int, object)               # run generation, Future
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calculation")
+        self._generation = 0
+        self._cancel = None  # threading.Event of the current run
+        self.key = None      # data key of the inputs being calculated
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel()
+        layout.addWidget(self.label)
+        self.bar = QProgressBar()
+        self.bar.setFixedWidth(160)
+        layout.addWidget(self.bar)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.clicked.connect(lambda: self.cancel())
+        layout.addWidget(self.btn_cancel)
+
+        self.streamed.connect(self._on_message)
+        self.done.connect(self._on_done)
+        self.setVisible(False)
+
+    def is_busy(self):
+        return self._cancel is not None
+
+    def start(self, project, key):
+        """Calculates ``project`` (a ProjectModel dict); a run still going is dropped."""
+        if self.is_busy():
+            self._drop()
+        self._generation += 1
+        generation = self._generation
+        self._cancel = threading.Event()
+        self.key = key
+        future = self._executor.submit(
+            run_pipeline, project, lambda *message: self.streamed.emit(generation, message),
+            self._cancel,
+        )
+        future.add_done_callback(lambda f: self.done.emit(generation, f))
+        self.label.setText("Calculating...")
+        self.bar.setRange(0, 0)
+        self.setVisible(True)
+
+    def cancel(self, reason="Calculation cancelled."):
+        """Stops the current run; nothing it still sends is delivered."""
+        if self.is_busy():
+            self._drop()
+            self.cancelled.emit(reason)
+
+    def _drop(self):
+        self._cancel.set()
+        self._cancel = None
+        self._generation += 1
+        self.setVisible(False)
+
+    def _on_message(self, generation, message):
+        if generation != self._generation:
+            return
+        kind = message[0]
+        if kind == "progress":
+            _, done, total, text = message
+            self.bar.setRange(0, total)
+            self.bar.setValue(done)
+            self.label.setText(f"Calculating: {text}")
+        elif kind == "component":
+            self.component_ready.emit(message[1], message[2])
+        elif kind == "charts":
+            self.charts_ready.emit(message[1], self.key)
+
+    def _on_done(self, generation, future):
+        if generation != self._generation:
+            return
+        self._cancel = None
+        self.setVisible(False)
+        try:
+            result = future.result()
+        except CalculationCancelled:
+            self.cancelled.emit("Calculation cancelled.")
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(result, self.key)
@@ -1,14 +1,28 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import  QWidget, QLabel, QVBoxLayout, QHBoxLayout, QTabWidget
 from .widgets.material_emissions import MaterialEmissions
 from .widgets.transport_emissions import TransportEmissions
 from .widgets.machinery_emissions import MachineryEmissions
 from .widgets.traffic_emissions import TrafficEmissions
 from .widgets.social_cost import SocialCost
+from core.boq_emissions import boq_emissions
 
 
 class CarbonEmissionTabView(QWidget):
+    """
+    Emission inputs and results. The transport and machinery tabs show the
+    emissions of the project's BOQ, computed on a worker thread whenever the
+    page is shown with a BOQ list it has not shown yet.
+    """
+    computed = Signal(object)
+
     def __init__(self, ):
         super().__init__()
+        self.model = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._boq = None  # BOQ list the results were requested for
         
         # Define Main layout
         main_layout = QVBoxLayout()
@@ -34,15 +48,57 @@ class CarbonEmissionTabView(QWidget):
         tab_view = QTabWidget()
         self.tab_view = tab_view
         tab_view.addTab(MaterialEmissions(), "Material Emissions")
-        tab_view.addTab(TransportEmissions(), "Transportation Emissions")
-        tab_view.addTab(MachineryEmissions(), "Machinery Emissions")
+        self.boq_views = [TransportEmissions(), MachineryEmissions()]
+        tab_view.addTab(self.boq_views[0], "Transportation Emissions")
+        tab_view.addTab(self.boq_views[1], "Machinery Emissions")
         tab_view.addTab(TrafficEmissions(), "Traffic Diversion Emissions")
         tab_view.addTab(SocialCost(), "Social Cost of Carbon")
         
         # Adding Widgets
         main_layout.addWidget(top_area)
         main_layout.addWidget(tab_view)
+        self.computed.connect(self._show_results)
     
     def select_tab(self, name):
         tabs = ["Material Emissions", "Transportation Emissions", "Machinery Emissions", "Traffic Diversion Emissions", "Social Cost of Carbon"]
-        self.tab_view.setCurrentIndex(tabs.index(name))
\ No newline at end of file
+        self.tab_view.setCurrentIndex(tabs.index(name))
+
+    def set_model(self, model):
+        self.model = model
+        self._boq = None
+        if self.isVisible():
+            self.refresh()
+
+    def refresh(self):
+        """Recomputes the BOQ emissions if the BOQ list was replaced since the last run."""
+        if self.model is None:
+            return
+        boq = self.model.get_boq()
+        if boq is self._boq:
+            return
+        self._boq = boq
+        if not boq:
+            for view in self.boq_views:
+                view.show_result(None)
+            return
+        for view in self.boq_views:
+            view.show_result(None, "Calculating...")
+        future = self._executor.submit(boq_emissions, boq)
+        future.add_done_callback(lambda f: self.computed.emit((boq, f)))
+
+    def _show_results(self, done):
+        boq, future = done
+        if boq is not self._boq:
+            return  # superseded by a newer BOQ
+        try:
+            emissions = future.result()
+        except Exception as e:
+            for view in self.boq_views:
+                view.show_result(None, f"BOQ emissions unavailable: {e}")
+            return
+        for view in self.boq_views:
+            view.show_result(emissions[view.KIND])
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
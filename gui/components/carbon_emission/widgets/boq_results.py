@@ -0,0 +1,55 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView
+)
+
+
+class BoqEmissionsView(QWidget):
+    """
+    One BOQ emission component (``KIND``: "transport" or "machinery" of
+    core.boq_emissions) in total, per structure tab and per material.
+    """
+    KIND = "transport"
+    TITLE = ""
+
+    def __init__(self):
+        super().__init__()
+
+        main_layout = QVBoxLayout()
+        self.setLayout(main_layout)
+        main_layout.addWidget(QLabel(f"<h3>{self.TITLE}</h3>"))
+        self.total = QLabel()
+        main_layout.addWidget(self.total)
+
+        tables = QHBoxLayout()
+        self.by_tab = self._table("Structure")
+        self.by_material = self._table("Material")
+        tables.addWidget(self.by_tab)
+        tables.addWidget(self.by_material)
+        main_layout.addLayout(tables)
+        self.show_result(None)
+
+    @staticmethod
+    def _table(label):
+        table = QTableWidget(0, 2)
+        table.setHorizontalHeaderLabels([label, "tCO2e"])
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        return table
+
+    def show_result(self, result, message=""):
+        """Shows ``result`` ({"total", "by_tab", "by_material"}), or ``message`` when None."""
+        if result is None:
+            self.total.setText(message or "Enter BOQ items under Construction Work Data.")
+            self.by_tab.setRowCount(0)
+            self.by_material.setRowCount(0)
+            return
+        self.total.setText(f"Total: <b>{result['total']:,.2f} tCO2e</b>")
+        for table, values in ((self.by_tab, result["by_tab"]), (self.by_material, result["by_material"])):
+            table.setRowCount(len(values))
+            for r, (name, value) in enumerate(values.items()):
+                table.setItem(r, 0, QTableWidgetItem(name))
+                item = QTableWidgetItem(f"{value:,.2f}")
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(r, 1, item)
@@ -1,11 +1,6 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from .boq_results import BoqEmissionsView
 
 
-class MachineryEmissions(QWidget):
-    def __init__(self):
-        super().__init__()
-
-        main_layout = QVBoxLayout()
-        self.setLayout(main_layout)
-
-        main_layout.addWidget(QLabel("Welcome to Machinery Emissions"))
\ No newline at end of file
+class MachineryEmissions(BoqEmissionsView):
+    KIND = "machinery"
+    TITLE = "Construction Machinery"
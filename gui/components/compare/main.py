@@ -0,0 +1,126 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QDialog, QDialogButtonBox, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+    QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QMessageBox
+)
+
+from core.calculation import COMPONENT_LABELS
+from core.diff import diff_projects, compare_outputs
+
+CURRENT_LABEL = "Current project (unsaved edits included)"
+# Longest value text shown in a diff cell
+MAX_CELL_CHARS = 200
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    text = str(value)
+    return text if len(text) <= MAX_CELL_CHARS else text[:MAX_CELL_CHARS] + "…"
+
+
+class CompareDialog(QDialog):
+    """
+    Field-level comparison between two versions of a project: any two
+    checkpoints, or a checkpoint against the live model. Also shows how
+    the changed inputs move each output.
+    """
+
+    def __init__(self, persistence, model, left_file=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Compare Versions")
+        self.resize(900, 600)
+        self.persistence = persistence
+        self.model = model
+
+        # (label, checkpoint filename or None for the live model)
+        self.sources = [(CURRENT_LABEL, None)] + persistence.list_checkpoints()
+
+        layout = QVBoxLayout(self)
+        pick_row = QHBoxLayout()
+        self.left_combo = QComboBox()
+        self.right_combo = QComboBox()
+        for label, _ in self.sources:
+            self.left_combo.addItem(label)
+            self.right_combo.addItem(label)
+        files = [f for _, f in self.sources]
+        # Default: newest checkpoint (or the requested one) against the live model
+        if left_file is not None and left_file in files:
+            self.left_combo.setCurrentIndex(files.index(left_file))
+        else:
+            self.left_combo.setCurrentIndex(min(1, len(files) - 1))
+        self.right_combo.setCurrentIndex(0)
+        pick_row.addWidget(QLabel("From:"))
+        pick_row.addWidget(self.left_combo, 1)
+        pick_row.addWidget(QLabel("To:"))
+        pick_row.addWidget(self.right_combo, 1)
+        btn_compare = QPushButton("Compare")
+        btn_compare.clicked.connect(self.run_compare)
+        pick_row.addWidget(btn_compare)
+        layout.addLayout(pick_row)
+
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self.changes_table = QTableWidget(0, 3)
+        self.changes_table.setHorizontalHeaderLabels(["Input", "From", "To"])
+        self.changes_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.changes_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.changes_table.verticalHeader().setVisible(False)
+        splitter.addWidget(self.changes_table)
+
+        self.outputs_table = QTableWidget(0, 4)
+        self.outputs_table.setHorizontalHeaderLabels(["Output", "From", "To", "Δ"])
+        self.outputs_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.outputs_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.outputs_table.verticalHeader().setVisible(False)
+        splitter.addWidget(self.outputs_table)
+        layout.addWidget(splitter)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        if len(self.sources) > 1:
+            self.run_compare()
+
+    def _load(self, index):
+        """Returns (data, digests) for a source."""
+        _, filename = self.sources[index]
+        if filename is None:
+            return self.model.to_dict(), self.model.section_digests()
+        data = self.persistence.load_checkpoint(filename)
+        return data, self.persistence.checkpoint_digests(filename, data)
+
+    def run_compare(self):
+        try:
+            old, old_digests = self._load(self.left_combo.currentIndex())
+            new, new_digests = self._load(self.right_combo.currentIndex())
+        except Exception as e:
+            QMessageBox.critical(self, "Compare Failed", str(e))
+            return
+
+        changes, changed_sections = diff_projects(old, new, old_digests, new_digests)
+        self.summary.setText(
+            f"{len(changes)} changed field(s) in {len(changed_sections)} section(s)"
+            if changes else "No differences in project inputs."
+        )
+
+        self.changes_table.setRowCount(len(changes))
+        for row, c in enumerate(changes):
+            for col, text in enumerate([c.label(), _cell(c.old), _cell(c.new)]):
+                self.changes_table.setItem(row, col, QTableWidgetItem(text))
+
+        rows = compare_outputs(old, new, changed_sections) if changes else []
+        self.outputs_table.setRowCount(len(rows))
+        for row, (name, before, after) in enumerate(rows):
+            values = [
+                COMPONENT_LABELS.get(name, name),
+                f"{before:,.0f}", f"{after:,.0f}", f"{after - before:+,.0f}",
+            ]
+            for col, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                if col:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.outputs_table.setItem(row, col, item)
@@ -1,11 +1,71 @@
-from PySide6.QtWidgets import  QWidget, QLabel, QVBoxLayout
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QGridLayout, QComboBox
+from PySide6.QtCore import Qt
+
+from core import reference_data as ref
+from gui.shared import set_shared_options
+
+# ---------------------------------------------------------------------------
+# Field definitions
+# Each entry: (key, label, options)
+# ---------------------------------------------------------------------------
+
+DEMOLITION_FIELDS = [
+    ("demolition_method", "Demolition Method", list(ref.DEMOLITION_METHODS)),
+]
+
+DEMOLITION_DEFAULTS = {
+    "demolition_method": ref.DEFAULT_DEMOLITION_METHOD,
+}
 
 
 class Demolition(QWidget):
     def __init__(self):
         super().__init__()
 
-        main_layout = QVBoxLayout()
-        self.setLayout(main_layout)
+        self.widgets = {}  # key -> QComboBox
+
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(10, 20, 10, 10)
+        main_layout.setSpacing(10)
+        main_layout.addWidget(QLabel(
+            "The bridge is demolished in the last year of its design life "
+            "(Financial Data); recovery rates are set on the Recycling page."
+        ))
+
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(10)
+        for row, (key, label, options) in enumerate(DEMOLITION_FIELDS):
+            grid.addWidget(QLabel(label), row, 0, alignment=Qt.AlignVCenter)
+            combo = QComboBox()
+            set_shared_options(combo, options)
+            combo.setFixedWidth(220)
+            self.widgets[key] = combo
+            grid.addWidget(combo, row, 1, alignment=Qt.AlignVCenter)
+
+        # Per-method rates, for reference
+        method_grid = QGridLayout()
+        method_grid.setHorizontalSpacing(20)
+        for col, header in enumerate(("Method", "Cost (INR/m²)", "Emissions (kgCO2e/m²)", "Recovery")):
+            method_grid.addWidget(QLabel(header), 0, col)
+        for row, (method, (cost, co2, recovery)) in enumerate(ref.DEMOLITION_METHODS.items(), start=1):
+            method_grid.addWidget(QLabel(method), row, 0)
+            method_grid.addWidget(QLabel(f"{cost:,.0f}"), row, 1)
+            method_grid.addWidget(QLabel(f"{co2:g}"), row, 2)
+            method_grid.addWidget(QLabel(f"x {recovery:.2f}"), row, 3)
+
+        main_layout.addLayout(grid)
+        main_layout.addLayout(method_grid)
+        main_layout.addStretch(1)
+
+    def get_data(self):
+        return {key: w.currentText() for key, w in self.widgets.items()}
+
+    def set_data(self, data: dict):
+        for key, value in data.items():
+            if key in self.widgets:
+                idx = self.widgets[key].findText(str(value))
+                if idx >= 0:
+                    self.widgets[key].setCurrentIndex(idx)
 
-        main_layout.addWidget(QLabel("Welcome to Demolition"))
\ No newline at end of file
+    def reset_defaults(self):
+        self.set_data(DEMOLITION_DEFAULTS)
@@ -0,0 +1,77 @@
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar
+
+from core.persistence import submit_maintenance
+
+
+class FileOpsProgress(QWidget):
+    """
+    Status-bar widget for file operations (core.fileops) queued on the
+    maintenance worker. Shows the running operation's progress and how many
+    are waiting; hidden while idle.
+    """
+    progress = Signal(int, int, str)  # done, total, text (from the worker)
+    done = Signal(object)              # Future of a finished operation
+    failed = Signal(str, str)          # title, error message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ops = {}  # Future -> (title, on_done)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel()
+        layout.addWidget(self.label)
+        self.bar = QProgressBar()
+        self.bar.setFixedWidth(160)
+        layout.addWidget(self.bar)
+
+        self.progress.connect(self._on_progress)
+        self.done.connect(self._on_done)
+        self.setVisible(False)
+
+    def run(self, title, fn, *args, on_done=None):
+        """
+        Queues ``fn(*args, progress=...)``; ``on_done(result)`` is called on
+        the GUI thread when it succeeds. Returns the Future.
+        """
+        future = submit_maintenance(fn, *args, progress=self.progress.emit)
+        self.ops[future] = (title, on_done)
+        if len(self.ops) == 1:
+            self.label.setText(f"{title}...")
+            self.bar.setRange(0, 0)
+        self._show_queue()
+        future.add_done_callback(self.done.emit)
+        return future
+
+    def wait(self):
+        """Blocks until every queued operation has finished."""
+        for future in list(self.ops):
+            try:
+                future.result()
+            except Exception:
+                pass  # reported by _on_done
+
+    def _show_queue(self):
+        waiting = len(self.ops) - 1
+        self.bar.setToolTip(f"{waiting} more queued" if waiting else "")
+        self.setVisible(bool(self.ops))
+
+    def _on_progress(self, done, total, text):
+        title = next(iter(self.ops.values()), ("",))[0]
+        self.bar.setRange(0, max(total, 1))
+        self.bar.setValue(done)
+        self.label.setText(f"{title}: {text}")
+
+    def _on_done(self, future):
+        title, on_done = self.ops.pop(future, (None, None))
+        if title is None:
+            return
+        self._show_queue()
+        try:
+            result = future.result()
+        except Exception as e:
+            self.failed.emit(title, str(e))
+            return
+        if on_done is not None:
+            on_done(result)
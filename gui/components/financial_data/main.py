@@ -121,13 +121,17 @@ class FinancialData(QWidget):
 
     def get_data(self):
         """Returns current field values as a dict keyed by field name."""
-        data = {key: widget.text() for key, widget in self.widgets.items()}
-        # print("Financial Data", data)
+        return {key: widget.text() for key, widget in self.widgets.items()}
+
+    def set_data(self, data: dict):
+        """Populates fields from a dict. Missing keys are left unchanged."""
+        for key, value in data.items():
+            if key in self.widgets:
+                self.widgets[key].setText(str(value))
 
     def reset_defaults(self):
         """Resets all fields to their defined defaults."""
-        for key, widget in self.widgets.items():
-            widget.setText(FINANCIAL_DEFAULTS.get(key, ""))
+        self.set_data(FINANCIAL_DEFAULTS)
 
     def close_widget(self):
         self.closed.emit()
@@ -4,6 +4,8 @@ from PySide6.QtWidgets import (
     QLabel, QVBoxLayout, QGridLayout, QLineEdit, QComboBox
 )
 
+from gui.shared import set_shared_options
+
 # ---------------------------------------------------------------------------
 # Field definitions
 # Each entry: (key, placeholder, widget_type, row, col, row_span, col_span)
@@ -128,7 +130,7 @@ class GeneralInfo(QWidget):
                 w = QComboBox(self.general_widget, placeholderText=placeholder)
                 w.setMaxVisibleItems(10)
                 w.view().setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-                w.addItems(COUNTRIES)
+                set_shared_options(w, COUNTRIES)
                 default_index = w.findText(GENERAL_INFO_DEFAULTS.get(key, ""))
                 if default_index >= 0:
                     w.setCurrentIndex(default_index)
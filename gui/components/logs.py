@@ -1,11 +1,311 @@
-from PySide6.QtWidgets import  QWidget, QLabel, QVBoxLayout
+import os
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QTabWidget, QCheckBox,
+    QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog,
+    QSplitter, QPlainTextEdit
+)
+
+from core.tracing import tracer
+from core.watchdog import watchdog
+from core.profiling import list_profiles, format_stats
+from core.retention import human_size
+
+# Most recent spans shown in the timings table
+MAX_ROWS = 200
+
+
+class TimingsView(QWidget):
+    """Live table of the most recent tracing spans, newest first."""
+
+    def __init__(self):
+        super().__init__()
+        self._seen = -1
+
+        main_layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        self.chk_enabled = QCheckBox("Enable tracing")
+        self.chk_enabled.setChecked(tracer.enabled)
+        self.chk_enabled.toggled.connect(self._toggle_tracing)
+        self.chk_alloc = QCheckBox("Track allocations")
+        self.chk_alloc.setChecked(tracer.track_allocations)
+        self.chk_alloc.setToolTip("Uses tracemalloc; noticeably slows the application")
+        self.chk_alloc.toggled.connect(self._toggle_tracing)
+        controls.addWidget(self.chk_enabled)
+        controls.addWidget(self.chk_alloc)
+        controls.addStretch()
+        btn_clear = QPushButton("Clear")
+        btn_clear.clicked.connect(self._clear)
+        btn_export = QPushButton("Export Chrome Trace...")
+        btn_export.clicked.connect(self._export)
+        controls.addWidget(btn_clear)
+        controls.addWidget(btn_export)
+        main_layout.addLayout(controls)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Span", "Wall (ms)", "CPU (ms)", "Alloc (KB)"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        main_layout.addWidget(self.table)
+
+        self.status = QLabel()
+        self.status.setStyleSheet("color: gray;")
+        main_layout.addWidget(self.status)
+
+        # Poll the ring buffer; spans may be recorded from any thread
+        self.timer = QTimer(self)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start()
+
+    def _toggle_tracing(self):
+        tracer.disable()
+        if self.chk_enabled.isChecked():
+            tracer.enable(track_allocations=self.chk_alloc.isChecked())
+        self.refresh()
+
+    def _clear(self):
+        tracer.clear()
+        self._seen = -1
+        self.refresh()
+
+    def _export(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Chrome Trace", "lcca_trace.json", "JSON (*.json)"
+        )
+        if path:
+            count = tracer.export_chrome_trace(path)
+            self.status.setText(f"Exported {count} spans to {path}")
+
+    def refresh(self):
+        if not self.isVisible() or tracer.recorded == self._seen:
+            return
+        self._seen = tracer.recorded
+        spans = tracer.snapshot()[-MAX_ROWS:][::-1]
+
+        self.table.setRowCount(len(spans))
+        for row, s in enumerate(spans):
+            alloc = "" if s.alloc is None else f"{s.alloc / 1024:,.1f}"
+            values = [s.name, f"{s.wall * 1000:,.2f}", f"{s.cpu * 1000:,.2f}", alloc]
+            for col, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                if col:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
+        self.status.setText(
+            f"{len(tracer.spans)} spans buffered (capacity {tracer.spans.maxlen})"
+        )
+
+
+class StallsView(QWidget):
+    """GUI stalls caught by the watchdog, with the blocked stack of the selected one."""
+
+    def __init__(self):
+        super().__init__()
+        self._seen = -1
+
+        main_layout = QVBoxLayout(self)
+        if watchdog.threshold > 0:
+            text = (
+                f"Reporting event-loop stalls longer than {watchdog.threshold * 1000:.0f} ms"
+                f" (log file: {watchdog.log_path})"
+            )
+        else:
+            text = "Stall detection is disabled (LCCA_STALL_MS=0)."
+        info = QLabel(text)
+        info.setStyleSheet("color: gray;")
+        main_layout.addWidget(info)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self.table = QTableWidget(0, 2)
+        self.table.setHorizontalHeaderLabels(["Started", "Duration (ms)"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.currentCellChanged.connect(self._show_stack)
+        splitter.addWidget(self.table)
+
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        self.stack_view.setPlaceholderText("Select a stall to see where the GUI thread was blocked.")
+        splitter.addWidget(self.stack_view)
+        main_layout.addWidget(splitter)
+
+        self.stalls = []
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start()
+
+    def refresh(self):
+        if not self.isVisible() or watchdog.recorded == self._seen:
+            return
+        self._seen = watchdog.recorded
+        self.stalls = list(watchdog.stalls)[::-1]
+
+        self.table.setRowCount(len(self.stalls))
+        for row, stall in enumerate(self.stalls):
+            self.table.setItem(row, 0, QTableWidgetItem(stall["started_at"]))
+            item = QTableWidgetItem(f"{stall['duration'] * 1000:,.0f}")
+            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.table.setItem(row, 1, item)
+
+    def _show_stack(self, row, *_):
+        if 0 <= row < len(self.stalls):
+            self.stack_view.setPlainText(self.stalls[row]["stack"])
+
+
+class ProfilesView(QWidget):
+    """Profiled actions of the current project, slowest first."""
+
+    def __init__(self):
+        super().__init__()
+        self.profile_dir = os.path.join(os.getcwd(), "profiles")
+        self.entries = []
+
+        main_layout = QVBoxLayout(self)
+        controls = QHBoxLayout()
+        self.info = QLabel()
+        self.info.setStyleSheet("color: gray;")
+        controls.addWidget(self.info)
+        controls.addStretch()
+        btn_refresh = QPushButton("Refresh")
+        btn_refresh.clicked.connect(self.refresh)
+        controls.addWidget(btn_refresh)
+        main_layout.addLayout(controls)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Action", "Time", "Wall (ms)", "Peak (KB)"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.currentCellChanged.connect(self._show_report)
+        splitter.addWidget(self.table)
+
+        self.report_view = QPlainTextEdit()
+        self.report_view.setReadOnly(True)
+        self.report_view.setPlaceholderText("Select an action to see its profile.")
+        splitter.addWidget(self.report_view)
+        main_layout.addWidget(splitter)
+
+    def set_profile_dir(self, path):
+        self.profile_dir = path
+        self.refresh()
+
+    def showEvent(self, event):
+        self.refresh()
+        super().showEvent(event)
+
+    def refresh(self):
+        self.info.setText(f"Profiles folder: {self.profile_dir}")
+        self.entries = list_profiles(self.profile_dir)
+        self.table.setRowCount(len(self.entries))
+        for row, e in enumerate(self.entries):
+            values = [
+                e["action"], e["timestamp"],
+                f"{e['wall'] * 1000:,.1f}", f"{e['peak_bytes'] / 1024:,.1f}",
+            ]
+            for col, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                if col >= 2:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
+        self.report_view.clear()
+
+    def _show_report(self, row, *_):
+        if not 0 <= row < len(self.entries):
+            return
+        e = self.entries[row]
+        parts = []
+        try:
+            with open(os.path.join(self.profile_dir, e["alloc"]), "r") as f:
+                parts.append(f.read())
+            parts.append(format_stats(os.path.join(self.profile_dir, e["pstats"])))
+        except (OSError, TypeError, ValueError) as ex:
+            parts.append(f"Could not read profile: {ex}")
+        self.report_view.setPlainText("\n".join(parts))
+
+
+class MemoryView(QWidget):
+    """Process memory and what each open window costs."""
+
+    def __init__(self):
+        super().__init__()
+        self.source = None  # () -> (rss_bytes, [(title, qt_objects, pages, spawn_cost)])
+
+        main_layout = QVBoxLayout(self)
+        controls = QHBoxLayout()
+        self.info = QLabel()
+        controls.addWidget(self.info)
+        controls.addStretch()
+        btn_refresh = QPushButton("Refresh")
+        btn_refresh.clicked.connect(self.refresh)
+        controls.addWidget(btn_refresh)
+        main_layout.addLayout(controls)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(
+            ["Window", "Qt objects", "Pages built", "Memory at open"]
+        )
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        main_layout.addWidget(self.table)
+
+        note = QLabel(
+            "Memory at open is the growth of the process when the window was created."
+        )
+        note.setStyleSheet("color: gray;")
+        main_layout.addWidget(note)
+
+    def showEvent(self, event):
+        self.refresh()
+        super().showEvent(event)
+
+    def refresh(self):
+        if self.source is None:
+            return
+        rss, rows = self.source()
+        costs = [cost for _, _, _, cost in rows[1:] if cost is not None]
+        avg = f"{human_size(sum(costs) / len(costs))} per extra window" if costs else ""
+        total = human_size(rss) if rss is not None else "unknown"
+        self.info.setText(f"Process memory: {total}    {len(rows)} window(s)    {avg}")
+        self.table.setRowCount(len(rows))
+        for row, (title, objects, pages, cost) in enumerate(rows):
+            values = [title, f"{objects:,}", str(pages), human_size(cost) if cost is not None else ""]
+            for col, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                if col:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
 
 
 class Logs(QWidget):
     def __init__(self):
         super().__init__()
-        
+
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
 
-        main_layout.addWidget(QLabel("Welcome to Logs\nLogs will show here."))
\ No newline at end of file
+        self.tabs = QTabWidget()
+        self.timings = TimingsView()
+        self.tabs.addTab(self.timings, "Timings")
+        self.stalls = StallsView()
+        self.tabs.addTab(self.stalls, "Stalls")
+        self.profiles = ProfilesView()
+        self.tabs.addTab(self.profiles, "Profiles")
+        self.memory = MemoryView()
+        self.tabs.addTab(self.memory, "Memory")
+        main_layout.addWidget(self.tabs)
+
+    def set_profile_dir(self, path):
+        self.profiles.set_profile_dir(path)
+
+    def set_memory_source(self, source):
+        self.memory.source = source
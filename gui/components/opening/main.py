@@ -0,0 +1,39 @@
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar, QPushButton
+
+
+class OpenProgress(QWidget):
+    """
+    Page shown while a project is read in the background: the project being
+    opened, the progress of the read and a Cancel button.
+    """
+    cancelled = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.title = QLabel()
+        self.title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.title)
+        self.bar = QProgressBar()
+        self.bar.setFixedWidth(360)
+        layout.addWidget(self.bar, 0, Qt.AlignmentFlag.AlignHCenter)
+        self.label = QLabel()
+        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label.setStyleSheet("color: gray;")
+        layout.addWidget(self.label)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.clicked.connect(self.cancelled.emit)
+        layout.addWidget(self.btn_cancel, 0, Qt.AlignmentFlag.AlignHCenter)
+
+    def start(self, name):
+        self.title.setText(f"<h3>Opening {name}...</h3>")
+        self.bar.setRange(0, 100)
+        self.bar.setValue(0)
+        self.label.setText("Reading project file...")
+
+    def set_progress(self, percent, text):
+        self.bar.setValue(percent)
+        self.label.setText(text)
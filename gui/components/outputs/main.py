@@ -0,0 +1,373 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from PySide6.QtCore import Qt, QPointF, QRectF, QTimer, Signal
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap, QPolygonF
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton
+
+from core.calculation import COMPONENT_LABELS, EMISSION_COMPONENTS
+from core.charts import CHARTS, stored_charts, downsample_charts
+
+SERIES_COLORS = [
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
+]
+BAND_COLOR = QColor(31, 119, 180, 60)
+# Plot margins (left, top, right, bottom) in pixels
+MARGINS = (64, 28, 12, 28)
+# Legend entries drawn before "+N more"
+MAX_LEGEND = 8
+# Delay before re-downsampling after a resize (ms)
+RESIZE_DEBOUNCE_MS = 150
+
+
+def format_value(value):
+    for limit, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if abs(value) >= limit:
+            return f"{value / limit:.1f}{suffix}"
+    return f"{value:.0f}" if abs(value) >= 10 else f"{value:.2f}"
+
+
+class ChartView(QWidget):
+    """
+    Line chart painted with QPainter. The plot is rendered once into a pixmap
+    and only redrawn when the data or the widget size changes; the hover
+    cursor is painted on top of the cached pixmap.
+    """
+
+    def __init__(self, title, unit, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.unit = unit
+        self.data = None
+        self._pixmap = None
+        self._hover_x = None
+        self.setMinimumSize(320, 220)
+        self.setMouseTracking(True)
+
+    def set_data(self, data):
+        self.data = data
+        self._pixmap = None
+        self.update()
+
+    def plot_width(self):
+        return max(self.width() - MARGINS[0] - MARGINS[2], 1)
+
+    # --- Geometry ---
+
+    def _ranges(self):
+        xs, ys = [], []
+        for _, x, y in self.data["series"]:
+            xs.append(x)
+            ys.append(y)
+        if self.data["band"] is not None:
+            x, lo, hi = self.data["band"]
+            xs.append(x)
+            ys.extend([lo, hi])
+        x_all = np.concatenate(xs)
+        y_all = np.concatenate(ys)
+        y_min, y_max = min(float(y_all.min()), 0.0), float(y_all.max())
+        if y_max == y_min:
+            y_max = y_min + 1.0
+        return float(x_all.min()), max(float(x_all.max()), float(x_all.min()) + 1.0), y_min, y_max
+
+    def _plot_rect(self):
+        left, top, right, bottom = MARGINS
+        return QRectF(left, top, self.width() - left - right, self.height() - top - bottom)
+
+    def _to_pixels(self, x, y):
+        rect = self._plot_rect()
+        x0, x1, y0, y1 = self._range
+        px = rect.left() + (np.asarray(x) - x0) / (x1 - x0) * rect.width()
+        py = rect.bottom() - (np.asarray(y) - y0) / (y1 - y0) * rect.height()
+        return px, py
+
+    def _polygon(self, x, y):
+        px, py = self._to_pixels(x, y)
+        return QPolygonF([QPointF(a, b) for a, b in zip(px.tolist(), py.tolist())])
+
+    # --- Rendering ---
+
+    def _render(self):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.white)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.drawText(QRectF(0, 4, self.width(), 20), Qt.AlignHCenter, f"{self.title} ({self.unit})")
+
+        if not self.data or not (self.data["series"] or self.data["band"]):
+            p.setPen(QColor("gray"))
+            p.drawText(self.rect(), Qt.AlignCenter, "No data")
+            p.end()
+            return pixmap
+
+        self._range = self._ranges()
+        rect = self._plot_rect()
+        x0, x1, y0, y1 = self._range
+
+        # Axes and grid
+        p.setPen(QPen(QColor("#dddddd")))
+        for i in range(5):
+            value = y0 + (y1 - y0) * i / 4
+            _, py = self._to_pixels(x0, value)
+            p.drawLine(QPointF(rect.left(), float(py)), QPointF(rect.right(), float(py)))
+            p.setPen(QColor("#555555"))
+            p.drawText(QRectF(0, float(py) - 8, MARGINS[0] - 6, 16),
+                       Qt.AlignRight | Qt.AlignVCenter, format_value(value))
+            p.setPen(QPen(QColor("#dddddd")))
+        p.setPen(QColor("#555555"))
+        p.drawRect(rect)
+        p.drawText(QRectF(rect.left(), rect.bottom() + 2, 60, 20), Qt.AlignLeft, f"{x0:.0f}")
+        p.drawText(QRectF(rect.right() - 60, rect.bottom() + 2, 60, 20), Qt.AlignRight, f"{x1:.0f}")
+        p.drawText(QRectF(rect.left(), rect.bottom() + 2, rect.width(), 20), Qt.AlignHCenter, "Year")
+
+        # Band, then series
+        if self.data["band"] is not None:
+            x, lo, hi = self.data["band"]
+            outline = self._polygon(np.concatenate([x, x[::-1]]), np.concatenate([hi, lo[::-1]]))
+            p.setPen(Qt.NoPen)
+            p.setBrush(BAND_COLOR)
+            p.drawPolygon(outline)
+            p.setBrush(Qt.NoBrush)
+        for i, (_, x, y) in enumerate(self.data["series"]):
+            p.setPen(QPen(QColor(SERIES_COLORS[i % len(SERIES_COLORS)]), 1.5))
+            p.drawPolyline(self._polygon(x, y))
+
+        # Legend
+        labels = [label for label, _, _ in self.data["series"]]
+        shown = labels[:MAX_LEGEND]
+        if len(labels) > MAX_LEGEND:
+            shown.append(f"+{len(labels) - MAX_LEGEND} more")
+        for i, label in enumerate(shown):
+            y = rect.top() + 6 + i * 14
+            if i < MAX_LEGEND:
+                p.fillRect(QRectF(rect.left() + 8, y + 3, 10, 3), QColor(SERIES_COLORS[i % len(SERIES_COLORS)]))
+            p.setPen(QColor("#333333"))
+            p.drawText(QRectF(rect.left() + 22, y - 4, rect.width() - 30, 14), Qt.AlignLeft, label)
+        p.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        if self._pixmap is None or self._pixmap.deviceIndependentSize().toSize() != self.size():
+            self._pixmap = self._render()
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._pixmap)
+        if self._hover_x is not None and self.data and self.data["series"]:
+            self._paint_cursor(p)
+        p.end()
+
+    def _paint_cursor(self, p):
+        rect = self._plot_rect()
+        x0, x1, _, _ = self._range
+        year = x0 + (self._hover_x - rect.left()) / rect.width() * (x1 - x0)
+        p.setPen(QPen(QColor("#888888"), 1, Qt.DashLine))
+        p.drawLine(QPointF(self._hover_x, rect.top()), QPointF(self._hover_x, rect.bottom()))
+        lines = [f"Year {year:.0f}"]
+        for label, x, y in self.data["series"][:MAX_LEGEND]:
+            i = min(int(np.searchsorted(x, year)), len(x) - 1)
+            lines.append(f"{label}: {format_value(float(y[i]))}")
+        box = QRectF(rect.right() - 170, rect.top() + 4, 166, 14 * len(lines) + 6)
+        p.fillRect(box, QColor(255, 255, 255, 220))
+        p.setPen(QColor("#333333"))
+        p.drawText(box.adjusted(4, 2, -4, -2), Qt.AlignLeft, "\n".join(lines))
+
+    def mouseMoveEvent(self, event):
+        rect = self._plot_rect()
+        x = event.position().x()
+        self._hover_x = x if rect.left() <= x <= rect.right() else None
+        self.update()
+
+    def leaveEvent(self, event):
+        self._hover_x = None
+        self.update()
+
+
+class Outputs(QWidget):
+    """
+    Outputs page: project summary plus cash-flow, cumulative LCC, emissions
+    and uncertainty charts for the base design and every alternative.
+
+    The page never calculates on its own: it draws the results of the last
+    Calculate run, or those the project's results store (set_store) holds
+    for the current inputs, and otherwise offers a Calculate button
+    (calculate_requested). Stored series are read and downsampled on a
+    worker thread; a resize only re-downsamples the cached full-resolution
+    series. During a Calculate run (begin_run .. end_run) the page shows
+    what the run streams: component totals as they finish, then the charts.
+    Charts of a run that ended before its uncertainty band are kept (and
+    re-downsampled on resize) with the Calculate button shown.
+    """
+    prepared = Signal(object)
+    calculate_requested = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.model = None
+        self.store = None  # core.results_store.ResultsStore of the project
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._raw = None
+        self._raw_key = None
+        self._shown = (None, None)  # (data key, width) currently drawn
+        self._generation = 0
+        self._streaming = False  # a Calculate run feeds the page
+        self._totals = {}        # component -> result total streamed by the run
+
+        layout = QVBoxLayout(self)
+        self.metadata = QLabel()
+        self.metadata.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.metadata)
+        status_row = QHBoxLayout()
+        self.status = QLabel()
+        self.status.setStyleSheet("color: gray;")
+        status_row.addWidget(self.status)
+        status_row.addStretch()
+        self.btn_calculate = QPushButton("Calculate")
+        self.btn_calculate.clicked.connect(self.calculate_requested.emit)
+        self.btn_calculate.hide()
+        status_row.addWidget(self.btn_calculate)
+        layout.addLayout(status_row)
+        self.summary = QLabel()
+        self.summary.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.summary)
+
+        grid = QGridLayout()
+        self.charts = {}
+        for i, (key, title, unit) in enumerate(CHARTS):
+            view = ChartView(title, unit)
+            self.charts[key] = view
+            grid.addWidget(view, i // 2, i % 2)
+        layout.addLayout(grid, 1)
+
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self.resize_timer.timeout.connect(self.refresh)
+        self.prepared.connect(self._show_charts)
+
+    def set_store(self, store):
+        self.store = store
+
+    def set_model(self, model):
+        self.model = model
+        self._raw = None
+        self._raw_key = None
+        self._shown = (None, None)
+        for view in self.charts.values():
+            view.set_data(None)
+        if self.isVisible():
+            self.refresh()
+
+    def refresh(self):
+        """
+        Re-prepares the charts if the inputs or the chart width changed, from
+        results already calculated for the current inputs only.
+        """
+        if self.model is None or self._streaming:
+            return
+        key = self.model.inputs_key()
+        width = next(iter(self.charts.values())).plot_width()
+        if (key, width) == self._shown:
+            return
+        self._generation += 1
+        raw = self._raw if key == self._raw_key else None
+        if raw is None and self.store is None:
+            self._show_out_of_date(key, width)
+            return
+        if raw is None:
+            self.status.setText("Loading results...")
+        future = self._executor.submit(
+            self._prepare, raw, key, width, self._generation, self.store
+        )
+        future.add_done_callback(self.prepared.emit)
+
+    def _show_out_of_date(self, key, width):
+        self._shown = (key, width)
+        self.status.setText("Results are out of date.")
+        self.btn_calculate.show()
+        self.summary.setText("")
+        for view in self.charts.values():
+            view.set_data(None)
+
+    # --- Calculate runs ---
+
+    def begin_run(self):
+        self._streaming = True
+        self._generation += 1  # drop charts still being prepared
+        self._totals = {}
+        self.summary.setText("")
+        self.status.setText("Calculating...")
+        self.btn_calculate.hide()
+
+    def show_component(self, name, result):
+        """Adds a component total streamed by the run to the summary table."""
+        self._totals[name] = result["total"]
+        rows = [
+            f"<tr><td>{COMPONENT_LABELS.get(n, n)}</td><td align='right'>{total:,.2f}</td></tr>"
+            for n, total in self._totals.items()
+        ]
+        costs = [t for n, t in self._totals.items() if n not in EMISSION_COMPONENTS]
+        rows.append(
+            f"<tr><td><b>{COMPONENT_LABELS['total_cost']}</b></td>"
+            f"<td align='right'><b>{sum(costs):,.2f}</b></td></tr>"
+        )
+        self.summary.setText(f"<table cellspacing='6'>{''.join(rows)}</table>")
+
+    def show_charts(self, raw, key):
+        """Draws charts streamed by the run (the uncertainty band may still be missing)."""
+        self._raw, self._raw_key = raw, key  # later refreshes only downsample
+        self._generation += 1
+        width = next(iter(self.charts.values())).plot_width()
+        future = self._executor.submit(
+            self._prepare, raw, key, width, self._generation, None
+        )
+        future.add_done_callback(self.prepared.emit)
+
+    def end_run(self, message=""):
+        self._streaming = False
+        self.status.setText(message)
+        self.btn_calculate.setVisible(not self._complete())
+
+    def _complete(self):
+        """Whether the cached charts include the uncertainty band."""
+        return self._raw is not None and self._raw["uncertainty"]["band"] is not None
+
+    @staticmethod
+    def _prepare(raw, key, width, generation, store):
+        if raw is None:
+            stored = store.load(key)
+            if stored is None:
+                return None, key, width, generation, None  # nothing calculated for these inputs
+            raw = stored_charts(stored)
+        return raw, key, width, generation, downsample_charts(raw, width)
+
+    def _show_charts(self, future):
+        try:
+            raw, key, width, generation, charts = future.result()
+        except Exception as e:
+            self.status.setText(f"Charts unavailable: {e}")
+            return
+        if generation != self._generation:
+            return  # superseded by a newer request
+        if raw is None:
+            self._show_out_of_date(key, width)
+            return
+        self._raw, self._raw_key = raw, key
+        self._shown = (key, width)
+        if not self._streaming:
+            complete = self._complete()
+            self.status.setText("" if complete else "The uncertainty band was not calculated.")
+            self.btn_calculate.setVisible(not complete)
+        for name, view in self.charts.items():
+            view.set_data(charts[name])
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.model is not None:
+            self.resize_timer.start()
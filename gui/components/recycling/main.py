@@ -1,11 +1,76 @@
-from PySide6.QtWidgets import  QWidget, QLabel, QVBoxLayout
+from PySide6.QtWidgets import (
+    QWidget, QLabel, QVBoxLayout, QScrollArea, QSizePolicy, QGridLayout, QLineEdit
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QDoubleValidator
+
+from core import reference_data as ref
+
+# ---------------------------------------------------------------------------
+# Material rows: recovery rate (%) at the end of the design life.
+# Blank fields use the reference rate shown as placeholder.
+# ---------------------------------------------------------------------------
+
+RECYCLING_MATERIALS = list(ref.BOQ_MATERIALS)
 
 
 class Recycling(QWidget):
     def __init__(self):
         super().__init__()
 
-        main_layout = QVBoxLayout()
-        self.setLayout(main_layout)
+        self.recovery_rate = {}  # material -> QLineEdit
+
+        self.setObjectName("central_panel_widget")
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        content = QWidget()
+        content.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        scroll_area.setWidget(content)
+
+        layout = QVBoxLayout(content)
+        layout.setContentsMargins(10, 20, 10, 10)
+        layout.setSpacing(10)
+        layout.addWidget(QLabel(
+            "Share of each material recovered for reuse or recycling when the bridge is "
+            "demolished; the rest goes to landfill."
+        ))
+
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(10)
+        grid.addWidget(QLabel("Material"), 0, 0)
+        grid.addWidget(QLabel("Recovery Rate (%)"), 0, 1)
+        grid.addWidget(QLabel("Salvage Value (INR/t)"), 0, 2)
+
+        for row, material in enumerate(RECYCLING_MATERIALS, start=1):
+            grid.addWidget(QLabel(f"{material}:"), row, 0, alignment=Qt.AlignVCenter)
+            field = QLineEdit()
+            field.setFixedWidth(120)
+            field.setValidator(QDoubleValidator(0.0, 100.0, 2, field))
+            field.setPlaceholderText(f"{ref.RECOVERY_RATES[material]:g}")
+            self.recovery_rate[material] = field
+            grid.addWidget(field, row, 1, alignment=Qt.AlignVCenter)
+            grid.addWidget(QLabel(f"{ref.SALVAGE_VALUES[material]:,.0f}"), row, 2, alignment=Qt.AlignVCenter)
+
+        layout.addLayout(grid)
+        layout.addStretch(1)
+        main_layout.addWidget(scroll_area)
+
+    def get_data(self):
+        """Returns {"recovery_rate": {material: float or None}}."""
+        return {"recovery_rate": {
+            material: float(w.text()) if w.text() else None
+            for material, w in self.recovery_rate.items()
+        }}
+
+    def set_data(self, data: dict):
+        for material, value in data.get("recovery_rate", {}).items():
+            if material in self.recovery_rate:
+                self.recovery_rate[material].setText("" if value is None else str(value))
 
-        main_layout.addWidget(QLabel("Welcome to Recycling"))
\ No newline at end of file
+    def reset_defaults(self):
+        """Blank rates: the reference rates apply."""
+        self.set_data({"recovery_rate": {m: None for m in RECYCLING_MATERIALS}})
@@ -0,0 +1,124 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar, QPushButton
+
+from core.reports import ReportJob
+
+# How often the worker's progress queue is drained (ms)
+POLL_INTERVAL_MS = 100
+
+
+class ReportProgress(QWidget):
+    """
+    Status-bar widget that runs one report job at a time in a worker process
+    and shows its progress with a Cancel button. Hidden while idle. Jobs are
+    started on a worker thread, where the project is pickled for the worker
+    process.
+    """
+    finished = Signal(str)   # path of the written report
+    failed = Signal(str)     # error message
+    cancelled = Signal()
+    started = Signal(object)  # Future of the ReportJob being started
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.job = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._starting = None  # Future of the job while it starts
+        self._abort = threading.Event()
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel()
+        layout.addWidget(self.label)
+        self.bar = QProgressBar()
+        self.bar.setFixedWidth(160)
+        self.bar.setRange(0, 0)  # busy until the first progress message
+        layout.addWidget(self.bar)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.clicked.connect(self.cancel)
+        layout.addWidget(self.btn_cancel)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(POLL_INTERVAL_MS)
+        self.timer.timeout.connect(self._poll)
+        self.started.connect(self._on_started)
+        self.setVisible(False)
+
+    def is_busy(self):
+        return self.job is not None or self._starting is not None
+
+    def start(self, kind, path, project, cache_dir=None, title="Generating report"):
+        """
+        Starts a report job on ``project`` (a snapshot the caller no longer
+        changes). Returns False if one is already running.
+        """
+        if self.is_busy():
+            return False
+        self.title = title
+        self._abort = threading.Event()
+        self._starting = self._executor.submit(
+            self._create_job, self._abort, kind, path, project, cache_dir
+        )
+        self._starting.add_done_callback(self.started.emit)
+        self.label.setText(f"{title}...")
+        self.bar.setRange(0, 0)
+        self.btn_cancel.setEnabled(True)
+        self.setVisible(True)
+        return True
+
+    @staticmethod
+    def _create_job(abort, kind, path, project, cache_dir):
+        """The ReportJob, or None if the report was cancelled before it started."""
+        return None if abort.is_set() else ReportJob(kind, path, project, cache_dir)
+
+    def _on_started(self, future):
+        self._starting = None
+        try:
+            self.job = future.result()
+        except Exception as e:
+            self.setVisible(False)
+            self.failed.emit(f"Could not start the report worker: {e}")
+            return
+        if self.job is None:
+            self.setVisible(False)
+            self.cancelled.emit()
+            return
+        if self._abort.is_set():
+            self.job.cancel()
+        self.timer.start()
+
+    def cancel(self):
+        if not self.is_busy():
+            return
+        self._abort.set()
+        if self.job is not None:
+            self.job.cancel()
+        self.btn_cancel.setEnabled(False)
+        self.label.setText(f"{self.title}: cancelling...")
+
+    def _poll(self):
+        for message in self.job.poll():
+            kind = message[0]
+            if kind == "progress":
+                _, done, total, text = message
+                self.bar.setRange(0, total)
+                self.bar.setValue(done)
+                self.label.setText(f"{self.title}: {text}")
+                continue
+            self._finish()
+            if kind == "done":
+                self.finished.emit(message[1])
+            elif kind == "cancelled":
+                self.cancelled.emit()
+            else:
+                self.failed.emit(message[1])
+            return
+
+    def _finish(self):
+        self.timer.stop()
+        self.job.join(1.0)
+        self.job = None
+        self.setVisible(False)
@@ -0,0 +1,103 @@
+import os
+
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import (
+    QDialog, QDialogButtonBox, QVBoxLayout, QFormLayout, QSpinBox, QLabel, QGroupBox
+)
+
+from core.persistence import submit_maintenance
+from core.retention import (
+    DEFAULT_POLICY, PROJECT_SIZE_BUDGET, prune_checkpoints, project_usage,
+    tree_usage, human_size,
+)
+
+# (policy key, label)
+POLICY_FIELDS = [
+    ("keep_last", "Keep most recent"),
+    ("daily",     "Daily checkpoints (days)"),
+    ("weekly",    "Weekly checkpoints (weeks)"),
+    ("monthly",   "Monthly checkpoints (months)"),
+]
+
+
+class RetentionDialog(QDialog):
+    """
+    Edits the project's checkpoint retention policy and reports disk usage
+    for the project and the whole projects folder (computed in the background).
+    """
+    usage_ready = Signal(object)
+
+    def __init__(self, persistence, policy, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Checkpoint Retention")
+        self.setMinimumWidth(420)
+        self.persistence = persistence
+
+        layout = QVBoxLayout(self)
+
+        policy_box = QGroupBox("Retention policy")
+        form = QFormLayout(policy_box)
+        self.spins = {}
+        policy = {**DEFAULT_POLICY, **(policy or {})}
+        for key, label in POLICY_FIELDS:
+            spin = QSpinBox()
+            spin.setRange(0, 1000)
+            spin.setValue(int(policy[key]))
+            spin.valueChanged.connect(self._update_preview)
+            self.spins[key] = spin
+            form.addRow(label, spin)
+        note = QLabel("Checkpoints you named yourself are pinned and never pruned.")
+        note.setStyleSheet("color: gray;")
+        form.addRow(note)
+        self.preview = QLabel()
+        form.addRow(self.preview)
+        layout.addWidget(policy_box)
+
+        usage_box = QGroupBox("Disk usage")
+        usage_layout = QVBoxLayout(usage_box)
+        self.usage_label = QLabel("Calculating...")
+        usage_layout.addWidget(self.usage_label)
+        layout.addWidget(usage_box)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.button(QDialogButtonBox.Ok).setText("Save && Prune")
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self._update_preview()
+        self.usage_ready.connect(self._show_usage)
+        projects_dir = os.path.dirname(persistence.base_path)
+        submit_maintenance(self._compute_usage, projects_dir).add_done_callback(
+            lambda f: self.usage_ready.emit(f)
+        )
+
+    def get_policy(self):
+        return {key: spin.value() for key, spin in self.spins.items()}
+
+    def _update_preview(self):
+        result = prune_checkpoints(self.persistence, self.get_policy(), dry_run=True)
+        self.preview.setText(
+            f"Keeps {result['kept']} checkpoint(s); would delete "
+            f"{len(result['deleted'])} ({human_size(result['freed'])})."
+        )
+
+    def _compute_usage(self, projects_dir):
+        return project_usage(self.persistence.base_path), tree_usage(projects_dir)
+
+    def _show_usage(self, future):
+        try:
+            project, tree = future.result()
+        except Exception as e:
+            self.usage_label.setText(f"Could not compute usage: {e}")
+            return
+        tree_total = sum(u["total"] for u in tree.values())
+        over = [p for p, u in tree.items() if u["total"] > PROJECT_SIZE_BUDGET]
+        self.usage_label.setText(
+            f"<b>This project:</b> {human_size(project['total'])}<br>"
+            f"&nbsp;&nbsp;Checkpoints: {human_size(project['checkpoints'])}<br>"
+            f"&nbsp;&nbsp;Profiles: {human_size(project['profiles'])}<br>"
+            f"&nbsp;&nbsp;Project files: {human_size(project['other'])}<br><br>"
+            f"<b>All projects:</b> {human_size(tree_total)} in {len(tree)} project(s)<br>"
+            f"{len(over)} project(s) over the {human_size(PROJECT_SIZE_BUDGET)} budget"
+        )
@@ -0,0 +1,192 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget,
+    QTableWidget, QTableWidgetItem, QDialog, QDialogButtonBox, QFormLayout,
+    QLineEdit, QComboBox, QHeaderView, QMessageBox
+)
+
+from core.calculation import COMPONENT_LABELS
+from core.scenarios import (
+    Scenario, evaluate_scenarios, compare, load_scenarios, name_error, BASE_SCENARIO,
+)
+from gui.components.bridge_data.main import BRIDGE_DATA_FIELDS
+
+# ---------------------------------------------------------------------------
+# Bridge Data fields a scenario can override
+# ---------------------------------------------------------------------------
+
+SCENARIO_FIELDS = ["bridge_type", "primary_material"]
+
+
+class ScenarioDialog(QDialog):
+    """
+    Asks for a scenario name and the Bridge Data values it overrides. The
+    name must be new (``taken``: names in use) and not BASE_SCENARIO.
+    """
+
+    def __init__(self, taken=(), parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("New Design Alternative")
+        self.taken = set(taken)
+
+        layout = QFormLayout(self)
+        self.name_edit = QLineEdit(placeholderText="Alternative name")
+        layout.addRow("Name", self.name_edit)
+
+        self.combos = {}
+        for key, label, widget_type, *_, options in BRIDGE_DATA_FIELDS:
+            if key not in SCENARIO_FIELDS:
+                continue
+            combo = QComboBox()
+            combo.addItems(options)
+            self.combos[key] = combo
+            layout.addRow(label.rstrip(" *"), combo)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+    def accept(self):
+        error = name_error(self.name_edit.text().strip(), self.taken)
+        if error:
+            QMessageBox.warning(self, "Invalid Name", error)
+            return
+        super().accept()
+
+    def get_scenario(self):
+        name = self.name_edit.text().strip()
+        overrides = {key: combo.currentText() for key, combo in self.combos.items()}
+        return Scenario(name, {"bridge_data": overrides})
+
+
+class ScenarioComparison(QWidget):
+    """
+    Lists the project's design alternatives and shows them side by side
+    with per-component deltas against the base design.
+    """
+    changed = Signal()
+    evaluated = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.model = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(QLabel("<h3>Design Alternatives</h3>"))
+
+        top_row = QHBoxLayout()
+        self.scenario_list = QListWidget()
+        self.scenario_list.setMaximumHeight(120)
+        top_row.addWidget(self.scenario_list)
+
+        btn_col = QVBoxLayout()
+        btn_add = QPushButton("Add Alternative")
+        btn_add.clicked.connect(self.add_scenario)
+        btn_remove = QPushButton("Remove")
+        btn_remove.clicked.connect(self.remove_scenario)
+        self.btn_compare = QPushButton("Compare")
+        self.btn_compare.clicked.connect(self.run_comparison)
+        btn_col.addWidget(btn_add)
+        btn_col.addWidget(btn_remove)
+        btn_col.addWidget(self.btn_compare)
+        btn_col.addStretch()
+        top_row.addLayout(btn_col)
+        main_layout.addLayout(top_row)
+
+        self.table = QTableWidget()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        main_layout.addWidget(self.table)
+
+        self.evaluated.connect(self._show_results)
+
+    # --- Model access ---
+
+    def set_model(self, model):
+        self.model = model
+        self.table.clear()
+        self.table.setRowCount(0)
+        self.table.setColumnCount(0)
+        self._refresh_list()
+
+    def _scenarios(self):
+        return load_scenarios(self.model.get_scenarios())
+
+    def _refresh_list(self):
+        self.scenario_list.clear()
+        if self.model is None:
+            return
+        for s in self._scenarios():
+            summary = ", ".join(
+                str(v) for section in s.overrides.values() for v in section.values()
+            )
+            self.scenario_list.addItem(f"{s.name}  ({summary})")
+
+    # --- Actions ---
+
+    def add_scenario(self):
+        if self.model is None:
+            return
+        dlg = ScenarioDialog([s.name for s in self._scenarios()], self)
+        if dlg.exec() != QDialog.Accepted:
+            return
+        scenarios = self.model.get_scenarios() + [dlg.get_scenario().to_dict()]
+        self.model.set_scenarios(scenarios)
+        self._refresh_list()
+        self.changed.emit()
+
+    def remove_scenario(self):
+        row = self.scenario_list.currentRow()
+        if self.model is None or row < 0:
+            return
+        scenarios = list(self.model.get_scenarios())
+        del scenarios[row]
+        self.model.set_scenarios(scenarios)
+        self._refresh_list()
+        self.changed.emit()
+
+    def run_comparison(self):
+        """Evaluates all alternatives in the background and fills the table when done."""
+        if self.model is None:
+            return
+        self.btn_compare.setEnabled(False)
+        self.btn_compare.setText("Comparing...")
+        future = self._executor.submit(
+            evaluate_scenarios, self.model.snapshot(), self._scenarios()
+        )
+        future.add_done_callback(self.evaluated.emit)
+
+    def _show_results(self, future):
+        self.btn_compare.setEnabled(True)
+        self.btn_compare.setText("Compare")
+        try:
+            evaluated = future.result()
+        except Exception as e:
+            QMessageBox.critical(self, "Comparison Failed", str(e))
+            return
+
+        rows = compare(evaluated)
+        names = list(evaluated)
+        self.table.clear()
+        self.table.setRowCount(len(rows))
+        self.table.setColumnCount(len(names))
+        self.table.setHorizontalHeaderLabels(names)
+        self.table.setVerticalHeaderLabels(
+            [COMPONENT_LABELS.get(label, label) for label, _ in rows]
+        )
+        for r, (label, cells) in enumerate(rows):
+            for c, name in enumerate(names):
+                value, delta = cells[name]
+                text = f"{value:,.0f}"
+                if name != BASE_SCENARIO:
+                    base_value = cells[BASE_SCENARIO][0]
+                    pct = f" / {delta / base_value:+.1%}" if base_value else ""
+                    text += f"\nΔ {delta:+,.0f}{pct}"
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(r, c, item)
+        self.table.resizeRowsToContents()
@@ -1,3 +1,4 @@
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
 from .widgets.foundation import Foundation
 from .widgets.super_structure import SuperStruct
@@ -5,6 +6,9 @@ from .widgets.substructure import SubStruct
 from .widgets.misc_widget import Misc
 
 class StructureTabView(QWidget):
+    """BOQ entry, one tab per structure part; every tab edits the project's single BOQ list."""
+    changed = Signal()
+
     def __init__(self, ):
         super().__init__()
         
@@ -32,10 +36,11 @@ class StructureTabView(QWidget):
         # Tab View
         tab_view = QTabWidget()
         self.tab_view = tab_view
-        tab_view.addTab(Foundation(), "Foundation")
-        tab_view.addTab(SuperStruct(), "Super-Structure")
-        tab_view.addTab(SubStruct(), "Substructure")
-        tab_view.addTab(Misc(), "Miscellaneous")
+        self.tabs = [Foundation(), SuperStruct(), SubStruct(), Misc()]
+        for tab in self.tabs:
+            tab_view.addTab(tab, tab.TAB)
+            tab.changed.connect(self.changed.emit)
+        tab_view.currentChanged.connect(self.refresh)
         
         # Adding Widgets
         main_layout.addWidget(top_area)
@@ -43,4 +48,16 @@ class StructureTabView(QWidget):
     
     def select_tab(self, name):
         tabs = ["Foundation", "Super-Structure", "Substructure", "Miscellaneous"]
-        self.tab_view.setCurrentIndex(tabs.index(name))
\ No newline at end of file
+        self.tab_view.setCurrentIndex(tabs.index(name))
+
+    def set_model(self, model):
+        for tab in self.tabs:
+            tab.set_model(model)
+
+    def refresh(self):
+        """Re-reads the BOQ in the current tab (other tabs or an undo may have replaced it)."""
+        self.tab_view.currentWidget().sync()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
@@ -0,0 +1,225 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtWidgets import (
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QHeaderView, QComboBox, QStyledItemDelegate, QAbstractItemView
+)
+
+from core import reference_data as ref
+from gui.binding import parse_value
+from gui.shared import set_shared_options
+
+# ---------------------------------------------------------------------------
+# BOQ columns: (item key, header, kind, options)
+# ---------------------------------------------------------------------------
+
+BOQ_COLUMNS = [
+    ("description", "Description", "str", None),
+    ("material", "Material", "choice", ref.BOQ_MATERIALS),
+    ("unit", "Unit", "str", None),
+    ("quantity", "Quantity", "float", None),
+    ("rate", "Rate", "float", None),
+    ("haul_distance", "Haul Distance (km)", "float", None),
+    ("transport_mode", "Transport Mode", "choice", list(ref.TRANSPORT_FACTORS)),
+    ("equipment", "Equipment", "choice", list(ref.EQUIPMENT_FUEL_RATES)),
+    ("equipment_hours", "Equipment Hours", "float", None),
+]
+
+
+def item_tab(item):
+    """Structure tab an item is listed under (unknown tabs go to Miscellaneous)."""
+    tab = item.get("tab") if isinstance(item, dict) else None
+    return tab if tab in ref.STRUCTURE_TABS else "Miscellaneous"
+
+
+def _text(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class BoqTableModel(QAbstractTableModel):
+    """
+    The items of one structure tab, as rows of the project's BOQ list.
+
+    Rows hold indices into the list. Edits never touch the list in place:
+    each one writes a new list through ProjectModel.set_boq (one undo step,
+    and the emissions cache sees a new list). sync() re-reads the list after
+    another tab or an undo replaced it.
+    """
+    edited = Signal()
+
+    def __init__(self, tab, parent=None):
+        super().__init__(parent)
+        self.tab = tab
+        self.model = None
+        self._boq = []
+        self._rows = []
+
+    def set_model(self, model):
+        self.model = model
+        self._boq = None
+        self.sync()
+
+    def sync(self):
+        """Rebuilds the rows if the project's BOQ list was replaced."""
+        boq = self.model.get_boq() if self.model is not None else []
+        if boq is self._boq:
+            return
+        self.beginResetModel()
+        self._boq = boq
+        self._rows = [i for i, item in enumerate(boq) if item_tab(item) == self.tab]
+        self.endResetModel()
+
+    def _write(self, boq):
+        self._boq = boq
+        self.model.set_boq(boq)
+        self.edited.emit()
+
+    # --- Qt model ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(BOQ_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return BOQ_COLUMNS[section][1]
+        return str(section + 1)
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        item = self._boq[self._rows[index.row()]]
+        if not isinstance(item, dict):
+            return ""
+        return _text(item.get(BOQ_COLUMNS[index.column()][0]))
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or self.model is None:
+            return False
+        key, _, kind, _ = BOQ_COLUMNS[index.column()]
+        text = str(value or "")
+        value = parse_value(text, "float") if kind == "float" else (text.strip() or None)
+        if value is None and text.strip():
+            return False  # malformed number: keep the old value
+        pos = self._rows[index.row()]
+        old = self._boq[pos]
+        item = dict(old) if isinstance(old, dict) else {"tab": self.tab}
+        if item.get(key) == value:
+            return False
+        if value is None:
+            item.pop(key, None)
+        else:
+            item[key] = value
+        boq = list(self._boq)
+        boq[pos] = item
+        self._write(boq)
+        self.dataChanged.emit(index, index)
+        return True
+
+    # --- Rows ---
+
+    def add_item(self):
+        if self.model is None:
+            return
+        ids = [
+            item["id"] for item in self._boq
+            if isinstance(item, dict) and isinstance(item.get("id"), int)
+        ]
+        item = {"id": max(ids, default=0) + 1, "tab": self.tab, "material": "Other", "unit": "cum"}
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(len(self._boq))
+        self._write(self._boq + [item])
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        if self.model is None or not rows:
+            return
+        drop = {self._rows[r] for r in rows}
+        self.beginResetModel()
+        boq = [item for i, item in enumerate(self._boq) if i not in drop]
+        self._rows = [i for i, item in enumerate(boq) if item_tab(item) == self.tab]
+        self._write(boq)
+        self.endResetModel()
+
+
+class _ChoiceDelegate(QStyledItemDelegate):
+    """Editable combo box over a column's reference options."""
+
+    def __init__(self, options, parent=None):
+        super().__init__(parent)
+        self.options = options
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setEditable(True)
+        set_shared_options(combo, self.options)
+        return combo
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.EditRole) or "")
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+
+class BoqTable(QWidget):
+    """BOQ entry for one structure tab (``TAB`` in ref.STRUCTURE_TABS)."""
+    TAB = "Miscellaneous"
+    changed = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.table_model = BoqTableModel(self.TAB, self)
+        self.table_model.edited.connect(self.changed.emit)
+        self.table_model.modelReset.connect(self._update_count)
+        self.table_model.rowsInserted.connect(self._update_count)
+
+        main_layout = QVBoxLayout()
+        self.setLayout(main_layout)
+
+        buttons = QHBoxLayout()
+        self.count = QLabel()
+        buttons.addWidget(self.count)
+        buttons.addStretch()
+        btn_add = QPushButton("Add Item")
+        btn_add.clicked.connect(self.table_model.add_item)
+        btn_remove = QPushButton("Delete Selected")
+        btn_remove.clicked.connect(self.remove_selected)
+        buttons.addWidget(btn_add)
+        buttons.addWidget(btn_remove)
+        main_layout.addLayout(buttons)
+
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column, (_, _, kind, options) in enumerate(BOQ_COLUMNS):
+            if kind == "choice":
+                self.table.setItemDelegateForColumn(column, _ChoiceDelegate(options, self.table))
+        main_layout.addWidget(self.table)
+        self._update_count()
+
+    def set_model(self, model):
+        self.table_model.set_model(model)
+
+    def sync(self):
+        self.table_model.sync()
+
+    def remove_selected(self):
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        self.table_model.remove_rows(rows)
+
+    def _update_count(self):
+        self.count.setText(f"{self.table_model.rowCount()} item(s)")
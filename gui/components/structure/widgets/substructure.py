@@ -1,11 +1,5 @@
-from PySide6.QtWidgets import  QWidget, QLabel, QVBoxLayout
+from .boq_table import BoqTable
 
 
-class SubStruct(QWidget):
-    def __init__(self):
-        super().__init__()
-        
-        main_layout = QVBoxLayout()
-        self.setLayout(main_layout)
-
-        main_layout.addWidget(QLabel("Welcome to Substructure"))
\ No newline at end of file
+class SubStruct(BoqTable):
+    TAB = "Substructure"
@@ -3,7 +3,9 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QLineEdit, QSpacerItem
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIntValidator
+from PySide6.QtGui import QIntValidator, QDoubleValidator
+
+from gui.shared import set_shared_options
 
 # ---------------------------------------------------------------------------
 # Simple field definitions (top-level grid fields)
@@ -34,6 +36,9 @@ TRAFFIC_FIELDS = [
         "Urban Road", "Rural Road",
     ]),
     ("crash_rate",                   "Crash Rate",                    "line",  "(accidents/million km)", False, None),
+    ("traffic_growth_model",         "Traffic Growth Model",          "combo", "",                       False, [
+        "Constant", "Piecewise", "Logistic",
+    ]),
 ]
 
 TRAFFIC_DEFAULTS = {
@@ -45,6 +50,7 @@ TRAFFIC_DEFAULTS = {
     "road_fall":                   "",
     "road_type":                   "",
     "crash_rate":                  "",
+    "traffic_growth_model":        "",
 }
 
 # ---------------------------------------------------------------------------
@@ -61,7 +67,8 @@ ACCIDENT_TYPES = [
 # ---------------------------------------------------------------------------
 # Vehicle table rows
 # Each: (key, label)
-# Two inputs per row: daily traffic (int) + accident distribution (float)
+# Three inputs per row: daily traffic (int), accident distribution (float)
+# and annual growth rate (float, blank for the engine default)
 # ---------------------------------------------------------------------------
 
 VEHICLE_TYPES = [
@@ -76,6 +83,14 @@ VEHICLE_TYPES = [
 ]
 
 
+def _number(text, default):
+    """Float value of a line edit's text; blank or partial input (e.g. "-") gives ``default``."""
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
 # ---------------------------------------------------------------------------
 
 class TrafficData(QWidget):
@@ -86,6 +101,7 @@ class TrafficData(QWidget):
         self.daily_traffic = {}        # vehicle key -> QLineEdit
         self.vehicle_distribution = {} # vehicle key -> QLineEdit
         self.accident_distribution = {}# accident key -> QLineEdit
+        self.growth_rate = {}          # vehicle key -> QLineEdit
 
         self.text_box_width = 200
 
@@ -115,7 +131,7 @@ class TrafficData(QWidget):
         grid_layout.setHorizontalSpacing(10)
         grid_layout.setVerticalSpacing(20)
 
-        # --- Top-level fields (rows 0–7) ---
+        # --- Top-level fields (rows 0–8) ---
         for row, (key, label, widget_type, unit, has_custom, options) in enumerate(TRAFFIC_FIELDS):
             lbl = QLabel(label)
             lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
@@ -125,7 +141,7 @@ class TrafficData(QWidget):
                 w = QComboBox(self.general_widget)
                 w.setFixedWidth(self.text_box_width)
                 w.setPlaceholderText("Select")
-                w.addItems(list(options) + (["Custom"] if has_custom else []))
+                set_shared_options(w, list(options) + (["Custom"] if has_custom else []))
                 if has_custom:
                     w.currentIndexChanged.connect(
                         lambda idx, c=w: self.custom_combo_input(idx, c)
@@ -141,7 +157,9 @@ class TrafficData(QWidget):
             unit_lbl.setAlignment(Qt.AlignLeft)
             grid_layout.addWidget(unit_lbl, row, 2, 1, 1)
 
-        # --- Accident distribution table (row 8) ---
+        table_row = len(TRAFFIC_FIELDS)
+
+        # --- Accident distribution table (row 9) ---
         accident_widget = QWidget(self.general_widget)
         accident_layout = QGridLayout(accident_widget)
         accident_layout.setContentsMargins(8, 8, 8, 8)
@@ -162,15 +180,16 @@ class TrafficData(QWidget):
         acc_row_layout = QHBoxLayout(acc_row_widget)
         acc_row_layout.setContentsMargins(0, 0, 0, 0)
         acc_row_layout.addWidget(accident_widget, alignment=Qt.AlignTop)
-        grid_layout.addWidget(acc_row_widget, 8, 0, 1, 4)
+        grid_layout.addWidget(acc_row_widget, table_row, 0, 1, 4)
 
-        # --- Vehicle composition table (row 9) ---
+        # --- Vehicle composition table (row 10) ---
         vehicle_widget = QWidget(self.general_widget)
         vehicle_layout = QGridLayout(vehicle_widget)
         vehicle_layout.setContentsMargins(8, 8, 8, 8)
         vehicle_layout.addWidget(QLabel("Type of Vehicle"), 0, 0)
         vehicle_layout.addWidget(QLabel("Composition of Various Vehicles"), 0, 1)
         vehicle_layout.addWidget(QLabel("Percentage Accident Distribution"), 0, 2)
+        vehicle_layout.addWidget(QLabel("Annual Growth Rate (%)"), 0, 3)
 
         for i, (key, label) in enumerate(VEHICLE_TYPES):
             lbl = QLabel(f"{label}:")
@@ -186,16 +205,22 @@ class TrafficData(QWidget):
             dist_inp.setFixedWidth(self.text_box_width)
             self.vehicle_distribution[key] = dist_inp
 
+            growth_inp = QLineEdit()
+            growth_inp.setValidator(QDoubleValidator(growth_inp))
+            growth_inp.setFixedWidth(self.text_box_width)
+            self.growth_rate[key] = growth_inp
+
             vehicle_layout.addWidget(lbl, i + 1, 0)
             vehicle_layout.addWidget(daily_inp, i + 1, 1)
             vehicle_layout.addWidget(dist_inp, i + 1, 2)
+            vehicle_layout.addWidget(growth_inp, i + 1, 3)
 
         veh_row_widget = QWidget(self.general_widget)
         veh_row_layout = QHBoxLayout(veh_row_widget)
         veh_row_layout.setContentsMargins(0, 0, 0, 0)
         veh_row_layout.addWidget(vehicle_widget, alignment=Qt.AlignTop)
-        grid_layout.addWidget(QLabel("(Vehicles/Day)"), 9, 4, 1, 4)
-        grid_layout.addWidget(veh_row_widget, 9, 0, 1, 4)
+        grid_layout.addWidget(QLabel("(Vehicles/Day)"), table_row + 1, 4, 1, 4)
+        grid_layout.addWidget(veh_row_widget, table_row + 1, 0, 1, 4)
 
         self.general_layout.addLayout(grid_layout)
         self.general_layout.addStretch(1)
@@ -220,17 +245,21 @@ class TrafficData(QWidget):
                 for key, w in self.widgets.items()
             },
             "daily_traffic": {
-                key: int(w.text()) if w.text() else 0
+                key: int(_number(w.text(), 0))
                 for key, w in self.daily_traffic.items()
             },
             "vehicle_distribution": {
-                key: float(w.text()) if w.text() else 0.0
+                key: _number(w.text(), 0.0)
                 for key, w in self.vehicle_distribution.items()
             },
             "accident_distribution": {
-                key: float(w.text()) if w.text() else 0.0
+                key: _number(w.text(), 0.0)
                 for key, w in self.accident_distribution.items()
             },
+            "growth_rate": {
+                key: _number(w.text(), None)
+                for key, w in self.growth_rate.items()
+            },
         }
 
     def set_data(self, data: dict):
@@ -258,6 +287,10 @@ class TrafficData(QWidget):
             if key in self.accident_distribution:
                 self.accident_distribution[key].setText(str(value))
 
+        for key, value in data.get("growth_rate", {}).items():
+            if key in self.growth_rate:
+                self.growth_rate[key].setText("" if value is None else str(value))
+
     def reset_defaults(self):
         """Resets all fields to defaults and clears table inputs."""
         self.set_data({
@@ -265,6 +298,7 @@ class TrafficData(QWidget):
             "daily_traffic":         {k: "" for k, _ in VEHICLE_TYPES},
             "vehicle_distribution":  {k: "" for k, _ in VEHICLE_TYPES},
             "accident_distribution": {k: "" for k, _ in ACCIDENT_TYPES},
+            "growth_rate":           {k: "" for k, _ in VEHICLE_TYPES},
         })
 
     def custom_combo_input(self, index, combo):
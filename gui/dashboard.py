@@ -1,5 +1,4 @@
 import os
-import json
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -9,8 +8,58 @@ from PySide6.QtWidgets import (
     QLabel,
     QScrollArea,
     QFrame,
+    QLineEdit,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+
+from core.persistence import scan_projects, submit_maintenance
+from core.search import SearchIndex
+from core.tracing import tracer
+from core.retention import load_usage_cache, human_size, PROJECT_SIZE_BUDGET
+
+# Delay between the last keystroke in the search box and filtering (ms)
+SEARCH_DEBOUNCE_MS = 150
+
+
+class DashboardModel(QObject):
+    """
+    The project list shown by every window's dashboard. One instance per
+    application: the projects folder is scanned once per refresh() and the
+    result is shared by all DashboardPages, as is the search index
+    (core.search), brought up to date after every scan on the maintenance
+    worker; ``changed`` is emitted again once that changed it.
+    """
+    changed = Signal()
+
+    def __init__(self, projects_dir):
+        super().__init__()
+        self.projects_dir = projects_dir
+        self.entries = []  # (p_id, display_name, is_recovering)
+        self.usage = {}    # p_id -> disk usage (see core.retention)
+        self.search = SearchIndex(projects_dir)
+
+    @tracer.traced("dashboard.scan")
+    def refresh(self):
+        os.makedirs(self.projects_dir, exist_ok=True)
+        self.entries = scan_projects(self.projects_dir)
+        self.usage = load_usage_cache(self.projects_dir)
+        self.changed.emit()
+        submit_maintenance(self._sync_index, [p_id for p_id, _, _ in self.entries])
+
+    def _sync_index(self, p_ids):
+        """On the maintenance worker: brings the search index up to date and saves it."""
+        with tracer.span("dashboard.index"):
+            updated = self.search.sync(p_ids)
+        self.search.save()
+        if updated:
+            self.changed.emit()  # queued to the dashboards on the GUI thread
+
+    def matching(self, query):
+        """The entries matching the search ``query`` (all of them for an empty query)."""
+        ids = self.search.search(query)
+        if ids is None:
+            return self.entries
+        return [entry for entry in self.entries if entry[0] in ids]
 
 
 class DashboardPage(QWidget):
@@ -18,10 +67,14 @@ class DashboardPage(QWidget):
     The home / project management screen.
     Displays all local projects with Open, Delete actions.
     Highlights projects that need recovery (main file missing/corrupt but .bak exists).
+    Cards are rebuilt from the shared DashboardModel; hidden pages wait until shown.
     """
 
-    def __init__(self, on_new_cb, on_open_cb, on_delete_cb, on_return_cb):
+    def __init__(self, model, on_new_cb, on_open_cb, on_delete_cb, on_return_cb):
         super().__init__()
+        self.model = model
+        self._stale = True
+        model.changed.connect(self._on_model_changed)
         self.on_open = on_open_cb
         self.on_delete = on_delete_cb
         self.on_return = on_return_cb
@@ -58,6 +111,24 @@ class DashboardPage(QWidget):
         # Recent projects list
         layout.addWidget(QLabel("<h3>Recent Projects</h3>"))
 
+        search_row = QHBoxLayout()
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText(
+            "Search projects, e.g. NHAI or client:NHAI material:Steel"
+        )
+        self.search_box.setClearButtonEnabled(True)
+        search_row.addWidget(self.search_box, 1)
+        self.match_count = QLabel()
+        self.match_count.setStyleSheet("color: gray;")
+        search_row.addWidget(self.match_count)
+        layout.addLayout(search_row)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.refresh)
+        self.search_box.textChanged.connect(self.search_timer.start)
+
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll.setFrameShape(QFrame.NoFrame)
@@ -70,12 +141,28 @@ class DashboardPage(QWidget):
         self.scroll.setWidget(self.list_container)
         layout.addWidget(self.scroll)
 
-    def refresh(self, projects_dir, has_active_project=False):
+    def set_has_active_project(self, has_active_project):
+        self.btn_return.setVisible(has_active_project)
+
+    def _on_model_changed(self):
+        self._stale = True
+        if self.isVisible():
+            self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self.refresh()
+
+    @tracer.traced("dashboard.refresh")
+    def refresh(self):
         """
-        Scans the projects directory and rebuilds the project card list.
+        Rebuilds the project card list from the model.
         Cards highlighted in yellow indicate the project needs recovery from .bak.
+        Projects over PROJECT_SIZE_BUDGET (per the last background usage scan) are flagged.
+        Only projects matching the search box are listed.
         """
-        self.btn_return.setVisible(has_active_project)
+        self._stale = False
 
         # Clear existing cards
         for i in reversed(range(self.list_layout.count())):
@@ -83,42 +170,14 @@ class DashboardPage(QWidget):
             if item:
                 item.setParent(None)
 
-        if not os.path.exists(projects_dir):
-            return
-
+        usage = self.model.usage
+        query = self.search_box.text()
+        entries = self.model.matching(query)
+        self.match_count.setText(
+            f"{len(entries)} of {len(self.model.entries)}" if query.strip() else ""
+        )
         found_any = False
-        for p_id in sorted(os.listdir(projects_dir)):
-            p_path = os.path.join(projects_dir, p_id)
-            if not os.path.isdir(p_path):
-                continue
-
-            json_path = os.path.join(p_path, "project.json")
-            bak_path = os.path.join(p_path, "project.json.bak")
-
-            main_ok = os.path.exists(json_path) and os.path.getsize(json_path) > 0
-            bak_ok = os.path.exists(bak_path) and os.path.getsize(bak_path) > 0
-
-            if not main_ok and not bak_ok:
-                continue  # Not a valid project folder
-
-            is_recovering = not main_ok and bak_ok
-            target_file = json_path if main_ok else bak_path
-
-            display_name = p_id
-            try:
-                with open(target_file, "r") as f:
-                    data = json.load(f)
-                    display_name = data.get("metadata", {}).get("project_name", p_id)
-            except Exception:
-                if bak_ok:
-                    is_recovering = True
-                    try:
-                        with open(bak_path, "r") as f:
-                            data = json.load(f)
-                            display_name = data.get("metadata", {}).get("project_name", p_id)
-                    except Exception:
-                        pass
-
+        for p_id, display_name, is_recovering in entries:
             # Build project card
             card = QFrame()
             card.setFrameShape(QFrame.StyledPanel)
@@ -134,6 +193,12 @@ class DashboardPage(QWidget):
                 if is_recovering
                 else ""
             )
+            size = usage.get(p_id, {}).get("total", 0)
+            if size > PROJECT_SIZE_BUDGET:
+                status_tag += (
+                    f"<br><span style='color: #e67e22;'>⚠️  Over size budget "
+                    f"({human_size(size)})</span>"
+                )
             info_label = QLabel(
                 f"<b>{display_name}</b>{status_tag}<br><small>ID: {p_id}</small>"
             )
@@ -155,6 +220,10 @@ class DashboardPage(QWidget):
             found_any = True
 
         if not found_any:
-            empty = QLabel("No local projects found. Create one to get started!")
+            empty = QLabel(
+                "No projects match the search."
+                if self.model.entries
+                else "No local projects found. Create one to get started!"
+            )
             empty.setStyleSheet("color: gray; font-style: italic;")
             self.list_layout.addWidget(empty, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -11,15 +11,16 @@ import os
 import sys
 import uuid
 import json
-import shutil
 import datetime
+import threading
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QObject, QTimer, Signal, QUrl
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
     QDialogButtonBox,
     QButtonGroup,
+    QFileDialog,
     QHBoxLayout,
     QInputDialog,
     QLabel,
@@ -38,7 +39,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QKeySequence, QDesktopServices
 
 # --- LCCA GUI Components ---
 from gui.components.global_info.main import GeneralInfo
@@ -50,14 +51,38 @@ from gui.components.carbon_emission.main import CarbonEmissionTabView
 from gui.components.maintenance.main import Maintenance
 from gui.components.recycling.main import Recycling
 from gui.components.demolition.main import Demolition
+from gui.components.scenarios.main import ScenarioComparison
+from gui.components.outputs.main import Outputs
+from gui.components.compare.main import CompareDialog
+from gui.components.retention.main import RetentionDialog
+from gui.components.reports.main import ReportProgress
+from gui.components.opening.main import OpenProgress
+from gui.components.fileops.main import FileOpsProgress
+from gui.components.calculation.main import CalculationProgress
 from gui.components.logs import Logs
 
 # --- Core persistence & model ---
 from core.model import ProjectModel
-from core.persistence import PersistenceService
+from core.persistence import (
+    PersistenceService, LoadCancelled, submit, submit_maintenance, submit_read,
+)
+from core.results_store import ResultsStore
+from core.schema import new_project, SCHEMA_VERSION
+from core.search import index_fields
+from core.tracing import tracer
+from core.watchdog import watchdog
+from core.profiling import profiler
+from core import retention
+from core import fileops
+from core.reports import REPORT_KINDS
+from core.memory import rss_bytes
+
+# --- Dashboard & form binding ---
+from gui.dashboard import DashboardPage, DashboardModel
+from gui.binding import build_binding
 
-# --- Dashboard ---
-from gui.dashboard import DashboardPage
+# Save dialog filters of Export Report -> file extension
+REPORT_FILTERS = {"Excel Workbook (*.xlsx)": ".xlsx", "PDF Report (*.pdf)": ".pdf"}
 
 
 # ---------------------------------------------------------------------------
@@ -67,7 +92,7 @@ from gui.dashboard import DashboardPage
 class RecoveryDialog(QDialog):
     """Lets the user pick a checkpoint to restore from."""
 
-    def __init__(self, display_names, parent=None):
+    def __init__(self, display_names, parent=None, on_compare=None):
         super().__init__(parent)
         self.setWindowTitle("Version History")
         self.setMinimumWidth(450)
@@ -96,6 +121,9 @@ class RecoveryDialog(QDialog):
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
+        if on_compare:
+            btn_compare = buttons.addButton("Compare with Current...", QDialogButtonBox.ActionRole)
+            btn_compare.clicked.connect(lambda: on_compare(self.get_selected_index()))
         layout.addWidget(buttons)
 
     def get_selected_index(self):
@@ -107,6 +135,15 @@ class RecoveryDialog(QDialog):
 # ---------------------------------------------------------------------------
 
 class ProjectWindow(QMainWindow):
+    # Future of a background checkpoint prune (see _schedule_prune)
+    prune_done = Signal(object)
+    # Future of a background project write (see execute_save)
+    save_done = Signal(object)
+    # Future of a background project read (see load_project)
+    open_done = Signal(object)
+    # (percent, text) reported by the project read
+    open_progress = Signal(int, str)
+
     def __init__(self, manager):
         super().__init__()
         self.manager = manager
@@ -125,6 +162,16 @@ class ProjectWindow(QMainWindow):
         self.force_save_timer.setInterval(4000)
         self.force_save_timer.timeout.connect(self.execute_save)
 
+        self.prune_done.connect(self._on_prune_done)
+        self.save_done.connect(self._on_save_done)
+        self._pending_save = None
+        self._unsaved = {}  # save future -> (model, changes, dirty fields) it writes
+        self._names_changed = False  # refresh dashboards once the save lands
+        self.open_done.connect(self._on_project_read)
+        self._pending_open = None    # Future of the project read in progress
+        self._open_cancel = None     # threading.Event that cancels it
+        self._sync_queue = []        # built pages still showing the previous model
+
         self.setWindowTitle("LCCA - Home")
         self.resize(1200, 750)
 
@@ -133,9 +180,39 @@ class ProjectWindow(QMainWindow):
 
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        self.report_progress = ReportProgress()
+        self.report_progress.finished.connect(self._on_report_finished)
+        self.report_progress.failed.connect(
+            lambda msg: QMessageBox.critical(self, "Report Failed", msg)
+        )
+        self.report_progress.cancelled.connect(
+            lambda: self.status_bar.showMessage("Report cancelled.", 4000)
+        )
+        self.status_bar.addPermanentWidget(self.report_progress)
+        self.file_ops = FileOpsProgress()
+        self.file_ops.failed.connect(
+            lambda title, msg: QMessageBox.critical(self, f"{title} Failed", msg)
+        )
+        self.status_bar.addPermanentWidget(self.file_ops)
+        self.calculation = CalculationProgress()
+        self.calculation.component_ready.connect(
+            lambda name, result: self.page("Outputs").show_component(name, result)
+        )
+        self.calculation.charts_ready.connect(
+            lambda raw, key: self.page("Outputs").show_charts(raw, key)
+        )
+        self.calculation.finished.connect(self._on_calculation_finished)
+        self.calculation.failed.connect(self._on_calculation_failed)
+        self.calculation.cancelled.connect(self._on_calculation_stopped)
+        self.status_bar.addPermanentWidget(self.calculation)
+        self._print_pending = None  # report path to open for printing when done
 
         self._build_dashboard()
         self._build_project_ui()
+        self.open_page = OpenProgress()
+        self.open_page.cancelled.connect(self.cancel_open)
+        self.open_progress.connect(self.open_page.set_progress)
+        self.main_stack.addWidget(self.open_page)
 
         self.show_home()
 
@@ -145,9 +222,10 @@ class ProjectWindow(QMainWindow):
 
     def _build_dashboard(self):
         self.dashboard = DashboardPage(
+            self.manager.dashboard_model,
             on_new_cb=lambda: self.manager.request_new(self),
             on_open_cb=lambda p_id: self.manager.request_open(p_id, self),
-            on_delete_cb=lambda p_id: self.manager.delete_project(p_id),
+            on_delete_cb=lambda p_id: self.manager.delete_project(p_id, self),
             on_return_cb=self._return_to_editor,
         )
         self.main_stack.addWidget(self.dashboard)
@@ -171,7 +249,7 @@ class ProjectWindow(QMainWindow):
 
         # Home shortcut
         home_action = QAction("Home", self)
-        home_action.triggered.connect(self.show_home)
+        home_action.triggered.connect(self._profiled("Home", self.show_home))
         self.menubar.addAction(home_action)
 
         # File menu
@@ -179,20 +257,43 @@ class ProjectWindow(QMainWindow):
         self.menubar.addMenu(menu_file)
 
         self.actionNew = QAction("New", self)
-        self.actionNew.triggered.connect(lambda: self.manager.request_new(self))
+        self.actionNew.triggered.connect(
+            self._profiled("New", lambda: self.manager.request_new(self))
+        )
         self.actionOpen = QAction("Open Project...", self)
-        self.actionOpen.triggered.connect(self.show_home)
+        self.actionOpen.triggered.connect(self._profiled("Open Project", self.show_home))
         self.actionSave = QAction("Save", self)
-        self.actionSave.triggered.connect(self.execute_save)
+        self.actionSave.triggered.connect(self._profiled("Save", self.execute_save))
         self.actionCheckpoint = QAction("Create Checkpoint...", self)
-        self.actionCheckpoint.triggered.connect(self.create_checkpoint)
+        self.actionCheckpoint.triggered.connect(
+            self._profiled("Create Checkpoint", self.create_checkpoint)
+        )
         self.actionVersionHistory = QAction("Version History / Recover...", self)
-        self.actionVersionHistory.triggered.connect(self.recover)
+        self.actionVersionHistory.triggered.connect(
+            self._profiled("Version History", self.recover)
+        )
+        self.actionCompare = QAction("Compare Versions...", self)
+        self.actionCompare.triggered.connect(
+            self._profiled("Compare Versions", self.compare_versions)
+        )
+        self.actionRetention = QAction("Checkpoint Retention...", self)
+        self.actionRetention.triggered.connect(
+            self._profiled("Checkpoint Retention", self.edit_retention)
+        )
         self.actionSaveAs = QAction("Save As...", self)
+        self.actionSaveAs.triggered.connect(self._profiled("Save As", self.save_as))
         self.actionCreateCopy = QAction("Create a Copy", self)
+        self.actionCreateCopy.triggered.connect(
+            self._profiled("Create a Copy", self.create_copy)
+        )
         self.actionPrint = QAction("Print", self)
+        self.actionPrint.triggered.connect(self._profiled("Print", self.print_report))
         self.actionRename = QAction("Rename", self)
+        self.actionRename.triggered.connect(self._profiled("Rename", self.rename_project))
         self.actionExport = QAction("Export", self)
+        self.actionExport.triggered.connect(self._profiled("Export", self.export_report))
+        self.actionArchive = QAction("Archive...", self)
+        self.actionArchive.triggered.connect(self._profiled("Archive", self.archive_project))
         self.actionInfo = QAction("Info", self)
 
         menu_file.addAction(self.actionNew)
@@ -205,11 +306,32 @@ class ProjectWindow(QMainWindow):
         menu_file.addSeparator()
         menu_file.addAction(self.actionRename)
         menu_file.addAction(self.actionExport)
+        menu_file.addAction(self.actionArchive)
         menu_file.addAction(self.actionCheckpoint)
         menu_file.addAction(self.actionVersionHistory)
+        menu_file.addAction(self.actionCompare)
+        menu_file.addAction(self.actionRetention)
         menu_file.addSeparator()
         menu_file.addAction(self.actionInfo)
 
+        # Edit menu (project-level undo/redo)
+        menu_edit = QMenu("&Edit", self.menubar)
+        self.menubar.addMenu(menu_edit)
+        self.actionUndo = QAction("Undo", self)
+        self.actionUndo.setShortcut(QKeySequence.StandardKey.Undo)
+        self.actionUndo.triggered.connect(self._profiled("Undo", self.undo))
+        self.actionRedo = QAction("Redo", self)
+        self.actionRedo.setShortcut(QKeySequence.StandardKey.Redo)
+        self.actionRedo.triggered.connect(self._profiled("Redo", self.redo))
+        self.actionKeepHistory = QAction("Keep Undo History Across Sessions", self)
+        self.actionKeepHistory.setCheckable(True)
+        self.actionKeepHistory.toggled.connect(self._toggle_keep_history)
+        menu_edit.addAction(self.actionUndo)
+        menu_edit.addAction(self.actionRedo)
+        menu_edit.addSeparator()
+        menu_edit.addAction(self.actionKeepHistory)
+        menu_edit.aboutToShow.connect(self._update_edit_menu)
+
         # Help menu
         menu_help = QMenu("&Help", self.menubar)
         self.menubar.addMenu(menu_help)
@@ -221,22 +343,37 @@ class ProjectWindow(QMainWindow):
 
         # Tutorials & Logs in menu bar
         self.menubar.addAction(QAction("&Tutorials", self.menubar))
-        log_action = QAction("&Logs", self.menubar)
-        self.menubar.addAction(log_action)
+        menu_logs = QMenu("&Logs", self.menubar)
+        self.menubar.addMenu(menu_logs)
+        log_action = QAction("Show Logs", self)
+        menu_logs.addAction(log_action)
+        self.actionProfile = QAction("Profile Next Actions", self)
+        self.actionProfile.setCheckable(True)
+        self.actionProfile.setToolTip(
+            "Run the next actions under cProfile and tracemalloc "
+            "(results in the Logs page, Profiles tab)"
+        )
+        self.actionProfile.toggled.connect(self._toggle_profiling)
+        menu_logs.addAction(self.actionProfile)
+        # The profiler is app-wide and disarms itself after N actions
+        menu_logs.aboutToShow.connect(
+            lambda: self.actionProfile.setChecked(profiler.active)
+        )
 
         bar_layout.addWidget(self.menubar)
         bar_layout.addStretch()
 
         self.btn_save = QPushButton("Save")
-        self.btn_save.clicked.connect(self.execute_save)
+        self.btn_save.clicked.connect(self._profiled("Save", self.execute_save))
         bar_layout.addWidget(self.btn_save)
-        bar_layout.addWidget(QPushButton("Calculate"))
+        self.btn_calculate = QPushButton("Calculate")
+        self.btn_calculate.clicked.connect(self._profiled("Calculate", self.calculate))
+        bar_layout.addWidget(self.btn_calculate)
         bar_layout.addWidget(QPushButton("Lock"))
 
         # ── Workspace (sidebar + content) ────────────────────────────
-        self.log_window = Logs()
         log_action.triggered.connect(
-            lambda: self.content_stack.setCurrentWidget(self.log_window)
+            lambda: self.content_stack.setCurrentWidget(self.page("Logs"))
         )
 
         workspace = QSplitter(Qt.Orientation.Horizontal)
@@ -247,10 +384,6 @@ class ProjectWindow(QMainWindow):
         self.sidebar.setHeaderHidden(True)
         self.sidebar.setMaximumWidth(350)
 
-        # Outputs / metadata page
-        self.metadata_page = QLabel()
-        self.metadata_page.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
         sidebar_info = {
             "General Information": {},
             "Bridge Data": {},
@@ -274,21 +407,30 @@ class ProjectWindow(QMainWindow):
                 "Recycling": [],
                 "Demolition": [],
             },
-            "Outputs": {},
+            "Outputs": {
+                "Scenario Comparison": [],
+            },
         }
 
-        self.widget_map = {
-            "General Information": GeneralInfo(),
-            "Bridge Data": BridgeData(),
-            "Construction Work Data": StructureTabView(),
-            "Traffic Data": TrafficData(),
-            "Financial Data": FinancialData(),
-            "Carbon Emission Data": CarbonEmissionTabView(),
-            "Maintenance and Repair": Maintenance(),
-            "Recycling": Recycling(),
-            "Demolition": Demolition(),
-            "Outputs": self.metadata_page,
+        # Pages are built on first visit (see page()); most windows only
+        # ever show a few of them.
+        self.page_factories = {
+            "General Information": GeneralInfo,
+            "Bridge Data": BridgeData,
+            "Construction Work Data": StructureTabView,
+            "Traffic Data": TrafficData,
+            "Financial Data": FinancialData,
+            "Carbon Emission Data": CarbonEmissionTabView,
+            "Maintenance and Repair": Maintenance,
+            "Recycling": Recycling,
+            "Demolition": Demolition,
+            "Outputs": Outputs,
+            "Scenario Comparison": ScenarioComparison,
+            "Logs": Logs,
         }
+        self.widget_map = {}
+        self.bindings = []
+        self._metadata_html = ""
 
         for header, subheaders in sidebar_info.items():
             top_item = QTreeWidgetItem(self.sidebar)
@@ -302,11 +444,8 @@ class ProjectWindow(QMainWindow):
 
         # Content stack
         self.content_stack = QStackedWidget()
-        for w in self.widget_map.values():
-            self.content_stack.addWidget(w)
-        self.content_stack.addWidget(self.log_window)
 
-        self.sidebar.itemPressed.connect(self._on_sidebar_item)
+        self.sidebar.itemPressed.connect(self._on_sidebar_pressed)
 
         workspace.addWidget(self.sidebar)
         workspace.addWidget(self.content_stack)
@@ -327,52 +466,92 @@ class ProjectWindow(QMainWindow):
         """Save pending work then switch to the dashboard."""
         if self.save_timer.isActive() or self.force_save_timer.isActive():
             self.execute_save()
-        projects_path = os.path.join(os.getcwd(), "projects")
-        os.makedirs(projects_path, exist_ok=True)
-        self.dashboard.refresh(
-            projects_path, has_active_project=(self.project_id is not None)
-        )
+        self.dashboard.set_has_active_project(self.project_id is not None)
+        self.manager.dashboard_model.refresh()
         self.setWindowTitle("LCCA - Home")
         self.main_stack.setCurrentWidget(self.dashboard)
 
     def _return_to_editor(self):
-        if self.project_id:
+        if self._pending_open is not None:
+            self.main_stack.setCurrentWidget(self.open_page)
+        elif self.project_id:
             self.setWindowTitle(
                 f"LCCA - {self.model.get_metadata('project_name')} ({self.project_id})"
             )
             self.main_stack.setCurrentWidget(self.project_widget)
 
+    def _on_sidebar_pressed(self, item: QTreeWidgetItem):
+        profiler.run(
+            f"Sidebar {item.text(0)}", self._profile_dir(), self._on_sidebar_item, item
+        )
+
     def _on_sidebar_item(self, item: QTreeWidgetItem):
         header = item.text(0)
         parent = item.parent()
         item.setExpanded(True)
-        if header in self.widget_map:
-            self.content_stack.setCurrentWidget(self.widget_map[header])
+        if header in self.page_factories:
+            self.content_stack.setCurrentWidget(self.page(header))
         elif parent:
             parent_header = parent.text(0)
-            if parent_header == "Construction Work Data":
-                self.content_stack.setCurrentWidget(
-                    self.widget_map["Construction Work Data"]
-                )
-                self.widget_map["Construction Work Data"].select_tab(header)
-            elif parent_header == "Carbon Emission Data":
-                self.content_stack.setCurrentWidget(
-                    self.widget_map["Carbon Emission Data"]
-                )
-                self.widget_map["Carbon Emission Data"].select_tab(header)
+            if parent_header in ("Construction Work Data", "Carbon Emission Data"):
+                tab_view = self.page(parent_header)
+                self.content_stack.setCurrentWidget(tab_view)
+                tab_view.select_tab(header)
+
+    def page(self, name):
+        """Returns the page ``name``, building it on first use."""
+        widget = self.widget_map.get(name)
+        if widget is None:
+            widget = self.page_factories[name]()
+            self.widget_map[name] = widget
+            self.content_stack.addWidget(widget)
+            if name in ("Scenario Comparison", "Construction Work Data"):
+                widget.changed.connect(self.trigger_delayed_save)
+            elif name == "Outputs":
+                widget.calculate_requested.connect(self._profiled("Calculate", self.calculate))
+            elif name == "Logs":
+                widget.set_memory_source(self.manager.memory_report)
+            binding = build_binding(name, widget, self._on_input_changed)
+            if binding is not None:
+                self.bindings.append(binding)
+            if self.model is not None:
+                self._sync_page(name, widget)
+        elif name in self._sync_queue:
+            self._sync_queue.remove(name)
+            self._sync_page(name, widget)
+        return widget
+
+    def _sync_page(self, name, widget):
+        """Points a built page at the current model."""
+        if name == "Outputs":
+            widget.set_store(self._results_store())
+        if name in ("Scenario Comparison", "Outputs", "Construction Work Data", "Carbon Emission Data"):
+            widget.set_model(self.model)
+        if name == "Outputs":
+            widget.metadata.setText(self._metadata_html)
+        elif name == "Logs":
+            widget.set_profile_dir(self._profile_dir())
+        for binding in self.bindings:
+            if binding.form is widget:
+                binding.attach(self.model)
 
     # ------------------------------------------------------------------
     # Project loading
     # ------------------------------------------------------------------
 
+    @tracer.traced("window.load_project")
     def load_project(self, p_id):
         """
-        Full project load sequence:
+        Project open sequence:
           1. Acquire file lock (prevent multi-window conflicts)
-          2. Verify file health; auto-repair from .bak if needed
-          3. Load data into model
-          4. Refresh editor UI
+          2. Read, verify and decode the files on a reader thread,
+             auto-repairing from .bak if needed (_read_project)
+          3. Show the editor, syncing the visible page first (_on_project_read)
+        The window shows the read progress with a Cancel button meanwhile.
         """
+        if self._pending_open is not None:
+            return
+
         # Phase 1: Locking
         if self.persistence is None or self.project_id != p_id:
             self.persistence = PersistenceService(p_id)
@@ -404,64 +583,250 @@ class ProjectWindow(QMainWindow):
 
         self.project_id = p_id
 
-        # Phase 2: File health check + auto-repair from .bak
-        if not self.persistence.is_file_healthy(self.persistence.json_path):
-            if self.persistence.is_file_healthy(self.persistence.bak_path):
-                shutil.copy2(self.persistence.bak_path, self.persistence.json_path)
-                self.status_bar.showMessage(
-                    "Main file was corrupt — auto-restored from backup.", 5000
-                )
-            else:
-                QMessageBox.critical(
-                    self, "Error", "Project files are corrupted and cannot be recovered."
-                )
-                self.show_home()
-                return
-
-        # Phase 3: Load data
+        # Phase 2: Read in the background
+        name = next(
+            (n for i, n, _ in self.manager.dashboard_model.entries if i == p_id), p_id
+        )
+        self.open_page.start(name)
+        self.setWindowTitle(f"LCCA - Opening {name}")
+        self.main_stack.setCurrentWidget(self.open_page)
+        self._open_cancel = threading.Event()
+        self._pending_open = submit_read(
+            self._read_project, self.persistence, self._open_cancel, self.open_progress.emit
+        )
+        self._pending_open.add_done_callback(self.open_done.emit)
+
+    @staticmethod
+    def _read_project(persistence, cancel_event, report):
+        """Reader thread: file checks, parse and model construction."""
+        def progress(done, total):
+            report(int(90 * done / total), f"Reading project file ({done * 100 // total}%)...")
+
+        data, history, restored = persistence.open_project(cancel_event, progress)
+        report(95, "Preparing project...")
+        model = ProjectModel(data)
+        if history:
+            model.history.load_dict(history)
+        return model, restored
+
+    def _on_project_read(self, future):
+        if future is not self._pending_open:
+            return  # cancelled; the window has moved on
+        self._pending_open = None
+        self._open_cancel = None
         try:
-            with open(self.persistence.json_path, "r") as f:
-                self.model = ProjectModel(json.load(f))
+            self.model, restored = future.result()
+        except LoadCancelled:
+            return
         except Exception as e:
+            self._abandon_open()
             QMessageBox.critical(self, "Error", f"Failed to load project: {e}")
-            self.show_home()
             return
 
-        # Phase 4: Refresh UI
+        # Phase 3: Refresh UI
         self._sync_ui()
+        if restored:
+            self.status_bar.showMessage(
+                "Main file was corrupt — auto-restored from backup.", 5000
+            )
+        elif self.model.migrated_from is not None:
+            self.status_bar.showMessage(
+                f"Project upgraded from format v{self.model.migrated_from} "
+                f"to v{SCHEMA_VERSION}; it is saved in the new format on the next change.",
+                5000,
+            )
+        self._schedule_prune()
 
-    def _sync_ui(self):
+    def cancel_open(self):
+        """Abandons the project read in progress and returns to the dashboard."""
+        if self._pending_open is None:
+            return
+        self._open_cancel.set()
+        self._pending_open = None
+        self._open_cancel = None
+        self._abandon_open()
+        self.status_bar.showMessage("Open cancelled.", 4000)
+
+    def wait_for_open(self):
+        """Blocks until the project read finishes, then applies it."""
+        future = self._pending_open
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                pass  # reported by _on_project_read
+            self._on_project_read(future)
+
+    def _abandon_open(self):
+        if self.persistence:
+            self.persistence.release_lock()
+        self.persistence = None
+        self.project_id = None
+        self.model = None
+        self.show_home()
+
+    def _show_project_name(self):
+        """Updates the window title and metadata summary from the model."""
         name = self.model.get_metadata("project_name", self.project_id)
-        self.metadata_page.setText(
+        self._metadata_html = (
             f"<h2>Project Metadata</h2>"
             f"<p><b>Name:</b> {name}</p>"
             f"<p><b>ID:</b> {self.project_id}</p>"
             f"<p><b>Created:</b> {self.model.get_metadata('created_at', 'Unknown')}</p>"
         )
+        if "Outputs" in self.widget_map:
+            self.widget_map["Outputs"].metadata.setText(self._metadata_html)
+        self.setWindowTitle(f"LCCA - {name} ({self.project_id})")
+        return name
+
+    def _sync_ui(self):
+        self._drop_stale_calculation()
+        # The visible page now; other built pages one per event-loop pass
+        self._sync_queue = list(self.widget_map)
+        name = self._show_project_name()
         self.status_bar.showMessage(f"Project: {name}  |  ID: {self.project_id}")
         self.sidebar.setCurrentItem(self.sidebar.topLevelItem(0))
-        self.setWindowTitle(f"LCCA - {name} ({self.project_id})")
+        self.content_stack.setCurrentWidget(self.page("General Information"))
         self.main_stack.setCurrentWidget(self.project_widget)
+        QTimer.singleShot(0, self._sync_next)
+
+    def _sync_next(self):
+        if self._sync_queue and self.model is not None:
+            name = self._sync_queue.pop(0)
+            self._sync_page(name, self.widget_map[name])
+            QTimer.singleShot(0, self._sync_next)
 
     # ------------------------------------------------------------------
     # Save / Persistence
     # ------------------------------------------------------------------
 
+    def _on_input_changed(self, section, path):
+        self.trigger_delayed_save()
+
     def trigger_delayed_save(self):
         """Start debounced save timers - call whenever data changes."""
+        self._drop_stale_calculation()
         if not self.save_timer.isActive():
             self.status_bar.showMessage("Syncing changes...", 1000)
         self.save_timer.start()
         if not self.force_save_timer.isActive():
             self.force_save_timer.start()
 
+    @tracer.traced("window.execute_save")
     def execute_save(self):
         """Immediately flush data to disk."""
         if self.persistence and self.model:
             self.save_timer.stop()
             self.force_save_timer.stop()
-            self.persistence.save(self.model.to_dict())
-            self.status_bar.showMessage("All changes saved.", 2500)
+            # Skip the disk write when no field changed since the last save
+            if not self.model.has_changes("save"):
+                self.status_bar.showMessage("All changes saved.", 2500)
+                return
+            # Serialize here (a consistent snapshot); write on the persistence worker
+            text = json.dumps(self.model.to_dict(), indent=4)
+            history = None
+            if self.model.get_metadata("keep_undo_history", False):
+                history = self.model.history.to_dict()
+            changes = self.model.pop_changes("save")
+            dirty = [(binding, set(binding.dirty)) for binding in self.bindings]
+            for binding in self.bindings:
+                binding.clear_dirty()
+            self._pending_save = submit(self.persistence.save_text, text, history)
+            self._unsaved[self._pending_save] = (self.model, changes, dirty)
+            self._pending_save.add_done_callback(self.save_done.emit)
+            self._pending_save.add_done_callback(self._index_saved())
+
+    def _index_saved(self):
+        """Done callback of a save: indexes the saved fields for the dashboard search."""
+        search = self.manager.dashboard_model.search
+        p_id, fields = self.project_id, index_fields(self.model.to_dict())
+
+        def index(future):
+            # On the persistence worker, right after the write (stamps the new file)
+            if future.exception() is None:
+                search.update(p_id, fields)
+        return index
+
+    def _on_save_done(self, future):
+        if future is self._pending_save:
+            self._pending_save = None
+        model, changes, dirty = self._unsaved.pop(future)
+        try:
+            future.result()
+        except Exception as e:
+            if model is self.model:
+                # Still unsaved: the next save writes them again
+                model.restore_changes("save", changes)
+                for binding, paths in dirty:
+                    binding.restore_dirty(paths)
+            QMessageBox.critical(self, "Save Failed", f"Could not save the project: {e}")
+            return
+        self.status_bar.showMessage("All changes saved.", 2500)
+        if self._names_changed and self._pending_save is None:
+            self._names_changed = False
+            self.manager._broadcast_dashboard()
+
+    def wait_for_save(self):
+        """Blocks until the last background write has reached the disk."""
+        if self._pending_save is not None:
+            try:
+                self._pending_save.result()
+            except Exception:
+                pass  # reported by _on_save_done
+
+    # ------------------------------------------------------------------
+    # Undo / Redo
+    # ------------------------------------------------------------------
+
+    def undo(self):
+        self._step_history(lambda h: h.undo(self.model), "Nothing to undo.")
+
+    def redo(self):
+        self._step_history(lambda h: h.redo(self.model), "Nothing to redo.")
+
+    def _step_history(self, step, empty_message):
+        if not self.model:
+            return
+        patch = step(self.model.history)
+        if patch is None:
+            self.status_bar.showMessage(empty_message, 2000)
+            return
+        for binding in self.bindings:
+            if binding.section == patch.section:
+                binding.refresh([patch.path])
+        if patch.section == "scenarios" and "Scenario Comparison" in self.widget_map:
+            self.widget_map["Scenario Comparison"].set_model(self.model)
+        elif patch.section == "boq":
+            for name in ("Construction Work Data", "Carbon Emission Data"):
+                page = self.widget_map.get(name)
+                if page is not None and page.isVisible():
+                    page.refresh()
+        elif patch.section == "metadata":
+            self._sync_ui()
+        outputs = self.widget_map.get("Outputs")
+        if outputs is not None and outputs.isVisible():
+            outputs.refresh()
+        self.trigger_delayed_save()
+
+    def _update_edit_menu(self):
+        history = self.model.history if self.model else None
+        self.actionUndo.setEnabled(bool(history and history.can_undo()))
+        self.actionRedo.setEnabled(bool(history and history.can_redo()))
+        self.actionKeepHistory.setEnabled(self.model is not None)
+        self.actionKeepHistory.setChecked(
+            bool(self.model and self.model.get_metadata("keep_undo_history", False))
+        )
+
+    def _toggle_keep_history(self, checked):
+        if not self.model or checked == bool(self.model.get_metadata("keep_undo_history", False)):
+            return
+        # A project setting, not an edit: not undoable, but saved right away
+        # (with the history when it is kept) on the saves worker
+        self.model.set_value("metadata", ("keep_undo_history",), checked, record=False)
+        self.model.mark_changed("metadata", ("keep_undo_history",))
+        self.execute_save()
+        if not checked:
+            submit(self.persistence.discard_history)
 
     # ------------------------------------------------------------------
     # Checkpoints & Version History / Recovery
@@ -477,52 +842,72 @@ class ProjectWindow(QMainWindow):
         )
         if ok:
             label = name.strip() or "Manual_Backup"
-            filename = self.persistence.create_checkpoint(self.model.to_dict(), label)
+            with tracer.span("window.create_checkpoint"):
+                filename = self.persistence.create_checkpoint(self.model.to_dict(), label)
             if filename:
                 self.status_bar.showMessage(f"Checkpoint saved: {filename}", 5000)
+                self._schedule_prune()
             else:
                 QMessageBox.warning(self, "Error", "Failed to create checkpoint.")
 
+    def compare_versions(self, left_file=None):
+        """Diff two checkpoints, or a checkpoint against the live project."""
+        if not self.persistence or not self.model:
+            QMessageBox.information(self, "No Project", "Open a project first.")
+            return
+        CompareDialog(self.persistence, self.model, left_file, self).exec()
+
+    def _schedule_prune(self):
+        """Applies the retention policy on the maintenance worker."""
+        policy = self.model.get_metadata("retention", None) if self.model else None
+        future = submit_maintenance(retention.maintain, self.persistence, policy)
+        future.add_done_callback(self.prune_done.emit)
+
+    def _on_prune_done(self, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Checkpoint pruning failed: {e}")
+            return
+        if result["deleted"]:
+            self.status_bar.showMessage(
+                f"Pruned {len(result['deleted'])} old checkpoint(s) "
+                f"(freed {retention.human_size(result['freed'])})", 5000
+            )
+            self.manager._broadcast_dashboard()
+
+    def edit_retention(self):
+        """Edit this project's checkpoint retention policy and prune with it."""
+        if not self.persistence or not self.model:
+            QMessageBox.information(self, "No Project", "Open a project first.")
+            return
+        dlg = RetentionDialog(
+            self.persistence, self.model.get_metadata("retention", None), self
+        )
+        if dlg.exec() == QDialog.Accepted:
+            self.model.update_metadata("retention", dlg.get_policy())
+            self.trigger_delayed_save()
+            self._schedule_prune()
+
     def recover(self):
         """Show version history and let the user restore a checkpoint."""
         if not self.persistence:
             QMessageBox.information(self, "No Project", "Open a project first.")
             return
 
-        cp_dir = self.persistence.checkpoint_dir
-        if not os.path.exists(cp_dir):
+        with tracer.span("window.recover.list"):
+            display_data = self.persistence.list_checkpoints()
+        if not display_data:
             QMessageBox.information(
                 self, "No Checkpoints", "No checkpoints found for this project."
             )
             return
 
-        files = sorted(
-            [f for f in os.listdir(cp_dir) if f.endswith(".json")], reverse=True
+        dlg = RecoveryDialog(
+            [d[0] for d in display_data],
+            self,
+            on_compare=lambda i: self.compare_versions(display_data[i][1]),
         )
-        if not files:
-            QMessageBox.information(
-                self, "No Checkpoints", "No checkpoints found for this project."
-            )
-            return
-
-        # Build human-readable labels
-        display_data = []
-        for f in files:
-            parts = f.replace(".json", "").split("__")
-            if len(parts) == 2:
-                name, ts = parts
-                try:
-                    pretty = (
-                        f"{ts[0:4]}-{ts[4:6]}-{ts[6:8]}  "
-                        f"{ts[8:10]}:{ts[10:12]}:{ts[12:14]}"
-                    )
-                except Exception:
-                    pretty = ts
-                display_data.append((f"{name}  (saved: {pretty})", f))
-            else:
-                display_data.append((f, f))
-
-        dlg = RecoveryDialog([d[0] for d in display_data], self)
         if dlg.exec() != QDialog.Accepted:
             return
 
@@ -560,20 +945,244 @@ class ProjectWindow(QMainWindow):
                 return  # User cancelled naming — abort entire restore
 
         # Perform the restore
+        self.wait_for_save()
         actual_file = display_data[selected_idx][1]
-        full_path = os.path.join(cp_dir, actual_file)
         try:
-            with open(full_path, "r") as f:
-                restored_data = json.load(f)
-            self.model = ProjectModel(restored_data)
-            self.persistence.save(self.model.to_dict())
-            self._sync_ui()
+            with tracer.span("window.recover.restore"):
+                restored_data = self.persistence.load_checkpoint(actual_file)
+                self.model = ProjectModel(restored_data)
+                self.persistence.save(self.model.to_dict())
+                # Stored undo steps belong to the overwritten state
+                self.persistence.discard_history()
+                self._sync_ui()
             self.status_bar.showMessage(
                 f"Restored: {display_data[selected_idx][0]}", 5000
             )
         except Exception as e:
             QMessageBox.critical(self, "Restore Failed", str(e))
 
+    # ------------------------------------------------------------------
+    # Project files (Save As / Create a Copy / Rename / Archive)
+    # ------------------------------------------------------------------
+
+    def _projects_dir(self):
+        return self.manager.dashboard_model.projects_dir
+
+    def _copy_project(self, name, on_done):
+        """
+        Queues a copy of the open project, as it is in memory, under the new
+        name ``name``. Calls ``on_done(new project ID)`` when it is on disk.
+        """
+        self.execute_save()
+        data = dict(self.model.to_dict())
+        data["metadata"] = dict(
+            data.get("metadata", {}),
+            project_name=name,
+            created_at=str(datetime.datetime.now()),
+        )
+        new_id = str(uuid.uuid4())[:8]
+        self.file_ops.run(
+            f"Copying to '{name}'",
+            fileops.copy_project,
+            self._projects_dir(), self.project_id, new_id, json.dumps(data, indent=4),
+            on_done=lambda counts: on_done(new_id),
+        )
+
+    def save_as(self):
+        """Copies the project under a new name and continues editing the copy."""
+        if not self.model:
+            return
+        name, ok = QInputDialog.getText(
+            self, "Save As", "New project name:",
+            text=self.model.get_metadata("project_name", ""),
+        )
+        if not (ok and name.strip()):
+            return
+        source_id = self.project_id
+
+        def switch(new_id):
+            self.manager._broadcast_dashboard()
+            if self not in self.manager.wins or self.project_id != source_id:
+                return  # the window closed or moved on while the copy was queued
+            if self.save_timer.isActive() or self.force_save_timer.isActive():
+                self.execute_save()
+            self.wait_for_save()
+            self.persistence.release_lock()
+            self.persistence = None
+            self.project_id = None
+            self.model = None
+            self.load_project(new_id)
+
+        self._copy_project(name.strip(), switch)
+
+    def create_copy(self):
+        """Copies the project as "<name> (Copy)" and keeps editing the original."""
+        if not self.model:
+            return
+        name = f"{self.model.get_metadata('project_name', self.project_id)} (Copy)"
+
+        def done(new_id):
+            self.manager._broadcast_dashboard()
+            self.status_bar.showMessage(f"Created '{name}' ({new_id}).", 5000)
+
+        self._copy_project(name, done)
+
+    def rename_project(self):
+        if not self.model:
+            return
+        name, ok = QInputDialog.getText(
+            self, "Rename Project", "Project name:",
+            text=self.model.get_metadata("project_name", ""),
+        )
+        if not (ok and name.strip()):
+            return
+        self.model.update_metadata("project_name", name.strip())
+        self._show_project_name()
+        self._names_changed = True
+        self.execute_save()
+
+    def archive_project(self):
+        """Writes the project folder to a zip file chosen by the user."""
+        if not self.model:
+            return
+        name = self.model.get_metadata("project_name", self.project_id)
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Archive Project", os.path.join(os.path.expanduser("~"), f"{name}.zip"),
+            "Zip archive (*.zip)",
+        )
+        if not path:
+            return
+        self.execute_save()
+        self.file_ops.run(
+            "Archiving", fileops.archive_project, self._projects_dir(), self.project_id, path,
+            on_done=lambda p: self.status_bar.showMessage(f"Archived to {p}", 5000),
+        )
+
+    # ------------------------------------------------------------------
+    # Calculation
+    # ------------------------------------------------------------------
+
+    def calculate(self):
+        """Runs the full calculation in the background, streaming results to the Outputs page."""
+        if not self.model:
+            QMessageBox.information(self, "No Project", "Open a project first.")
+            return
+        outputs = self.page("Outputs")
+        outputs.begin_run()  # before showing it: the run, not the store, feeds the page
+        self.content_stack.setCurrentWidget(outputs)
+        self.calculation.start(self.model.snapshot(), self.model.inputs_key())
+
+    def _drop_stale_calculation(self):
+        """Drops a running calculation whose inputs no longer match the model."""
+        if self.calculation.is_busy() and (
+            self.model is None or self.model.inputs_key() != self.calculation.key
+        ):
+            self.calculation.cancel("Inputs changed; calculation dropped.")
+
+    def _on_calculation_finished(self, result, key):
+        self.page("Outputs").end_run()
+        self.status_bar.showMessage("Calculation complete.", 4000)
+        store = self._results_store()
+        if store is not None:
+            evaluated, raw = result
+            future = submit_maintenance(store.save, key, evaluated, raw)
+            future.add_done_callback(self._report_results_error)
+
+    def _results_store(self):
+        return ResultsStore(self.persistence.base_path) if self.persistence else None
+
+    @staticmethod
+    def _report_results_error(future):
+        # Results are derived data: a failed save only costs a recalculation
+        if future.exception() is not None:
+            print(f"Results store error: {future.exception()}")
+
+    def _on_calculation_failed(self, message):
+        self.page("Outputs").end_run(f"Calculation failed: {message}")
+        QMessageBox.critical(self, "Calculation Failed", message)
+
+    def _on_calculation_stopped(self, reason):
+        if "Outputs" in self.widget_map:
+            self.widget_map["Outputs"].end_run(reason)
+        self.status_bar.showMessage(reason, 4000)
+
+    # ------------------------------------------------------------------
+    # Reports (Export / Print)
+    # ------------------------------------------------------------------
+
+    def _reports_dir(self):
+        return os.path.join(self.persistence.base_path, "reports")
+
+    def _start_report(self, kind, path, title):
+        """Hands the report to a worker process; progress shows in the status bar."""
+        if self.report_progress.is_busy():
+            QMessageBox.information(
+                self, "Report Running", "Wait for the current report or cancel it first."
+            )
+            return False
+        return self.report_progress.start(
+            kind, path, self.model.snapshot(),
+            cache_dir=os.path.join(self._reports_dir(), "charts"), title=title,
+        )
+
+    def export_report(self):
+        """Export the full LCCA report as an Excel workbook or a PDF."""
+        if not self.persistence or not self.model:
+            QMessageBox.information(self, "No Project", "Open a project first.")
+            return
+        name = self.model.get_metadata("project_name", self.project_id)
+        os.makedirs(self._reports_dir(), exist_ok=True)
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Export Report", os.path.join(self._reports_dir(), f"{name}.xlsx"),
+            ";;".join(REPORT_FILTERS),
+        )
+        if not path:
+            return
+        # The chosen file type wins over the extension left in the name
+        ext = REPORT_FILTERS.get(selected, ".xlsx")
+        root, path_ext = os.path.splitext(path)
+        if path_ext.lower() != ext:
+            path = (root if path_ext.lower() in REPORT_KINDS else path) + ext
+        self._start_report(REPORT_KINDS[ext], path, "Exporting report")
+
+    def print_report(self):
+        """Render the PDF report and open it in the system viewer for printing."""
+        if not self.persistence or not self.model:
+            QMessageBox.information(self, "No Project", "Open a project first.")
+            return
+        os.makedirs(self._reports_dir(), exist_ok=True)
+        path = os.path.join(self._reports_dir(), "print.pdf")
+        if self._start_report("pdf", path, "Preparing print"):
+            self._print_pending = path
+
+    def _on_report_finished(self, path):
+        if path == self._print_pending:
+            self._print_pending = None
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+        self.status_bar.showMessage(f"Report written: {path}", 5000)
+
+    # ------------------------------------------------------------------
+    # Action profiling
+    # ------------------------------------------------------------------
+
+    def _profile_dir(self):
+        """Folder receiving the profiles of this window's actions."""
+        if self.persistence:
+            return os.path.join(self.persistence.base_path, "profiles")
+        return os.path.join(os.getcwd(), "profiles")
+
+    def _profiled(self, name, fn):
+        return profiler.wrap(name, fn, self._profile_dir)
+
+    def _toggle_profiling(self, checked):
+        if checked and not profiler.active:
+            profiler.arm()
+            self.status_bar.showMessage(
+                f"Profiling the next {profiler.remaining} actions.", 4000
+            )
+        elif not checked:
+            profiler.disarm()
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -582,8 +1191,12 @@ class ProjectWindow(QMainWindow):
         return self.project_id is not None
 
     def closeEvent(self, event):
+        self.cancel_open()
         if self.save_timer.isActive() or self.force_save_timer.isActive():
             self.execute_save()
+        self.wait_for_save()
+        self.report_progress.cancel()
+        self.calculation.cancel()
         if self.persistence:
             self.persistence.release_lock()
         self.manager.unregister(self)
@@ -595,19 +1208,51 @@ class ProjectWindow(QMainWindow):
 # ---------------------------------------------------------------------------
 
 class Manager:
+    """
+    Multi-window coordinator. Owns the services shared by all windows: the
+    dashboard model (one disk scan per change) and, through core.persistence,
+    the disk workers. Reference tables are module-level (core.reference_data)
+    and combo option lists are shared Qt models (gui.shared).
+    """
+
     def __init__(self):
         self.wins = []
+        self.dashboard_model = DashboardModel(os.path.join(os.getcwd(), "projects"))
+
+        # GUI heartbeat for the stall watchdog
+        self.heartbeat = QTimer()
+        self.heartbeat.setInterval(int(watchdog.interval * 1000))
+        self.heartbeat.timeout.connect(watchdog.beat)
+        if watchdog.threshold > 0:
+            self.heartbeat.start()
+            watchdog.start()
+
+        # Empty the trash left by the previous session and refresh the
+        # dashboard's disk-usage figures in the background
+        submit_maintenance(fileops.purge_trash, self.dashboard_model.projects_dir)
+        submit_maintenance(retention.tree_usage, self.dashboard_model.projects_dir)
 
     def spawn(self):
+        before = rss_bytes()
         w = ProjectWindow(self)
         self.wins.append(w)
         w.show()
+        after = rss_bytes()
+        # Memory the window added to the process (reported in Logs > Memory)
+        w.spawn_cost = after - before if before is not None and after is not None else None
         return w
 
+    def memory_report(self):
+        """(process RSS, [(window title, Qt objects, pages built, spawn cost)])."""
+        rows = [
+            (w.windowTitle(), len(w.findChildren(QObject)), len(w.widget_map), w.spawn_cost)
+            for w in self.wins
+        ]
+        return rss_bytes(), rows
+
     def _broadcast_dashboard(self):
-        path = os.path.join(os.getcwd(), "projects")
-        for w in self.wins:
-            w.dashboard.refresh(path, has_active_project=(w.project_id is not None))
+        # One scan; every window's dashboard rebuilds from the shared model
+        self.dashboard_model.refresh()
 
     def request_new(self, caller):
         name, ok = QInputDialog.getText(caller, "New Project", "Project Name:")
@@ -616,12 +1261,7 @@ class Manager:
         p_id = str(uuid.uuid4())[:8]
         p_dir = os.path.join(os.getcwd(), "projects", p_id)
         os.makedirs(p_dir, exist_ok=True)
-        data = {
-            "metadata": {
-                "project_name": name.strip(),
-                "created_at": str(datetime.datetime.now()),
-            }
-        }
+        data = new_project(name.strip())
         with open(os.path.join(p_dir, "project.json"), "w") as f:
             json.dump(data, f, indent=4)
         self._broadcast_dashboard()
@@ -639,7 +1279,7 @@ class Manager:
         target = caller if caller.project_id is None else self.spawn()
         target.load_project(p_id)
 
-    def delete_project(self, p_id):
+    def delete_project(self, p_id, caller):
         reply = QMessageBox.question(
             None,
             "Delete Project",
@@ -647,23 +1287,30 @@ class Manager:
             QMessageBox.Yes | QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
-            shutil.rmtree(
-                os.path.join(os.getcwd(), "projects", p_id), ignore_errors=True
-            )
-            self._broadcast_dashboard()
             for w in self.wins:
                 if w.project_id == p_id:
+                    w.cancel_open()
+                    w.wait_for_save()
                     w.project_id = None
                     w.model = None
                     if w.persistence:
                         w.persistence.release_lock()
                     w.persistence = None
                     w.show_home()
+            # Move to the trash (a rename), then purge it, on the maintenance worker
+            projects_dir = self.dashboard_model.projects_dir
+            caller.file_ops.run(
+                "Deleting project", fileops.trash_project, projects_dir, p_id,
+                on_done=lambda _: self._broadcast_dashboard(),
+            )
+            caller.file_ops.run("Emptying trash", fileops.purge_trash, projects_dir)
 
     def unregister(self, w):
         if w in self.wins:
             self.wins.remove(w)
         if not self.wins:
+            self.heartbeat.stop()
+            watchdog.stop()
             QApplication.quit()
 
 
@@ -0,0 +1,30 @@
+"""
+Qt objects shared by every ProjectWindow in the process.
+
+Option lists (countries, bridge types, traffic categories, ...) are held in
+one read-only QStringListModel each instead of a private item model per combo
+box per window.
+"""
+
+from PySide6.QtCore import QStringListModel
+from PySide6.QtWidgets import QComboBox
+
+_option_models = {}
+
+
+def option_model(items):
+    """The shared model for the option list ``items``."""
+    key = tuple(items)
+    model = _option_models.get(key)
+    if model is None:
+        model = _option_models[key] = QStringListModel(list(key))
+    return model
+
+
+def set_shared_options(combo, items):
+    """
+    Fills ``combo`` from the shared model of ``items``. Editable combos never
+    insert typed text, since the model is shared with other windows.
+    """
+    combo.setModel(option_model(items))
+    combo.setInsertPolicy(QComboBox.NoInsert)
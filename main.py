@@ -4,15 +4,26 @@ Run: python main.py
 """
 import sys
 import os
+import argparse
 
 # Ensure the project root is on the path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from gui.main import Manager
 from PySide6.QtWidgets import QApplication
+from core.profiling import profiler, DEFAULT_ACTION_COUNT
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="LCCA application")
+    parser.add_argument(
+        "--profile", nargs="?", type=int, const=DEFAULT_ACTION_COUNT, metavar="N",
+        help=f"profile the next N UI actions (default {DEFAULT_ACTION_COUNT})",
+    )
+    args, qt_args = parser.parse_known_args()
+    if args.profile:
+        profiler.arm(args.profile)
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyle("Fusion")
     m = Manager()
     m.spawn()
@@ -0,0 +1,156 @@
+"""Bulk migration of a projects folder (core.migrate)."""
+
+import json
+import os
+
+import pytest
+
+from core import migrate
+from core.schema import SCHEMA_VERSION, new_project
+
+OLD = {"metadata": {"project_name": "Old", "created_at": "2023"}, "boq": [{"quantity": 1}]}
+
+
+def _write_project(projects_dir, p_id, data, locked=False):
+    project_dir = projects_dir / p_id
+    project_dir.mkdir()
+    (project_dir / "project.json").write_text(json.dumps(data, indent=4))
+    if locked:
+        (project_dir / "project.lock").write_text("")
+    return project_dir
+
+
+def _read(project_dir, name="project.json"):
+    return json.loads((project_dir / name).read_text())
+
+
+@pytest.fixture
+def projects(tmp_path):
+    """A projects folder with one project of each kind, keyed by status."""
+    dirs = {
+        "migrated": _write_project(tmp_path, "old", OLD),
+        "current": _write_project(tmp_path, "new", new_project("New")),
+        "locked": _write_project(tmp_path, "open", OLD, locked=True),
+        "invalid": _write_project(tmp_path, "bad", {"metadata": {}, "boq": [3]}),
+    }
+    (tmp_path / ".trash" / "gone").mkdir(parents=True)
+    return tmp_path, dirs
+
+
+def _files(directory):
+    return sorted(os.listdir(directory))
+
+
+# ---------------------------------------------------------------------------
+# One project
+# ---------------------------------------------------------------------------
+
+def test_migrate_writes_upgraded_file_and_backup(projects):
+    _, dirs = projects
+    project_dir = dirs["migrated"]
+    status, detail = migrate.migrate_project(str(project_dir))
+    assert (status, detail) == ("migrated", f"v0 -> v{SCHEMA_VERSION}")
+    data = _read(project_dir)
+    assert data["metadata"]["schema_version"] == SCHEMA_VERSION
+    assert data["boq"] == OLD["boq"]
+    assert _read(project_dir, "project.json.bak") == OLD
+    assert _files(project_dir) == ["project.json", "project.json.bak"]  # no temporary file left
+
+
+def test_dry_run_writes_nothing(projects):
+    _, dirs = projects
+    project_dir = dirs["migrated"]
+    before = (project_dir / "project.json").read_bytes()
+    assert migrate.migrate_project(str(project_dir), dry_run=True)[0] == "migrated"
+    assert (project_dir / "project.json").read_bytes() == before
+    assert _files(project_dir) == ["project.json"]
+
+
+def test_locked_project_is_skipped(projects):
+    _, dirs = projects
+    project_dir = dirs["locked"]
+    assert migrate.migrate_project(str(project_dir))[0] == "locked"
+    assert _read(project_dir) == OLD
+    assert not (project_dir / "project.json.bak").exists()
+
+
+def test_current_project_is_not_rewritten(projects):
+    _, dirs = projects
+    project_dir = dirs["current"]
+    before = (project_dir / "project.json").read_bytes()
+    assert migrate.migrate_project(str(project_dir)) == ("current", "")
+    assert (project_dir / "project.json").read_bytes() == before
+    assert not (project_dir / "project.json.bak").exists()
+
+
+def test_invalid_and_unreadable_projects_are_reported(projects, tmp_path):
+    _, dirs = projects
+    status, detail = migrate.migrate_project(str(dirs["invalid"]))
+    assert status == "invalid" and "boq[0]" in detail
+    broken = _write_project(tmp_path, "broken", {})
+    (broken / "project.json").write_text("{not json")
+    assert migrate.migrate_project(str(broken))[0] == "error"
+    assert (broken / "project.json").read_text() == "{not json"
+
+
+def test_failed_write_keeps_the_original(projects, monkeypatch):
+    _, dirs = projects
+    project_dir = dirs["migrated"]
+    before = (project_dir / "project.json").read_bytes()
+
+    def fail(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(migrate.os, "replace", fail)
+    assert migrate.migrate_project(str(project_dir)) == ("error", "disk full")
+    assert (project_dir / "project.json").read_bytes() == before
+    assert not (project_dir / "project.json.tmp").exists()
+
+
+# ---------------------------------------------------------------------------
+# Whole folder
+# ---------------------------------------------------------------------------
+
+def test_tree_dry_run_then_write(projects):
+    projects_dir, dirs = projects
+    expected = {dirs[status].name: status for status in dirs}
+
+    outcomes = migrate.migrate_tree(str(projects_dir), dry_run=True, workers=1)
+    assert {p_id: status for p_id, (status, _) in outcomes.items()} == expected
+    assert _read(dirs["migrated"]) == OLD
+
+    outcomes = migrate.migrate_tree(str(projects_dir), workers=1)
+    assert {p_id: status for p_id, (status, _) in outcomes.items()} == expected
+    assert _read(dirs["migrated"])["metadata"]["schema_version"] == SCHEMA_VERSION
+
+    outcomes = migrate.migrate_tree(str(projects_dir), workers=1)
+    assert outcomes["old"] == ("current", "")
+
+
+def test_tree_in_worker_processes(projects):
+    projects_dir, dirs = projects
+    outcomes = migrate.migrate_tree(str(projects_dir), workers=2)
+    assert {p_id: status for p_id, (status, _) in outcomes.items()} == {
+        dirs[status].name: status for status in dirs
+    }
+    assert _read(dirs["migrated"])["metadata"]["schema_version"] == SCHEMA_VERSION
+
+
+def test_report_lists_what_is_not_current(projects):
+    projects_dir, _ = projects
+    outcomes = migrate.migrate_tree(str(projects_dir), dry_run=True, workers=1)
+    lines = migrate.report(outcomes, dry_run=True)
+    assert f"old: would migrate (v0 -> v{SCHEMA_VERSION})" in lines
+    assert "open: locked (open in a window)" in lines
+    assert not any(line.startswith("new:") for line in lines)
+    assert lines[-1] == (
+        f"4 project(s) at schema v{SCHEMA_VERSION} (dry run): "
+        "1 migrated, 1 current, 1 locked, 1 invalid"
+    )
+
+
+def test_main_exit_status(projects, capsys):
+    projects_dir, dirs = projects
+    assert migrate.main([str(projects_dir), "--dry-run", "--workers", "1"]) == 1
+    assert "1 invalid" in capsys.readouterr().out
+    (dirs["invalid"] / "project.json").write_text(json.dumps(new_project("Fixed")))
+    assert migrate.main([str(projects_dir), "--workers", "1"]) == 0
@@ -0,0 +1,94 @@
+"""Schema versions, migrations and validation (core.schema)."""
+
+import pytest
+
+from core.model import ProjectModel
+from core.schema import SCHEMA_VERSION, SchemaError, new_project, schema_version, upgrade, validate
+
+
+# ---------------------------------------------------------------------------
+# Migration
+# ---------------------------------------------------------------------------
+
+def test_unversioned_project_is_upgraded_to_current():
+    data = {"metadata": {"project_name": "Old Bridge"}, "bridge_data": {"bridge_type": "Arch"}}
+    upgraded, version = upgrade(data)
+    assert version == 0
+    assert upgraded is data  # migrated in place
+    assert schema_version(upgraded) == SCHEMA_VERSION
+    assert upgraded["metadata"]["project_name"] == "Old Bridge"
+    assert upgraded["metadata"]["author"] == "User"
+    assert upgraded["metadata"]["created_at"] == ""
+    assert upgraded["bridge_data"] == {"bridge_type": "Arch"}
+
+
+def test_project_without_metadata_gets_defaults():
+    upgraded, version = upgrade({"general_info": {"client": "NHAI"}})
+    assert version == 0
+    assert upgraded["metadata"]["project_name"] == "Untitled Project"
+    assert schema_version(upgraded) == SCHEMA_VERSION
+
+
+def test_current_project_is_unchanged():
+    data = new_project("Current")
+    before = {key: dict(value) for key, value in data.items()}
+    upgraded, version = upgrade(data)
+    assert version == SCHEMA_VERSION
+    assert upgraded == before
+
+
+def test_model_records_the_version_it_migrated_from():
+    assert ProjectModel({"metadata": {"project_name": "a"}}).migrated_from == 0
+    assert ProjectModel(new_project("b")).migrated_from is None
+    assert ProjectModel().get_metadata("schema_version") == SCHEMA_VERSION
+
+
+def test_future_version_is_rejected():
+    data = {"metadata": {"project_name": "From the future", "schema_version": SCHEMA_VERSION + 1}}
+    with pytest.raises(SchemaError, match="newer version"):
+        upgrade(data)
+    assert data["metadata"]["schema_version"] == SCHEMA_VERSION + 1  # left untouched
+
+
+@pytest.mark.parametrize("version", [-1, "1", 1.0, True, None])
+def test_invalid_version_is_rejected(version):
+    with pytest.raises(SchemaError, match="Invalid schema version"):
+        upgrade({"metadata": {"schema_version": version}})
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("data, where", [
+    ([], "JSON object"),
+    ({"metadata": 1}, "no metadata"),
+    ({"metadata": {"project_name": 5}}, "project.metadata.project_name: expected str"),
+    ({"metadata": {"keep_undo_history": "yes"}}, "keep_undo_history: expected bool"),
+    ({"metadata": {}, "general_info": []}, "project.general_info: expected dict"),
+    ({"metadata": {}, "boq": {}}, "project.boq: expected list"),
+    ({"metadata": {}, "boq": [{}, 3]}, r"project.boq\[1\]: expected dict"),
+    ({"metadata": {}, "scenarios": [{"name": 3}]}, r"project.scenarios\[0\].name: expected str"),
+    ({"metadata": {}, "traffic_data": {"growth_segments": [[1], 2]}}, r"growth_segments\[1\]"),
+])
+def test_invalid_project_is_rejected(data, where):
+    with pytest.raises(SchemaError, match=where):
+        upgrade(data)
+
+
+def test_schema_error_is_a_value_error():
+    with pytest.raises(ValueError):
+        validate({"metadata": {}, "boq": None})
+
+
+def test_unknown_sections_and_field_values_pass():
+    validate({
+        "metadata": {"project_name": "p", "custom": object()},
+        "financial_data": {"discount_rate": None, "analysis_period": "50"},
+        "plugin_section": [1, 2, 3],
+    })
+
+
+def test_model_raises_on_invalid_file():
+    with pytest.raises(SchemaError):
+        ProjectModel({"metadata": {}, "scenarios": "none"})